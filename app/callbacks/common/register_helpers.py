@@ -32,25 +32,25 @@ def build_grid(
     cfg=None,
     *,
     empty_message="No items loaded.",
-    get_item_image_src,
+    get_item_image_srcs,
     create_spectrogram_card,
 ):
     if not items:
         return [html.Div(empty_message, className="text-muted text-center p-4")]
 
+    page_items = items[:items_per_page]
+    image_srcs = get_item_image_srcs(
+        page_items,
+        colormap=colormap,
+        y_axis_scale=y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+        color_min=color_min,
+        color_max=color_max,
+        cfg=cfg,
+    )
     grid = []
-    limit = min(items_per_page, len(items))
-    for item in items[:limit]:
-        image_src = get_item_image_src(
-            item,
-            colormap=colormap,
-            y_axis_scale=y_axis_scale,
-            y_axis_min_hz=y_axis_min_hz,
-            y_axis_max_hz=y_axis_max_hz,
-            color_min=color_min,
-            color_max=color_max,
-            cfg=cfg,
-        )
+    for item, image_src in zip(page_items, image_srcs):
         card = create_spectrogram_card(item, image_src=image_src, mode=mode)
         grid.append(dbc.Col(card, md=3, sm=6, xs=12, className="mb-3"))
 
@@ -1,6 +1,6 @@
 """Grouped callback-registration wiring for the app."""
 
-from app.defaults import DEFAULT_CACHE_MAX_SIZE
+from app.defaults import DEFAULT_CACHE_MAX_SIZE, DEFAULT_THUMBNAIL_CACHE_MAX_MB
 from app.callbacks.data.config_callbacks import register_data_config_callbacks
 from app.callbacks.data.discovery_callbacks import register_tab_state_callbacks
 from app.callbacks.data.filter_state_callbacks import register_filter_state_callbacks
@@ -31,7 +31,12 @@ from app.callbacks.verify.threshold_callbacks import register_verify_threshold_c
 
 def register_all_callback_sections(app, *, config, deps):
     d = deps
-    d["set_cache_sizes"]((config or {}).get("cache", {}).get("max_size", DEFAULT_CACHE_MAX_SIZE))
+    cache_cfg = (config or {}).get("cache", {})
+    d["set_cache_sizes"](cache_cfg.get("max_size", DEFAULT_CACHE_MAX_SIZE))
+    d["set_thumbnail_disk_cache"](
+        cache_cfg.get("thumbnail_dir"),
+        cache_cfg.get("thumbnail_max_mb", DEFAULT_THUMBNAIL_CACHE_MAX_MB),
+    )
     register_mode_tab_callbacks(app)
     register_pagination_callbacks(app)
     register_folder_browser_callbacks(app)
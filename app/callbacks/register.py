@@ -91,8 +91,9 @@ from app.utils.image_processing import (
     schedule_modal_prefetch_for_future_pages,
     schedule_prefetch_for_future_pages,
     set_cache_sizes,
+    set_thumbnail_disk_cache,
 )
-from app.utils.image_utils import get_item_image_src
+from app.utils.image_utils import get_item_image_srcs
 from app.utils.persistence import save_label_mode
 
 logger = logging.getLogger(__name__)
@@ -142,12 +143,13 @@ def register_callbacks(app, config):
             items_per_page,
             cfg,
             empty_message=empty_message,
-            get_item_image_src=get_item_image_src,
+            get_item_image_srcs=get_item_image_srcs,
             create_spectrogram_card=create_spectrogram_card,
         )
 
     deps = {
         "set_cache_sizes": set_cache_sizes,
+        "set_thumbnail_disk_cache": set_thumbnail_disk_cache,
         "estimate_page_audio_generation_work": estimate_page_audio_generation_work,
         "schedule_specgen_prefetch_for_current_page_images": prefetch_page_images_in_background,
         "schedule_specgen_prefetch_for_future_pages": schedule_prefetch_for_future_pages,
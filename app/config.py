@@ -13,6 +13,7 @@ from app.defaults import (
     DEFAULT_AUDIO_STALE_WHILE_REVALIDATE,
     DEFAULT_CACHE_MAX_SIZE,
     DEFAULT_ITEMS_PER_PAGE,
+    DEFAULT_THUMBNAIL_CACHE_MAX_MB,
 )
 from app.services.bbox_tags import load_bbox_tag_options
 from app.utils.audio_transport import DEFAULT_AUDIO_CACHE_DIR
@@ -199,6 +200,11 @@ def get_config() -> Dict[str, Any]:
 
     cache_cfg = config.get("cache", {})
     cache_max_size = cache_cfg.get("max_size", DEFAULT_CACHE_MAX_SIZE)
+    thumbnail_cache_dir = cache_cfg.get("thumbnail_dir")
+    thumbnail_cache_max_mb = _coerce_non_negative_int(
+        cache_cfg.get("thumbnail_max_mb", DEFAULT_THUMBNAIL_CACHE_MAX_MB),
+        DEFAULT_THUMBNAIL_CACHE_MAX_MB,
+    )
     audio_cfg = config.get("audio", {}) if isinstance(config.get("audio"), dict) else {}
     audio_transport = normalize_audio_transport(
         args.audio_transport or audio_cfg.get("transport", DEFAULT_AUDIO_TRANSPORT)
@@ -287,6 +293,8 @@ def get_config() -> Dict[str, Any]:
         },
         "cache": {
             "max_size": cache_max_size,
+            "thumbnail_dir": resolve_path(thumbnail_cache_dir, repo_root) if thumbnail_cache_dir else None,
+            "thumbnail_max_mb": thumbnail_cache_max_mb,
         },
         "audio": {
             "transport": audio_transport,
@@ -3,6 +3,7 @@
 DEFAULT_ITEMS_PER_PAGE = 25
 DEFAULT_CACHE_PAGES = 3
 DEFAULT_CACHE_MAX_SIZE = DEFAULT_ITEMS_PER_PAGE * DEFAULT_CACHE_PAGES
+DEFAULT_THUMBNAIL_CACHE_MAX_MB = 256
 DEFAULT_AUDIO_TRANSPORT = "direct"
 DEFAULT_AUDIO_MP3_BITRATE = "128k"
 DEFAULT_AUDIO_CACHE_MAX_AGE = 300
@@ -1,6 +1,5 @@
 import os
 from typing import Dict
-import base64
 
 import dash
 import dash_bootstrap_components as dbc
@@ -23,7 +22,7 @@ from app.utils.audio_transport import (
     normalize_audio_transport,
     resolve_audio_delivery_path,
 )
-from app.utils.image_processing import generate_item_image_cached
+from app.utils.image_processing import generate_item_image_png_cached
 from app.utils.image_utils import decode_item_image_request
 
 
@@ -251,7 +250,7 @@ def create_app(config: Dict) -> dash.Dash:
         color_min = payload.get("color_min")
         color_max = payload.get("color_max")
 
-        image_src = generate_item_image_cached(
+        image_bytes = generate_item_image_png_cached(
             item,
             cfg,
             colormap=colormap,
@@ -261,19 +260,12 @@ def create_app(config: Dict) -> dash.Dash:
             color_min=color_min,
             color_max=color_max,
         )
-        if not image_src or not image_src.startswith("data:") or ";base64," not in image_src:
+        if not image_bytes:
             abort(404)
 
-        header, encoded = image_src.split(",", 1)
-        mime_type = header[5:].split(";", 1)[0] or "image/png"
-        try:
-            image_bytes = base64.b64decode(encoded)
-        except Exception:
-            abort(500)
-
         return Response(
             image_bytes,
-            mimetype=mime_type,
+            mimetype="image/png",
             headers={
                 "Cache-Control": "private, max-age=300, stale-while-revalidate=60",
             },
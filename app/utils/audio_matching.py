@@ -1,9 +1,16 @@
 import os
 import glob
 import re
+import stat
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+AUDIO_MATCH_EXTENSIONS = ('.flac', '.wav', '.mp3')
+# Pattern for ONC timestamp format: YYYYMMDDTHHMMSS.sssZ
+TIMESTAMP_PATTERN = re.compile(r'(\d{8}T\d{6}(?:\.\d{3})?Z)')
+
 def parse_timestamp_from_filename(filename: str) -> Optional[datetime]:
     """
     Parse timestamp from ONC filename format.
@@ -12,10 +19,7 @@ def parse_timestamp_from_filename(filename: str) -> Optional[datetime]:
     - ICLISTENHF6406_20240523T061507.000Z.flac -> 2024-05-23 06:15:07
     - ICLISTENHF6406_20240523T061507.000Z_20240523T062007.000Z-spect_plotRes.mat -> 2024-05-23 06:15:07
     """
-    # Pattern for ONC timestamp format: YYYYMMDDTHHMMSS.sssZ
-    timestamp_pattern = r'(\d{8}T\d{6}(?:\.\d{3})?Z)'
-    
-    matches = re.findall(timestamp_pattern, filename)
+    matches = TIMESTAMP_PATTERN.findall(filename)
     if not matches:
         return None
     
@@ -39,8 +43,7 @@ def parse_spectrogram_time_range(filename: str) -> Optional[Tuple[datetime, date
     ICLISTENHF6406_20240523T061507.000Z_20240523T062007.000Z-spect_plotRes.mat
     -> (2024-05-23 06:15:07, 2024-05-23 06:20:07)
     """
-    timestamp_pattern = r'(\d{8}T\d{6}(?:\.\d{3})?Z)'
-    matches = re.findall(timestamp_pattern, filename)
+    matches = TIMESTAMP_PATTERN.findall(filename)
     
     if len(matches) < 2:
         return None
@@ -68,22 +71,21 @@ def find_matching_audio_files(spectrogram_filename: str, audio_folder: str, tole
     Returns:
         List of matching audio file paths
     """
-    if not audio_folder or not os.path.exists(audio_folder):
+    if not audio_folder:
         return []
-    
-    # Get all audio files (both .flac and .wav)
-    audio_files = []
-    audio_files.extend(glob.glob(os.path.join(audio_folder, '*.flac')))
-    audio_files.extend(glob.glob(os.path.join(audio_folder, '*.wav')))
-    audio_files.extend(glob.glob(os.path.join(audio_folder, '*.mp3')))
+    try:
+        folder_stat = os.stat(audio_folder)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(folder_stat.st_mode):
+        return []
+    by_stem, timestamps, timed_files = _audio_folder_index(audio_folder, folder_stat.st_mtime_ns)
     
     # First, try exact filename match (same base name, different extension).
     # This covers paired MAT/WAV files that share the same item identifier.
     spec_base = os.path.splitext(spectrogram_filename)[0]
-    for audio_file in audio_files:
-        audio_base = os.path.splitext(os.path.basename(audio_file))[0]
-        if audio_base == spec_base:
-            return [audio_file]
+    if spec_base in by_stem:
+        return [by_stem[spec_base]]
     
     # Fallback to timestamp-based matching
     # Parse spectrogram time range
@@ -97,22 +99,45 @@ def find_matching_audio_files(spectrogram_filename: str, audio_folder: str, tole
             return []
         start_time = end_time = single_ts
     
-    matching_files = []
+    # Audio files are pre-sorted by timestamp, so the files within the
+    # spectrogram time range (with tolerance) are one contiguous slice.
+    tolerance_delta = timedelta(seconds=tolerance_seconds)
+    lo = bisect_left(timestamps, start_time - tolerance_delta)
+    hi = bisect_right(timestamps, end_time + tolerance_delta)
+    return list(timed_files[lo:hi])
+
+@lru_cache(maxsize=32)
+def _audio_folder_index(audio_folder: str, folder_mtime_ns: int) -> Tuple[Dict[str, str], Tuple[datetime, ...], Tuple[str, ...]]:
+    """
+    Scan an audio folder once for find_matching_audio_files.
     
-    # Find audio files within the time range
-    for audio_file in audio_files:
-        audio_basename = os.path.basename(audio_file)
-        audio_timestamp = parse_timestamp_from_filename(audio_basename)
-        
-        if audio_timestamp:
-            # Check if audio timestamp falls within spectrogram time range (with tolerance)
-            tolerance_delta = timedelta(seconds=tolerance_seconds)
-            if (start_time - tolerance_delta <= audio_timestamp <= end_time + tolerance_delta):
-                matching_files.append(audio_file)
-    
-    # Sort by timestamp
-    matching_files.sort(key=lambda f: parse_timestamp_from_filename(os.path.basename(f)))
-    return matching_files
+    Keyed by the folder mtime, which changes whenever files are added, removed
+    or renamed. Returns a stem -> path map (first match in extension order
+    wins) plus the timestamped files sorted by timestamp alongside their
+    timestamps for range lookups.
+    """
+    by_ext = {ext: [] for ext in AUDIO_MATCH_EXTENSIONS}
+    with os.scandir(audio_folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            ext = os.path.splitext(name)[1]
+            if ext in by_ext:
+                by_ext[ext].append((name, entry.path))
+    
+    by_stem: Dict[str, str] = {}
+    timed = []
+    for ext in AUDIO_MATCH_EXTENSIONS:
+        for name, path in by_ext[ext]:
+            by_stem.setdefault(os.path.splitext(name)[0], path)
+            timestamp = parse_timestamp_from_filename(name)
+            if timestamp:
+                timed.append((timestamp, path))
+    
+    # Stable sort keeps directory order for files sharing a timestamp.
+    timed.sort(key=lambda pair: pair[0])
+    return by_stem, tuple(ts for ts, _ in timed), tuple(path for _, path in timed)
 
 def create_audio_spectrogram_mapping(spectrogram_folder: str, audio_folder: str) -> Dict[str, List[str]]:
     """
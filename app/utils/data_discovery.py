@@ -2,12 +2,13 @@
 Data structure discovery utilities.
 Automatically detects folder structure and discovers spectrograms, audio, and predictions.
 """
-import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import re
 
+from app.utils.file_io import loads_json
+
 
 # Supported file extensions
 SPECTROGRAM_EXTENSIONS = {'.mat', '.npy', '.png', '.jpg', '.jpeg'}
@@ -157,8 +158,8 @@ def _infer_prediction_scopes(predictions_file: Optional[str]) -> Tuple[List[str]
         return [], []
 
     try:
-        with open(predictions_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(predictions_file, "rb") as f:
+            data = loads_json(f.read())
     except Exception:
         return [], []
 
@@ -1,28 +1,66 @@
 import glob
+import logging
 import os
+import pickle
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cachetools import LRUCache
 
 from app.utils.audio_matching import find_matching_audio_files, get_representative_audio_file
 from app.utils.file_io import read_json
 from app.utils.format_converters import (
-    convert_hydrophonedashboard_to_unified,
+    convert_hydrophonedashboard_file_to_unified,
     convert_legacy_labeling_to_unified,
     convert_whale_predictions_to_unified,
 )
+from app.utils.label_operations import _normalize_item_key, get_default_labels_path
 from app.services.annotations import clean_box_annotation
 from app.utils.unified_format_converter import is_unified_v2_format, convert_unified_v2_to_internal
 
+logger = logging.getLogger(__name__)
 
 AUDIO_EXTENSIONS = (".flac", ".wav", ".mp3", ".ogg")
+SPEC_MAT_EXTENSIONS = (".mat", ".npy")
+SPEC_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Converted predictions payloads keyed by (path, mtime_ns, size). Entries are
+# pickled so every hit hands back fresh dicts that callers are free to mutate.
+whale_mode_cache = LRUCache(maxsize=16)
+_WHALE_MODE_CACHE_LOCK = threading.Lock()
+_DEVICE_LOAD_MAX_WORKERS = 8
+
+
+def _load_once(cache: Dict[Any, Future], lock: threading.Lock, key: Any, load: Callable[[], Any]) -> Any:
+    """Return the value for ``key``, running ``load`` once even when threads race on it.
+
+    The lock only guards ``cache``; ``load`` runs outside it, so different keys
+    load in parallel while callers of the same key wait for the first result.
+    A failed load is dropped from the cache so the next caller retries.
+    """
+    with lock:
+        future = cache.get(key)
+        owner = future is None
+        if owner:
+            future = cache[key] = Future()
+    if owner:
+        try:
+            future.set_result(load())
+        except BaseException as exc:
+            with lock:
+                cache.pop(key, None)
+            future.set_exception(exc)
+            raise
+    return future.result()
 
 
 def _find_latest_date(dashboard_root: str) -> Optional[str]:
     if not dashboard_root or not os.path.exists(dashboard_root):
         return None
-    candidates = [d for d in os.listdir(dashboard_root) if len(d) == 10]
-    return sorted(candidates, reverse=True)[0] if candidates else None
+    return max((d for d in os.listdir(dashboard_root) if len(d) == 10), default=None)
 
 
 def _build_predictions_override_index(predictions_overrides: Optional[list]) -> Tuple[dict, dict, dict]:
@@ -66,12 +104,50 @@ def _get_predictions_override_path(
 
 
 def _has_spectrograms(folder: Optional[str]) -> bool:
-    if not folder or not os.path.exists(folder):
+    if not folder or not os.path.isdir(folder):
         return False
-    for pattern in ("*.mat", "*.npy", "*.png", "*.jpg", "*.jpeg"):
-        if glob.glob(os.path.join(folder, pattern)):
-            return True
-    return False
+    # Stops at the first spectrogram instead of globbing each extension in full.
+    with os.scandir(folder) as entries:
+        return any(
+            not entry.name.startswith(".")
+            and os.path.splitext(entry.name)[1] in SPEC_MAT_EXTENSIONS + SPEC_IMAGE_EXTENSIONS
+            for entry in entries
+        )
+
+
+def _index_spec_dir(path: Optional[str]) -> Tuple[list, Dict[str, str], Dict[str, str]]:
+    """Scan a spectrogram folder once and index its MAT/NPY and image files.
+
+    Returns ``(spec_files, mat_index, image_index)``. ``spec_files`` keeps the
+    legacy ordering (sorted MAT, NPY, PNG, JPG, JPEG). Both indices are keyed by
+    filename and by stem, with exact filenames winning over stems and earlier
+    extensions winning over later ones, so ``index.get(item_id)`` resolves IDs
+    with or without an extension.
+    """
+    by_ext: Dict[str, list] = {ext: [] for ext in SPEC_MAT_EXTENSIONS + SPEC_IMAGE_EXTENSIONS}
+    if not path or not os.path.exists(path):
+        return [], {}, {}
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            ext = os.path.splitext(name)[1]
+            if ext in by_ext and entry.is_file():
+                by_ext[ext].append((name, entry.path))
+
+    spec_files = []
+    mat_index: Dict[str, str] = {}
+    image_index: Dict[str, str] = {}
+    for extensions, index in ((SPEC_MAT_EXTENSIONS, mat_index), (SPEC_IMAGE_EXTENSIONS, image_index)):
+        for ext in extensions:
+            by_ext[ext].sort()
+            spec_files.extend(fpath for _, fpath in by_ext[ext])
+            index.update(by_ext[ext])
+        for ext in extensions:
+            for name, fpath in by_ext[ext]:
+                index.setdefault(name[: -len(ext)], fpath)
+    return spec_files, mat_index, image_index
 
 
 def _find_audio_files(folder: Optional[str]) -> list:
@@ -89,22 +165,24 @@ def _find_first_hydrophone(dashboard_root: str, date_str: str) -> Optional[str]:
     date_dir = os.path.join(dashboard_root, date_str)
     if not os.path.exists(date_dir):
         return None
-    hydrophones = [d for d in os.listdir(date_dir) if os.path.isdir(os.path.join(date_dir, d))]
-    for device in sorted(hydrophones):
+    with os.scandir(date_dir) as entries:
+        hydrophones = sorted(entry.name for entry in entries if entry.is_dir())
+    for device in hydrophones:
         base_path = os.path.join(date_dir, device)
         spec_folder = _get_spectrogram_folder(base_path)
         if _has_spectrograms(spec_folder):
             return device
-    return sorted(hydrophones)[0] if hydrophones else None
+    return hydrophones[0] if hydrophones else None
 
 
 def _find_first_device_with_data(root_path: str, devices: list, spec_folder_names: list) -> Optional[str]:
-    for device in sorted(devices):
+    devices = sorted(devices)
+    for device in devices:
         base_path = os.path.join(root_path, device)
         spec_folder = _get_spectrogram_folder(base_path, spec_folder_names)
         if _has_spectrograms(spec_folder):
             return device
-    return sorted(devices)[0] if devices else None
+    return devices[0] if devices else None
 
 
 def _get_spectrogram_folder(base_path: str, folder_names: list = None) -> Optional[str]:
@@ -139,16 +217,6 @@ def _attach_predictions_path(items: list, predictions_path: Optional[str]) -> No
         item["metadata"] = metadata
 
 
-def _normalize_item_key(key: Optional[str]) -> Optional[str]:
-    if not key:
-        return key
-    lower_key = key.lower()
-    for ext in (".mat", ".npy", ".png", ".jpg", ".jpeg", ".wav", ".flac", ".mp3"):
-        if lower_key.endswith(ext):
-            return key[: -len(ext)]
-    return key
-
-
 def _is_segment_item_id(item_id: Optional[str]) -> bool:
     if not isinstance(item_id, str) or "_seg" not in item_id:
         return False
@@ -515,19 +583,28 @@ def _apply_item_deduplication(data: Dict) -> Dict:
 
 
 def _build_audio_index(audio_dir: Optional[str]) -> Dict[str, str]:
+    """Map audio file stems to paths with a single directory scan.
+
+    When a stem exists with several extensions, the earlier entry in
+    ``AUDIO_EXTENSIONS`` wins.
+    """
     index: Dict[str, str] = {}
     if not audio_dir or not os.path.exists(audio_dir):
         return index
-    for entry in os.listdir(audio_dir):
-        full_path = os.path.join(audio_dir, entry)
-        if not os.path.isfile(full_path):
-            continue
-        ext = os.path.splitext(entry)[1].lower()
-        if ext not in {".flac", ".wav", ".mp3", ".ogg"}:
-            continue
-        base_name = os.path.splitext(entry)[0]
-        if base_name and base_name not in index:
-            index[base_name] = full_path
+    ranks: Dict[str, int] = {}
+    with os.scandir(audio_dir) as it:
+        for entry in it:
+            base_name, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if not base_name or ext not in AUDIO_EXTENSIONS:
+                continue
+            rank = AUDIO_EXTENSIONS.index(ext)
+            if base_name in ranks and ranks[base_name] <= rank:
+                continue
+            if not entry.is_file():
+                continue
+            index[base_name] = entry.path
+            ranks[base_name] = rank
     return index
 
 
@@ -559,11 +636,17 @@ def _resolve_audio_path_for_item(
     return None
 
 
-def _enrich_items_with_audio_paths(items: list, audio_dir: Optional[str], base_path: Optional[str] = None) -> None:
+def _enrich_items_with_audio_paths(
+    items: list,
+    audio_dir: Optional[str],
+    base_path: Optional[str] = None,
+    audio_index: Optional[Dict[str, str]] = None,
+) -> None:
     if not items or not audio_dir or not os.path.exists(audio_dir):
         return
 
-    audio_index = _build_audio_index(audio_dir)
+    if audio_index is None:
+        audio_index = _build_audio_index(audio_dir)
 
     for item in items:
         if not isinstance(item, dict):
@@ -614,6 +697,20 @@ def _enrich_items_with_audio_paths(items: list, audio_dir: Optional[str], base_p
             item["audio_path"] = matched
 
 
+def _enrich_items_with_spec_paths(items: list, mat_index: Dict[str, str], image_index: Dict[str, str]) -> None:
+    for item in items:
+        item_id = item.get("item_id")
+        if not item_id:
+            continue
+        matched = mat_index.get(item_id)
+        if matched:
+            item["mat_path"] = matched
+        if not item.get("spectrogram_path"):
+            matched = image_index.get(item_id)
+            if matched:
+                item["spectrogram_path"] = matched
+
+
 def _clean_box_annotations(entries) -> list:
     cleaned = []
     for entry in entries or []:
@@ -806,6 +903,26 @@ def _label_fields_from_entry(label_entry):
     }
 
 
+def _annotations_from_label_fields(label_fields: dict) -> dict:
+    """Build an item's annotations dict from ``_label_fields_from_entry`` output.
+
+    Extents and boxes are deep-copied only when present; most items in a
+    folder are unlabeled and get fresh empty containers without the
+    ``deepcopy`` round-trip.
+    """
+    label_extents = label_fields["label_extents"]
+    box_annotations = label_fields["box_annotations"]
+    return {
+        "labels": label_fields["labels"],
+        "annotated_by": label_fields["annotated_by"],
+        "annotated_at": label_fields["annotated_at"],
+        "verified": label_fields["verified"],
+        "notes": label_fields["notes"],
+        "label_extents": deepcopy(label_extents) if label_extents and isinstance(label_extents, dict) else {},
+        "box_annotations": deepcopy(box_annotations) if box_annotations and isinstance(box_annotations, list) else [],
+    }
+
+
 def _build_audio_only_item(audio_path: str, existing_labels: dict, hydrophone: Optional[str], date_str: Optional[str]) -> dict:
     filename = os.path.basename(audio_path)
     item_id = os.path.splitext(filename)[0]
@@ -820,19 +937,7 @@ def _build_audio_only_item(audio_path: str, existing_labels: dict, hydrophone: O
         "device_code": hydrophone,
         "date": date_str,
         "predictions": None,
-        "annotations": {
-            "labels": label_fields["labels"],
-            "annotated_by": label_fields["annotated_by"],
-            "annotated_at": label_fields["annotated_at"],
-            "verified": label_fields["verified"],
-            "notes": label_fields["notes"],
-            "label_extents": deepcopy(label_fields["label_extents"])
-            if isinstance(label_fields["label_extents"], dict)
-            else {},
-            "box_annotations": deepcopy(label_fields["box_annotations"])
-            if isinstance(label_fields["box_annotations"], list)
-            else [],
-        },
+        "annotations": _annotations_from_label_fields(label_fields),
         "metadata": {"source_folder": os.path.dirname(audio_path), "source_audio": audio_path},
     }
 
@@ -859,49 +964,64 @@ def _load_items_from_folder(folder: str, audio_folder: Optional[str], labels_fil
             for audio_path in _find_audio_files(audio_search_folder)
         ]
     
+    has_audio_folder = bool(audio_folder and os.path.exists(audio_folder))
     items = []
-    for fpath in all_files:
-        filename = os.path.basename(fpath)
-        item_id = os.path.splitext(filename)[0]
-        
-        label_entry = existing_labels.get(filename) or existing_labels.get(item_id)
-        label_fields = _label_fields_from_entry(label_entry)
-        
-        item = {
-            "item_id": item_id,
-            "spectrogram_path": fpath if fpath.endswith(('.png', '.jpg')) else None,
-            "mat_path": fpath if fpath.endswith(('.mat', '.npy')) else None,
-            "audio_path": None,
-            "timestamps": {"start": None, "end": None},
-            "device_code": hydrophone,
-            "date": date_str,
-            "predictions": None,
-            "annotations": {
-                "labels": label_fields["labels"],
-                "annotated_by": label_fields["annotated_by"],
-                "annotated_at": label_fields["annotated_at"],
-                "verified": label_fields["verified"],
-                "notes": label_fields["notes"],
-                "label_extents": deepcopy(label_fields["label_extents"])
-                if isinstance(label_fields["label_extents"], dict)
-                else {},
-                "box_annotations": deepcopy(label_fields["box_annotations"])
-                if isinstance(label_fields["box_annotations"], list)
-                else [],
-            },
-            "metadata": {"source_folder": folder},
-        }
-        
-        if audio_folder and os.path.exists(audio_folder):
-            matches = find_matching_audio_files(filename, audio_folder)
-            if matches:
-                item["audio_path"] = get_representative_audio_file(matches)
-        
-        items.append(item)
+    # Each glob already fixes the extension, so the path field is known per bucket.
+    for path_key, files in (("mat_path", mat_files + npy_files), ("spectrogram_path", png_files)):
+        for fpath in files:
+            filename = os.path.basename(fpath)
+            item_id = os.path.splitext(filename)[0]
+            
+            label_entry = existing_labels.get(filename) or existing_labels.get(item_id)
+            label_fields = _label_fields_from_entry(label_entry)
+            
+            item = {
+                "item_id": item_id,
+                "spectrogram_path": None,
+                "mat_path": None,
+                "audio_path": None,
+                "timestamps": {"start": None, "end": None},
+                "device_code": hydrophone,
+                "date": date_str,
+                "predictions": None,
+                "annotations": _annotations_from_label_fields(label_fields),
+                "metadata": {"source_folder": folder},
+            }
+            item[path_key] = fpath
+            
+            if has_audio_folder:
+                matches = find_matching_audio_files(filename, audio_folder)
+                if matches:
+                    item["audio_path"] = get_representative_audio_file(matches)
+            
+            items.append(item)
     
     return items
 
 
+def _count_annotated_and_verified(items: list) -> Tuple[int, int]:
+    """Count items with labels and items marked verified in a single pass."""
+    annotated = 0
+    verified = 0
+    for item in items:
+        annotations = item.get("annotations") or {}
+        if annotations.get("labels"):
+            annotated += 1
+        if annotations.get("verified"):
+            verified += 1
+    return annotated, verified
+
+
+def _list_visible_subdirs(path: str) -> list:
+    """Return sorted names of non-hidden subdirectories using one scandir pass."""
+    with os.scandir(path) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if not entry.name.startswith(".") and entry.is_dir()
+        )
+
+
 def _discover_dates_and_devices(data_dir: str) -> tuple:
     """Discover all dates and devices in a hierarchical data directory."""
     dates = []
@@ -910,25 +1030,27 @@ def _discover_dates_and_devices(data_dir: str) -> tuple:
     if not data_dir or not os.path.exists(data_dir):
         return dates, list(devices)
     
-    for item in os.listdir(data_dir):
-        item_path = os.path.join(data_dir, item)
-        if os.path.isdir(item_path) and len(item) == 10 and item[4] == '-':
-            dates.append(item)
-            # Find devices within this date folder
-            for device in os.listdir(item_path):
-                device_path = os.path.join(item_path, device)
-                if os.path.isdir(device_path):
-                    devices.add(device)
+    # DirEntry.is_dir() answers from the readdir d_type on most filesystems,
+    # so the sweep costs one readdir per folder instead of a stat per entry.
+    with os.scandir(data_dir) as date_entries:
+        for date_entry in date_entries:
+            item = date_entry.name
+            if len(item) == 10 and item[4] == '-' and date_entry.is_dir():
+                dates.append(item)
+                # Find devices within this date folder
+                with os.scandir(date_entry.path) as device_entries:
+                    for device_entry in device_entries:
+                        if device_entry.is_dir():
+                            devices.add(device_entry.name)
     
     return sorted(dates, reverse=True), sorted(list(devices))
 
 
 def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Optional[str] = None) -> Dict:
-    from app.utils.label_operations import get_default_labels_path
     from app.utils.data_discovery import detect_data_structure
     
-    label_cfg = config.get("label", {})
-    data_cfg = config.get("data", {})
+    label_cfg = config.get("label") or {}
+    data_cfg = config.get("data") or {}
     structure_type = data_cfg.get("structure_type", "unknown")
     
     # Get configurable folder names
@@ -957,7 +1079,7 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
         "metadata": {"format_version": "2.0"}
     }
     
-    audio_roots = []
+    audio_roots = {}  # ordered set of audio folders
     
     # Handle "__all__" selections for hierarchical structures
     if structure_type == "hierarchical" and data_dir:
@@ -989,14 +1111,17 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
                         break
                 
                 device_labels_file = os.path.join(base_device_path, "labels.json")
+                if not os.path.exists(device_labels_file):
+                    device_labels_file = None
                 
-                if device_audio_folder and os.path.exists(device_audio_folder):
-                    audio_roots.append(device_audio_folder)
+                # device_audio_folder is only ever set to a path that exists.
+                if device_audio_folder:
+                    audio_roots[device_audio_folder] = None
 
                 items = _load_items_from_folder(
                     spec_folder,
-                    device_audio_folder if device_audio_folder and os.path.exists(device_audio_folder) else None,
-                    device_labels_file if os.path.exists(device_labels_file) else None,
+                    device_audio_folder,
+                    device_labels_file,
                     dev,
                     d
                 )
@@ -1006,7 +1131,7 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
 
         data["items"] = all_items
         data["_spec_folders_loaded"] = folders_loaded
-        data["_audio_folders_loaded"] = [r for r in audio_roots]
+        data["_audio_folders_loaded"] = list(audio_roots)
         folder = ", ".join(folders_loaded[:3]) + ("..." if len(folders_loaded) > 3 else "") if folders_loaded else None
         
         # Overlay labels from root/date/device labels.json (if present).
@@ -1044,16 +1169,10 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
 
     elif structure_type == "device_only" and data_dir:
         # Device-only structure (DATE folder selected as root)
-        devices = []
         try:
-            for item in os.listdir(data_dir):
-                item_path = os.path.join(data_dir, item)
-                if os.path.isdir(item_path) and not item.startswith("."):
-                    devices.append(item)
+            devices = _list_visible_subdirs(data_dir)
         except Exception:
             devices = []
-
-        devices = sorted(devices)
         if hydrophone == "__all__":
             devices_to_load = devices
         elif hydrophone:
@@ -1093,17 +1212,19 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
                     break
 
             device_labels_file = os.path.join(base_device_path, "labels.json")
-            selected_labels_file = labels_file
             if os.path.exists(device_labels_file):
                 selected_labels_file = device_labels_file
+            else:
+                selected_labels_file = labels_file if labels_file and os.path.exists(labels_file) else None
 
-            if device_audio_folder and os.path.exists(device_audio_folder):
-                audio_roots.append(device_audio_folder)
+            # device_audio_folder is only ever set to a path that exists.
+            if device_audio_folder:
+                audio_roots[device_audio_folder] = None
 
             items = _load_items_from_folder(
                 spec_folder,
-                device_audio_folder if device_audio_folder and os.path.exists(device_audio_folder) else None,
-                selected_labels_file if selected_labels_file and os.path.exists(selected_labels_file) else None,
+                device_audio_folder,
+                selected_labels_file,
                 dev,
                 active_date_label,
             )
@@ -1113,7 +1234,7 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
 
         data["items"] = all_items
         data["_spec_folders_loaded"] = folders_loaded
-        data["_audio_folders_loaded"] = [r for r in audio_roots]
+        data["_audio_folders_loaded"] = list(audio_roots)
         folder = ", ".join(folders_loaded[:3]) + ("..." if len(folders_loaded) > 3 else "") if folders_loaded else None
 
         # Overlay root-level labels.json when present (useful for shared labels at date root).
@@ -1154,7 +1275,7 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
             items = _load_items_from_folder(folder, audio_folder, labels_file, hydrophone, date_str)
             data["items"] = items
             if audio_folder:
-                audio_roots.append(audio_folder)
+                audio_roots[audio_folder] = None
     else:
         # Manual folder override
         if not labels_file:
@@ -1162,12 +1283,11 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
         items = _load_items_from_folder(folder, audio_folder, labels_file, hydrophone, date_str)
         data["items"] = items
         if audio_folder:
-            audio_roots.append(audio_folder)
+            audio_roots[audio_folder] = None
     
     # Calculate summary
     data["summary"]["total_items"] = len(data["items"])
-    data["summary"]["annotated"] = sum(1 for item in data["items"] if item.get("annotations", {}).get("labels"))
-    data["summary"]["verified"] = sum(1 for item in data["items"] if item.get("annotations", {}).get("verified"))
+    data["summary"]["annotated"], data["summary"]["verified"] = _count_annotated_and_verified(data["items"])
     
     # Store active paths for UI updates
     data["summary"]["active_date"] = "All" if date_str == "__all__" else date_str
@@ -1196,9 +1316,9 @@ def load_label_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Op
         word = "folder" if len(unique_audio_folders) == 1 else "folders"
         data["summary"]["audio_folder"] = f"{len(unique_audio_folders)} {word}"
     else:
-        data["summary"]["audio_folder"] = audio_folder or (audio_roots[0] if audio_roots else None)
+        data["summary"]["audio_folder"] = audio_folder or next(iter(audio_roots), None)
 
-    data["audio_roots"] = list(set(audio_roots))
+    data["audio_roots"] = list(audio_roots)
     return data
 
 
@@ -1208,8 +1328,8 @@ def load_verify_mode(
     hydrophone: Optional[str] = None,
     allow_unlabeled: bool = False,
 ) -> Dict:
-    verify_cfg = config.get("verify", {})
-    data_cfg = config.get("data", {})
+    verify_cfg = config.get("verify") or {}
+    data_cfg = config.get("data") or {}
     dashboard_root = data_cfg.get("data_dir") or verify_cfg.get("dashboard_root")
     structure_type = data_cfg.get("structure_type", "hierarchical")
     
@@ -1227,16 +1347,24 @@ def load_verify_mode(
         predictions_file_override = None
     predictions_overrides = data_cfg.get("predictions_overrides")
     override_index = _build_predictions_override_index(predictions_overrides)
+    # Both caches are shared by the device-load worker threads below.
     override_cache = {}
+    override_cache_lock = threading.Lock()
 
     def load_predictions_cached(predictions_path: str) -> Dict:
-        if predictions_path in override_cache:
-            return override_cache[predictions_path]
-        whale_config = {"whale": {"predictions_json": predictions_path}}
-        loaded = load_whale_mode(whale_config)
-        _attach_predictions_path(loaded.get("items", []), predictions_path)
-        override_cache[predictions_path] = loaded
-        return loaded
+        def load() -> Dict:
+            whale_config = {"whale": {"predictions_json": predictions_path}}
+            loaded = load_whale_mode(whale_config)
+            _attach_predictions_path(loaded.get("items", []), predictions_path)
+            return loaded
+
+        return _load_once(override_cache, override_cache_lock, predictions_path, load)
+
+    spec_dir_cache = {}
+    spec_dir_cache_lock = threading.Lock()
+
+    def index_spec_dir_cached(path: str) -> Tuple[list, Dict[str, str], Dict[str, str]]:
+        return _load_once(spec_dir_cache, spec_dir_cache_lock, path, lambda: _index_spec_dir(path))
     
     data = {"items": [], "summary": {"total_items": 0}}
     predictions_path = None
@@ -1266,8 +1394,12 @@ def load_verify_mode(
             _attach_predictions_path(data.get("items", []), predictions_path)
         
         # Add items from mat files if no predictions or to supplement
+        audio_index = _build_audio_index(audio_dir)
+
         if mat_dir and os.path.exists(mat_dir):
-            existing_ids = {item["item_id"] for item in data.get("items", [])}
+            items_by_id = {}
+            for item in data.get("items", []):
+                items_by_id.setdefault(item.get("item_id"), item)
             mat_files = sorted(glob.glob(os.path.join(mat_dir, "*.mat")))
             npy_files = sorted(glob.glob(os.path.join(mat_dir, "*.npy")))
             png_files = sorted(glob.glob(os.path.join(mat_dir, "*.png")))
@@ -1278,27 +1410,17 @@ def load_verify_mode(
                 filename = os.path.basename(fpath)
                 item_id = os.path.splitext(filename)[0]
                 
-                if item_id in existing_ids or filename in existing_ids:
+                target = items_by_id.get(item_id) or items_by_id.get(filename)
+                if target is not None:
                     # Update existing item with mat_path
-                    for item in data["items"]:
-                        if item.get("item_id") in [item_id, filename]:
-                            item["mat_path"] = fpath
-                            break
+                    target["mat_path"] = fpath
                 else:
                     # Create new item
-                    audio_path = None
-                    if audio_dir:
-                        for ext in ['.flac', '.wav', '.mp3']:
-                            candidate = os.path.join(audio_dir, item_id + ext)
-                            if os.path.exists(candidate):
-                                audio_path = candidate
-                                break
-                    
                     data["items"].append({
                         "item_id": item_id,
                         "spectrogram_path": fpath if fpath.endswith(('.png', '.jpg')) else None,
                         "mat_path": fpath if fpath.endswith(('.mat', '.npy')) else None,
-                        "audio_path": audio_path,
+                        "audio_path": audio_index.get(item_id),
                         "timestamps": {"start": None, "end": None},
                         "device_code": None,
                         "predictions": {},
@@ -1315,7 +1437,7 @@ def load_verify_mode(
             
             data["summary"]["total_items"] = len(data["items"])
 
-        _enrich_items_with_audio_paths(data.get("items", []), audio_dir, base_path=mat_dir)
+        _enrich_items_with_audio_paths(data.get("items", []), audio_dir, base_path=mat_dir, audio_index=audio_index)
         _ensure_items_scope(data.get("items", []))
         available_dates, available_devices = _available_item_scopes(data.get("items", []))
         data["items"] = _filter_items_for_scope(data.get("items", []), date_str, hydrophone)
@@ -1333,16 +1455,10 @@ def load_verify_mode(
     
     elif dashboard_root and structure_type == "device_only":
         # Device-only structure (DATE folder selected as root)
-        devices = []
         try:
-            for item in os.listdir(dashboard_root):
-                item_path = os.path.join(dashboard_root, item)
-                if os.path.isdir(item_path) and not item.startswith("."):
-                    devices.append(item)
+            devices = _list_visible_subdirs(dashboard_root)
         except Exception:
             devices = []
-
-        devices = sorted(devices)
         if hydrophone == "__all__":
             devices_to_load = devices
         elif hydrophone:
@@ -1356,27 +1472,23 @@ def load_verify_mode(
         active_date_label = folder_name if len(folder_name) == 10 and folder_name[4] == '-' and folder_name[7] == '-' else None
 
         all_items = []
-        audio_roots = []
+        audio_roots = {}  # ordered set of audio folders
 
         # Cascading predictions: override > root-level > device-level
         root_predictions_path = None
         root_data = None
 
         if predictions_file_override and os.path.exists(predictions_file_override):
-            whale_config = {"whale": {"predictions_json": predictions_file_override}}
-            root_data = load_whale_mode(whale_config)
+            root_data = load_predictions_cached(predictions_file_override)
             predictions_path = predictions_file_override
             predictions_paths_loaded.append(predictions_file_override)
-            _attach_predictions_path(root_data.get("items", []), predictions_path)
         else:
             root_pred_candidate = os.path.join(dashboard_root, "predictions.json")
             if os.path.exists(root_pred_candidate):
                 root_predictions_path = root_pred_candidate
-                whale_config = {"whale": {"predictions_json": root_pred_candidate}}
-                root_data = load_whale_mode(whale_config)
+                root_data = load_predictions_cached(root_pred_candidate)
                 predictions_path = root_pred_candidate
                 predictions_paths_loaded.append(root_pred_candidate)
-                _attach_predictions_path(root_data.get("items", []), predictions_path)
 
         root_items = root_data.get("items", []) if root_data else []
         root_has_device = any(item.get("device_code") for item in root_items)
@@ -1442,52 +1554,18 @@ def load_verify_mode(
                 else:
                     # Fallback to legacy labels.json if it exists
                     labels_path = os.path.join(base_path, "labels.json")
-                    labels_json = read_json(labels_path) if os.path.exists(labels_path) else {}
                     image_dir = os.path.join(base_path, "images")
-                    folder_data = convert_hydrophonedashboard_to_unified(labels_json, active_date_label, active_device, image_dir)
+                    folder_data = convert_hydrophonedashboard_file_to_unified(labels_path, active_date_label, active_device, image_dir)
 
             # Enrich items with spectrogram/mat file paths
-            spec_files = []
             if local_mat_dir and os.path.exists(local_mat_dir):
-                mat_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.mat")))
-                npy_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.npy")))
-                png_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.png")))
-                jpg_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.jpg")))
-                jpeg_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.jpeg")))
-                image_files = png_files + jpg_files + jpeg_files
-                spec_files = mat_files + npy_files + image_files
-
-                mat_files_map = {os.path.basename(f): f for f in mat_files}
-                npy_files_map = {os.path.basename(f): f for f in npy_files}
-                image_files_map = {os.path.basename(f): f for f in image_files}
-                all_specs_map = {**mat_files_map, **npy_files_map}
-
-                for item in folder_data.get("items", []):
-                    item_id = item.get("item_id")
-                    if not item_id:
-                        continue
-                    if item_id in all_specs_map:
-                        item["mat_path"] = all_specs_map[item_id]
-                    elif f"{item_id}.mat" in all_specs_map:
-                        item["mat_path"] = all_specs_map[f"{item_id}.mat"]
-                    elif f"{item_id}.npy" in all_specs_map:
-                        item["mat_path"] = all_specs_map[f"{item_id}.npy"]
-
-                    if not item.get("spectrogram_path"):
-                        if item_id in image_files_map:
-                            item["spectrogram_path"] = image_files_map[item_id]
-                        elif f"{item_id}.png" in image_files_map:
-                            item["spectrogram_path"] = image_files_map[f"{item_id}.png"]
-                        elif f"{item_id}.jpg" in image_files_map:
-                            item["spectrogram_path"] = image_files_map[f"{item_id}.jpg"]
-                        elif f"{item_id}.jpeg" in image_files_map:
-                            item["spectrogram_path"] = image_files_map[f"{item_id}.jpeg"]
-
+                _spec_files, mat_index, image_index = index_spec_dir_cached(local_mat_dir)
+                _enrich_items_with_spec_paths(folder_data.get("items", []), mat_index, image_index)
                 mat_dirs_loaded.append(local_mat_dir)
 
             if local_audio_dir and os.path.exists(local_audio_dir):
                 _enrich_items_with_audio_paths(folder_data.get("items", []), local_audio_dir, base_path=base_path)
-                audio_roots.append(local_audio_dir)
+                audio_roots[local_audio_dir] = None
                 audio_folders_loaded.append(local_audio_dir)
 
             all_items.extend(folder_data.get("items", []))
@@ -1496,7 +1574,7 @@ def load_verify_mode(
         data["summary"]["total_items"] = len(all_items)
         data["summary"]["active_date"] = active_date_label
         data["summary"]["active_hydrophone"] = "All" if hydrophone == "__all__" else (devices_to_load[0] if devices_to_load else None)
-        data["audio_roots"] = list(set(audio_roots))
+        data["audio_roots"] = list(audio_roots)
 
         # When showing summary, use the actual folders based on selection
         if len(devices_to_load) == 1:
@@ -1516,7 +1594,7 @@ def load_verify_mode(
                 predictions_path = predictions_paths_loaded[0] if predictions_paths_loaded else None
         else:
             mat_dir = mat_dirs_loaded[0] if mat_dirs_loaded else None
-            audio_dir = audio_roots[0] if audio_roots else None
+            audio_dir = next(iter(audio_roots), None)
             predictions_path = predictions_paths_loaded[0] if predictions_paths_loaded else None
 
     elif dashboard_root:
@@ -1546,7 +1624,7 @@ def load_verify_mode(
             devices_to_load = [fallback_device] if fallback_device else all_devices[:1]
         
         all_items = []
-        audio_roots = []
+        audio_roots = {}  # ordered set of audio folders
         
         # CASCADING PREDICTIONS DISCOVERY:
         # Check root level first - if found, use for all items
@@ -1567,31 +1645,177 @@ def load_verify_mode(
         # If we found root-level predictions, load them once
         root_data = None
         if predictions_file_override and os.path.exists(predictions_file_override):
-            whale_config = {"whale": {"predictions_json": predictions_file_override}}
-            root_data = load_whale_mode(whale_config)
+            root_data = load_predictions_cached(predictions_file_override)
             predictions_path = predictions_file_override
             predictions_paths_loaded.append(predictions_file_override)
-            _attach_predictions_path(root_data.get("items", []), predictions_path)
         elif root_predictions_path:
-            whale_config = {"whale": {"predictions_json": root_predictions_path}}
-            root_data = load_whale_mode(whale_config)
+            root_data = load_predictions_cached(root_predictions_path)
             predictions_path = root_predictions_path
             predictions_paths_loaded.append(root_predictions_path)
-            _attach_predictions_path(root_data.get("items", []), predictions_path)
+        # Shared, read-only view of root items; per-device subsets are deep-copied below.
+        root_items = root_data.get("items", []) if root_data else []
 
         date_device_overrides, date_overrides, _device_overrides = override_index
         
+        def load_device_items(active_date, active_device, date_override_data, date_data):
+            """Load and enrich the items of one DATE/DEVICE folder.
+
+            Runs on worker threads, so it only reads shared state and returns
+            what it found for the caller to merge in order.
+            """
+            date_override_items = date_override_data.get("items", []) if date_override_data else []
+            date_items = date_data.get("items", []) if date_data else []
+            base_path = os.path.join(dashboard_root, active_date, active_device)
+            if not os.path.exists(base_path):
+                return None
+            device_predictions_paths = []
+            
+            # Try common spectrogram folder names if no override
+            if spec_folder_override:
+                local_mat_dir = spec_folder_override
+            else:
+                local_mat_dir = _get_spectrogram_folder(base_path, spec_folder_names)
+            
+            # Find audio folder using configurable names
+            if audio_folder_override:
+                local_audio_dir = audio_folder_override
+            else:
+                local_audio_dir = None
+                for audio_name in audio_folder_names:
+                    candidate = os.path.join(base_path, audio_name)
+                    if os.path.exists(candidate):
+                        local_audio_dir = candidate
+                        break
+            
+            # Load predictions using cascading discovery:
+            # Priority: root > date > device
+            folder_data = {"items": [], "summary": {}}
+
+            device_override_path = None
+            if not predictions_file_override:
+                device_override_path = date_device_overrides.get((active_date, active_device))
+
+            if device_override_path and os.path.exists(device_override_path):
+                override_data = load_predictions_cached(device_override_path)
+                filtered_override_items = [
+                    deepcopy(i)
+                    for i in override_data.get("items", [])
+                    if _item_matches_scope(i, active_date, active_device)
+                ]
+                folder_data = {"items": filtered_override_items, "summary": {}}
+                device_predictions_paths.append(device_override_path)
+            elif date_override_data:
+                filtered_date_override_items = [
+                    deepcopy(i)
+                    for i in date_override_items
+                    if _item_matches_scope(i, active_date, active_device)
+                ]
+                if not filtered_date_override_items and active_device == devices_to_load[0]:
+                    filtered_date_override_items = [deepcopy(i) for i in date_override_items]
+                folder_data = {"items": filtered_date_override_items, "summary": {}}
+            elif root_data:
+                filtered_root_items = [
+                    deepcopy(i)
+                    for i in root_items
+                    if _item_matches_scope(i, active_date, active_device)
+                ]
+                if (
+                    not filtered_root_items
+                    and active_date == dates_to_load[0]
+                    and active_device == devices_to_load[0]
+                ):
+                    filtered_root_items = [deepcopy(i) for i in root_items]
+                folder_data = {"items": filtered_root_items, "summary": {}}
+            elif date_data:
+                filtered_date_items = [
+                    deepcopy(i)
+                    for i in date_items
+                    if _item_matches_scope(i, active_date, active_device)
+                ]
+                if not filtered_date_items and active_device == devices_to_load[0]:
+                    filtered_date_items = [deepcopy(i) for i in date_items]
+                folder_data = {"items": filtered_date_items, "summary": {}}
+            else:
+                # Check device-level predictions
+                local_predictions_path = os.path.join(base_path, "predictions.json")
+                if os.path.exists(local_predictions_path):
+                    whale_config = {"whale": {"predictions_json": local_predictions_path}}
+                    folder_data = load_whale_mode(whale_config)
+                    device_predictions_paths.append(local_predictions_path)
+                    _attach_predictions_path(folder_data.get("items", []), local_predictions_path)
+                else:
+                    # Fallback to legacy labels.json if it exists
+                    labels_path = os.path.join(base_path, "labels.json")
+                    image_dir = os.path.join(base_path, "images")
+                    folder_data = convert_hydrophonedashboard_file_to_unified(labels_path, active_date, active_device, image_dir)
+            
+            # Enrich items with spectrogram/mat file paths
+            spec_files = []
+            loaded_mat_dir = None
+            if local_mat_dir and os.path.exists(local_mat_dir):
+                spec_files, mat_index, image_index = index_spec_dir_cached(local_mat_dir)
+                _enrich_items_with_spec_paths(folder_data.get("items", []), mat_index, image_index)
+                loaded_mat_dir = local_mat_dir
+
+            # In explore mode, include unlabeled items from spectrogram folders
+            local_audio_index = _build_audio_index(local_audio_dir)
+            if allow_unlabeled and spec_files:
+                existing_ids = {item.get("item_id") for item in folder_data.get("items", [])}
+                existing_ids.difference_update((None, ""))
+
+                for fpath in spec_files:
+                    filename = os.path.basename(fpath)
+                    item_id = os.path.splitext(filename)[0]
+                    if item_id in existing_ids or filename in existing_ids:
+                        continue
+
+                    is_image = fpath.lower().endswith((".png", ".jpg", ".jpeg"))
+                    is_mat = fpath.lower().endswith((".mat", ".npy"))
+
+                    folder_data["items"].append({
+                        "item_id": item_id,
+                        "spectrogram_path": fpath if is_image else None,
+                        "mat_path": fpath if is_mat else mat_index.get(item_id),
+                        "audio_path": local_audio_index.get(item_id),
+                        "timestamps": {"start": None, "end": None},
+                        "device_code": active_device,
+                        "predictions": {},
+                        "annotations": {
+                            "labels": [],
+                            "annotated_by": None,
+                            "annotated_at": None,
+                            "verified": False,
+                            "rejected_labels": [],
+                            "notes": "",
+                        },
+                        "metadata": {"date": active_date, "hydrophone": active_device},
+                    })
+                    existing_ids.add(item_id)
+                    existing_ids.add(filename)
+
+            _enrich_items_with_audio_paths(
+                folder_data.get("items", []),
+                local_audio_dir,
+                base_path=base_path,
+                audio_index=local_audio_index,
+            )
+            
+            loaded_audio_dir = local_audio_dir if local_audio_dir and os.path.exists(local_audio_dir) else None
+            return folder_data.get("items", []), loaded_mat_dir, loaded_audio_dir, device_predictions_paths
+
+        date_jobs = []
         for active_date in dates_to_load:
             if not active_date:
                 continue
             
+            date_predictions_paths = []
             date_override_path = None
             date_override_data = None
             if not predictions_file_override:
                 date_override_path = date_overrides.get(active_date)
                 if date_override_path and os.path.exists(date_override_path):
                     date_override_data = load_predictions_cached(date_override_path)
-                    predictions_paths_loaded.append(date_override_path)
+                    date_predictions_paths.append(date_override_path)
 
             # Check for date-level predictions (e.g., root/2024-01-15/predictions.json)
             date_predictions_path = None
@@ -1603,204 +1827,52 @@ def load_verify_mode(
                 date_pred_candidate = os.path.join(date_path, "predictions.json")
                 if os.path.exists(date_pred_candidate):
                     date_predictions_path = date_pred_candidate
-                    whale_config = {"whale": {"predictions_json": date_predictions_path}}
-                    date_data = load_whale_mode(whale_config)
-                    predictions_paths_loaded.append(date_predictions_path)
-                    _attach_predictions_path(date_data.get("items", []), date_predictions_path)
+                    date_data = load_predictions_cached(date_predictions_path)
+                    date_predictions_paths.append(date_predictions_path)
                 else:
                     date_labels_candidate = os.path.join(date_path, "labels.json")
                     if os.path.exists(date_labels_candidate):
                         date_labels_path = date_labels_candidate
-            
-            for active_device in devices_to_load:
-                if not active_device:
-                    continue
-                    
-                base_path = os.path.join(dashboard_root, active_date, active_device)
-                if not os.path.exists(base_path):
-                    continue
-                
-                # Try common spectrogram folder names if no override
-                if spec_folder_override:
-                    local_mat_dir = spec_folder_override
-                else:
-                    local_mat_dir = _get_spectrogram_folder(base_path, spec_folder_names)
-                
-                # Find audio folder using configurable names
-                if audio_folder_override:
-                    local_audio_dir = audio_folder_override
-                else:
-                    local_audio_dir = None
-                    for audio_name in audio_folder_names:
-                        candidate = os.path.join(base_path, audio_name)
-                        if os.path.exists(candidate):
-                            local_audio_dir = candidate
-                            break
-                
-                # Load predictions using cascading discovery:
-                # Priority: root > date > device
-                folder_data = {"items": [], "summary": {}}
-
-                device_override_path = None
-                if not predictions_file_override:
-                    device_override_path = date_device_overrides.get((active_date, active_device))
-
-                if device_override_path and os.path.exists(device_override_path):
-                    override_data = load_predictions_cached(device_override_path)
-                    filtered_override_items = [
-                        deepcopy(i)
-                        for i in override_data.get("items", [])
-                        if _item_matches_scope(i, active_date, active_device)
-                    ]
-                    folder_data = {"items": filtered_override_items, "summary": {}}
-                    predictions_paths_loaded.append(device_override_path)
-                elif date_override_data:
-                    filtered_date_override_items = [
-                        deepcopy(i)
-                        for i in date_override_data.get("items", [])
-                        if _item_matches_scope(i, active_date, active_device)
-                    ]
-                    if not filtered_date_override_items and active_device == devices_to_load[0]:
-                        filtered_date_override_items = [deepcopy(i) for i in date_override_data.get("items", [])]
-                    folder_data = {"items": filtered_date_override_items, "summary": {}}
-                elif root_data:
-                    filtered_root_items = [
-                        deepcopy(i)
-                        for i in root_data.get("items", [])
-                        if _item_matches_scope(i, active_date, active_device)
-                    ]
-                    if (
-                        not filtered_root_items
-                        and active_date == dates_to_load[0]
-                        and active_device == devices_to_load[0]
-                    ):
-                        filtered_root_items = [deepcopy(i) for i in root_data.get("items", [])]
-                    folder_data = {"items": filtered_root_items, "summary": {}}
-                elif date_data:
-                    filtered_date_items = [
-                        deepcopy(i)
-                        for i in date_data.get("items", [])
-                        if _item_matches_scope(i, active_date, active_device)
-                    ]
-                    if not filtered_date_items and active_device == devices_to_load[0]:
-                        filtered_date_items = [deepcopy(i) for i in date_data.get("items", [])]
-                    folder_data = {"items": filtered_date_items, "summary": {}}
-                else:
-                    # Check device-level predictions
-                    local_predictions_path = os.path.join(base_path, "predictions.json")
-                    if os.path.exists(local_predictions_path):
-                        whale_config = {"whale": {"predictions_json": local_predictions_path}}
-                        folder_data = load_whale_mode(whale_config)
-                        predictions_paths_loaded.append(local_predictions_path)
-                        _attach_predictions_path(folder_data.get("items", []), local_predictions_path)
-                    else:
-                        # Fallback to legacy labels.json if it exists
-                        labels_path = os.path.join(base_path, "labels.json")
-                        labels_json = read_json(labels_path) if os.path.exists(labels_path) else {}
-                        image_dir = os.path.join(base_path, "images")
-                        folder_data = convert_hydrophonedashboard_to_unified(labels_json, active_date, active_device, image_dir)
-                
-                # Enrich items with spectrogram/mat file paths
-                spec_files = []
-                mat_files_map = {}
-                npy_files_map = {}
-                image_files_map = {}
-                if local_mat_dir and os.path.exists(local_mat_dir):
-                    mat_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.mat")))
-                    npy_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.npy")))
-                    png_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.png")))
-                    jpg_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.jpg")))
-                    jpeg_files = sorted(glob.glob(os.path.join(local_mat_dir, "*.jpeg")))
-                    image_files = png_files + jpg_files + jpeg_files
-                    spec_files = mat_files + npy_files + image_files
-
-                    mat_files_map = {os.path.basename(f): f for f in mat_files}
-                    npy_files_map = {os.path.basename(f): f for f in npy_files}
-                    image_files_map = {os.path.basename(f): f for f in image_files}
-                    all_specs_map = {**mat_files_map, **npy_files_map}
-
-                    for item in folder_data.get("items", []):
-                        item_id = item.get("item_id")
-                        if not item_id:
-                            continue
-                        if item_id in all_specs_map:
-                            item["mat_path"] = all_specs_map[item_id]
-                        elif f"{item_id}.mat" in all_specs_map:
-                            item["mat_path"] = all_specs_map[f"{item_id}.mat"]
-                        elif f"{item_id}.npy" in all_specs_map:
-                            item["mat_path"] = all_specs_map[f"{item_id}.npy"]
-
-                        if not item.get("spectrogram_path"):
-                            if item_id in image_files_map:
-                                item["spectrogram_path"] = image_files_map[item_id]
-                            elif f"{item_id}.png" in image_files_map:
-                                item["spectrogram_path"] = image_files_map[f"{item_id}.png"]
-                            elif f"{item_id}.jpg" in image_files_map:
-                                item["spectrogram_path"] = image_files_map[f"{item_id}.jpg"]
-                            elif f"{item_id}.jpeg" in image_files_map:
-                                item["spectrogram_path"] = image_files_map[f"{item_id}.jpeg"]
-
-                    mat_dirs_loaded.append(local_mat_dir)
-
-                # In explore mode, include unlabeled items from spectrogram folders
-                if allow_unlabeled and spec_files:
-                    existing_ids = set()
-                    for item in folder_data.get("items", []):
-                        item_id = item.get("item_id")
-                        if item_id:
-                            existing_ids.add(item_id)
-
-                    for fpath in spec_files:
-                        filename = os.path.basename(fpath)
-                        item_id = os.path.splitext(filename)[0]
-                        if item_id in existing_ids or filename in existing_ids:
-                            continue
-
-                        audio_path = None
-                        if local_audio_dir:
-                            for ext in [".flac", ".wav", ".mp3"]:
-                                candidate = os.path.join(local_audio_dir, item_id + ext)
-                                if os.path.exists(candidate):
-                                    audio_path = candidate
-                                    break
-
-                        is_image = fpath.lower().endswith((".png", ".jpg", ".jpeg"))
-                        is_mat = fpath.lower().endswith((".mat", ".npy"))
-
-                        folder_data["items"].append({
-                            "item_id": item_id,
-                            "spectrogram_path": fpath if is_image else None,
-                            "mat_path": fpath if is_mat else None,
-                            "audio_path": audio_path,
-                            "timestamps": {"start": None, "end": None},
-                            "device_code": active_device,
-                            "predictions": {},
-                            "annotations": {
-                                "labels": [],
-                                "annotated_by": None,
-                                "annotated_at": None,
-                                "verified": False,
-                                "rejected_labels": [],
-                                "notes": "",
-                            },
-                            "metadata": {"date": active_date, "hydrophone": active_device},
-                        })
-                        existing_ids.add(item_id)
-                        existing_ids.add(filename)
 
-                _enrich_items_with_audio_paths(folder_data.get("items", []), local_audio_dir, base_path=base_path)
-                
-                if local_audio_dir and os.path.exists(local_audio_dir):
-                    audio_roots.append(local_audio_dir)
-                    audio_folders_loaded.append(local_audio_dir)
-                
-                all_items.extend(folder_data.get("items", []))
+            date_jobs.append((
+                date_predictions_paths,
+                [
+                    (active_date, active_device, date_override_data, date_data)
+                    for active_device in devices_to_load
+                    if active_device
+                ],
+            ))
+
+        # Device folders are independent and dominated by filesystem latency,
+        # so load them concurrently and merge the results in selection order.
+        device_jobs = [job for _paths, jobs in date_jobs for job in jobs]
+        max_workers = min(_DEVICE_LOAD_MAX_WORKERS, len(device_jobs))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="verify-load") as executor:
+                device_results = list(executor.map(lambda job: load_device_items(*job), device_jobs))
+        else:
+            device_results = [load_device_items(*job) for job in device_jobs]
+
+        results_iter = iter(device_results)
+        for date_predictions_paths, jobs in date_jobs:
+            predictions_paths_loaded.extend(date_predictions_paths)
+            for _job, result in zip(jobs, results_iter):
+                if result is None:
+                    continue
+                folder_items, loaded_mat_dir, loaded_audio_dir, device_predictions_paths = result
+                predictions_paths_loaded.extend(device_predictions_paths)
+                if loaded_mat_dir:
+                    mat_dirs_loaded.append(loaded_mat_dir)
+                if loaded_audio_dir:
+                    audio_roots[loaded_audio_dir] = None
+                    audio_folders_loaded.append(loaded_audio_dir)
+                all_items.extend(folder_items)
         
         data["items"] = all_items
         data["summary"]["total_items"] = len(all_items)
         data["summary"]["active_date"] = "All" if date_str == "__all__" else (dates_to_load[0] if dates_to_load else None)
         data["summary"]["active_hydrophone"] = "All" if hydrophone == "__all__" else (devices_to_load[0] if devices_to_load else None)
-        data["audio_roots"] = list(set(audio_roots))
+        data["audio_roots"] = list(audio_roots)
         
         # When showing summary, use the actual folders based on selection
         # If a specific device is selected, show that device's folders (not first loaded)
@@ -1828,23 +1900,17 @@ def load_verify_mode(
         else:
             # Multiple selections - use first loaded or summary
             mat_dir = mat_dirs_loaded[0] if mat_dirs_loaded else None
-            audio_dir = audio_roots[0] if audio_roots else None
+            audio_dir = next(iter(audio_roots), None)
             predictions_path = predictions_paths_loaded[0] if predictions_paths_loaded else None
 
-    # Enrich with mat files if they exist
-    if mat_dir and os.path.exists(mat_dir) and data["items"]:
-        mat_files = {os.path.basename(f): f for f in glob.glob(os.path.join(mat_dir, "*.mat"))}
-        npy_files = {os.path.basename(f): f for f in glob.glob(os.path.join(mat_dir, "*.npy"))}
-        all_specs = {**mat_files, **npy_files}
-        
+    # Enrich with mat files if they exist. Hierarchical loads already enriched
+    # each folder's items above, so only the flat path still needs this pass.
+    if mat_dir and not mat_dirs_loaded and os.path.exists(mat_dir) and data["items"]:
+        _spec_files, mat_index, _image_index = index_spec_dir_cached(mat_dir)
         for item in data["items"]:
-            item_id = item.get("item_id")
-            if item_id in all_specs:
-                item["mat_path"] = all_specs[item_id]
-            elif f"{item_id}.mat" in all_specs:
-                item["mat_path"] = all_specs[f"{item_id}.mat"]
-            elif f"{item_id}.npy" in all_specs:
-                item["mat_path"] = all_specs[f"{item_id}.npy"]
+            matched = mat_index.get(item.get("item_id"))
+            if matched:
+                item["mat_path"] = matched
 
     # Ensure audio roots are set for the serve_audio route
     if audio_dir and os.path.exists(audio_dir):
@@ -1868,7 +1934,12 @@ def load_verify_mode(
     data["summary"]["audio_folders_list"] = unique_audio_folders
     data["summary"]["predictions_files_list"] = unique_pred_files
     
-    print(f"DEBUG summary: mat_dirs_loaded={len(mat_dirs_loaded)}, unique={len(unique_spec_folders)}, is_multi={is_multi_selection}")
+    logger.debug(
+        "Summary folders: mat_dirs_loaded=%d, unique=%d, is_multi=%s",
+        len(mat_dirs_loaded),
+        len(unique_spec_folders),
+        is_multi_selection,
+    )
     
     if len(unique_spec_folders) > 1 and is_multi_selection:
         folder_word = "folder" if len(unique_spec_folders) == 1 else "folders"
@@ -1888,8 +1959,12 @@ def load_verify_mode(
     else:
         data["summary"]["predictions_file"] = predictions_path
 
-    # Diagnostic print
-    print(f"DEBUG: Loaded {len(data['items'])} items, active: {data['summary'].get('active_date')}/{data['summary'].get('active_hydrophone')}")
+    logger.debug(
+        "Loaded %d items, active: %s/%s",
+        len(data["items"]),
+        data["summary"].get("active_date"),
+        data["summary"].get("active_hydrophone"),
+    )
 
     return data
 
@@ -1897,8 +1972,8 @@ def load_verify_mode(
 def load_explore_mode(config: Dict, date_str: Optional[str] = None, hydrophone: Optional[str] = None) -> Dict:
     # If we are browsing a data directory, use the verify mode loading logic
     # which knows how to handle the DATE/DEVICE structure.
-    if config.get("data", {}).get("data_dir"):
-        data_dir = config.get("data", {}).get("data_dir")
+    data_dir = (config.get("data") or {}).get("data_dir")
+    if data_dir:
         data = load_verify_mode(config, date_str, hydrophone, allow_unlabeled=True)
         labels_map = _collect_hierarchical_labels_map(data_dir, date_str, hydrophone)
         if labels_map and data.get("items"):
@@ -1925,12 +2000,7 @@ def load_explore_mode(config: Dict, date_str: Optional[str] = None, hydrophone:
                 item["annotations"] = annotations
 
             summary = data.get("summary", {})
-            summary["annotated"] = sum(
-                1 for item in data.get("items", []) if (item.get("annotations") or {}).get("labels")
-            )
-            summary["verified"] = sum(
-                1 for item in data.get("items", []) if (item.get("annotations") or {}).get("verified")
-            )
+            summary["annotated"], summary["verified"] = _count_annotated_and_verified(data.get("items", []))
             data["summary"] = summary
         return data
     
@@ -1938,11 +2008,37 @@ def load_explore_mode(config: Dict, date_str: Optional[str] = None, hydrophone:
     return load_label_mode(config)
 
 
+def _predictions_cache_key(predictions_path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    if not predictions_path:
+        return None
+    try:
+        st = os.stat(predictions_path)
+    except OSError:
+        return None
+    return (os.path.abspath(predictions_path), int(st.st_mtime_ns), int(st.st_size))
+
+
 def load_whale_mode(config: Dict) -> Dict:
     # Check multiple locations for predictions path (legacy whale section or verify section)
     whale_cfg = config.get("whale", {})
     verify_cfg = config.get("verify", {})
     predictions_path = whale_cfg.get("predictions_json") or verify_cfg.get("predictions_json")
+
+    cache_key = _predictions_cache_key(predictions_path)
+    if cache_key is not None:
+        with _WHALE_MODE_CACHE_LOCK:
+            cached = whale_mode_cache.get(cache_key)
+        if cached is not None:
+            return pickle.loads(cached)
+
+    data = _load_whale_mode_uncached(predictions_path)
+    if cache_key is not None:
+        with _WHALE_MODE_CACHE_LOCK:
+            whale_mode_cache[cache_key] = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    return data
+
+
+def _load_whale_mode_uncached(predictions_path: Optional[str]) -> Dict:
     predictions_json = read_json(predictions_path) if predictions_path else {}
 
     # Get base path for resolving relative paths in predictions
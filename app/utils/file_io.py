@@ -1,10 +1,11 @@
-import json
 import os
 import tempfile
 from typing import Any, Dict, Optional
 
 from filelock import FileLock
 
+from shared.json_io import atomic_write_bytes, dumps_json, loads_json
+
 _lock_file = os.path.join(tempfile.gettempdir(), "unified_labels_lock.lock")
 _file_lock = FileLock(_lock_file)
 
@@ -12,8 +13,8 @@ _file_lock = FileLock(_lock_file)
 def read_json(path: str) -> Dict[str, Any]:
     if not path or not os.path.exists(path):
         return {}
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads_json(f.read())
 
 
 def write_json(
@@ -22,15 +23,12 @@ def write_json(
     *,
     indent: Optional[int] = 2,
     sort_keys: bool = True,
-) -> None:
+) -> bytes:
+    """Atomically write ``data`` as JSON to ``path`` and return the bytes written."""
     if not path:
         raise ValueError("path is required")
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    dump_kwargs = {"sort_keys": sort_keys}
-    if indent is None:
-        dump_kwargs["separators"] = (",", ":")
-    else:
-        dump_kwargs["indent"] = indent
+    payload = dumps_json(data, indent=indent, sort_keys=sort_keys)
     with _file_lock:
-        with open(path, "w") as f:
-            json.dump(data, f, **dump_kwargs)
+        atomic_write_bytes(path, payload)
+    return payload
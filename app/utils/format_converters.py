@@ -2,6 +2,8 @@ from datetime import datetime, timezone
 import os
 from typing import Dict, List, Optional
 
+from app.utils.file_io import read_json
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -20,62 +22,67 @@ def _build_summary(items: List[dict]) -> dict:
     return {"total_items": total, "annotated": annotated, "verified": verified}
 
 
+def _legacy_unified_item(item: dict, mat_folder: str, device_code: Optional[str]) -> dict:
+    item_id = item.get("item_id", "")
+    mat_path = (
+        item.get("spectrogram_mat_path")
+        or item.get("mat_path")
+        or item.get("spectrogram_path")
+        or os.path.join(mat_folder, f"{item_id}.mat")
+    )
+    annotations = item.get("annotations", {}) or {}
+    metadata = item.get("metadata", {}) or {}
+    return {
+        "item_id": item_id,
+        "spectrogram_path": None,
+        "mat_path": mat_path,
+        "audio_path": item.get("audio_file") or item.get("audio_path"),
+        "timestamps": {"start": metadata.get("timestamp"), "end": None},
+        "device_code": device_code,
+        "predictions": None,
+        "annotations": {
+            "labels": annotations.get("labels", []),
+            "annotated_by": annotations.get("annotated_by"),
+            "annotated_at": annotations.get("annotated_at"),
+            "verified": False,
+            "notes": annotations.get("notes", ""),
+        },
+        "metadata": metadata,
+    }
+
+
+def _legacy_filename_item(filename: str, labels, mat_folder: str) -> dict:
+    return {
+        "item_id": filename,
+        "spectrogram_path": None,
+        "mat_path": os.path.join(mat_folder, filename),
+        "audio_path": None,
+        "timestamps": {"start": None, "end": None},
+        "device_code": None,
+        "predictions": None,
+        "annotations": {
+            "labels": labels if isinstance(labels, list) else [],
+            "annotated_by": None,
+            "annotated_at": None,
+            "verified": False,
+            "notes": "",
+        },
+        "metadata": {},
+    }
+
+
 def convert_legacy_labeling_to_unified(labels_json: dict, mat_folder: str) -> dict:
-    items = []
-    
     # Check if this is already in unified format (has 'items' array)
     if "items" in labels_json and isinstance(labels_json["items"], list):
         # New unified format - parse the items from the array
-        for item in labels_json["items"]:
-            item_id = item.get("item_id", "")
-            mat_path = (
-                item.get("spectrogram_mat_path")
-                or item.get("mat_path")
-                or item.get("spectrogram_path")
-                or os.path.join(mat_folder, f"{item_id}.mat")
-            )
-            audio_path = item.get("audio_file") or item.get("audio_path")
-            annotations = item.get("annotations", {}) or {}
-            metadata = item.get("metadata", {}) or {}
-            
-            items.append({
-                "item_id": item_id,
-                "spectrogram_path": None,
-                "mat_path": mat_path,
-                "audio_path": audio_path,
-                "timestamps": {"start": metadata.get("timestamp"), "end": None},
-                "device_code": labels_json.get("data_source", {}).get("device_code"),
-                "predictions": None,
-                "annotations": {
-                    "labels": annotations.get("labels", []),
-                    "annotated_by": annotations.get("annotated_by"),
-                    "annotated_at": annotations.get("annotated_at"),
-                    "verified": False,
-                    "notes": annotations.get("notes", ""),
-                },
-                "metadata": metadata,
-            })
+        device_code = labels_json.get("data_source", {}).get("device_code")
+        items = [_legacy_unified_item(item, mat_folder, device_code) for item in labels_json["items"]]
     else:
         # Legacy format - keys are filenames, values are label arrays
-        for filename, labels in labels_json.items():
-            mat_path = os.path.join(mat_folder, filename)
-            items.append({
-                "item_id": filename,
-                "spectrogram_path": None,
-                "mat_path": mat_path,
-                "audio_path": None,
-                "timestamps": {"start": None, "end": None},
-                "device_code": None,
-                "predictions": None,
-                "annotations": {
-                    "labels": labels if isinstance(labels, list) else [],
-                    "annotated_by": None,
-                    "annotated_at": None,
-                    "verified": False,
-                    "notes": "",
-                },
-                "metadata": {},
-            })
+        items = [
+            _legacy_filename_item(filename, labels, mat_folder)
+            for filename, labels in labels_json.items()
+        ]
 
     return {
         "version": "2.0",
@@ -86,45 +93,54 @@ def convert_legacy_labeling_to_unified(labels_json: dict, mat_folder: str) -> di
     }
 
 
+def _hydrophonedashboard_item(filename: str, entry, hydrophone: str, image_dir: str) -> dict:
+    if isinstance(entry, list):
+        predicted = entry
+        probabilities = {}
+        verified = None
+        notes = ""
+        t0 = ""
+        t1 = ""
+        annotated_by = None
+        annotated_at = None
+    else:
+        predicted = entry.get("predicted_labels", [])
+        probabilities = entry.get("probabilities", {})
+        verified = entry.get("verified_labels")
+        notes = entry.get("notes", "")
+        t0 = entry.get("t0")
+        t1 = entry.get("t1")
+        annotated_by = entry.get("verified_by")
+        annotated_at = entry.get("verified_at")
+
+    return {
+        "item_id": filename,
+        "spectrogram_path": os.path.join(image_dir, filename),
+        "mat_path": None,
+        "audio_path": None,
+        "timestamps": {"start": t0, "end": t1},
+        "device_code": hydrophone,
+        "predictions": {
+            "labels": predicted,
+            "confidence": probabilities,
+            "model_id": None,
+        },
+        "annotations": {
+            "labels": verified or [],
+            "annotated_by": annotated_by,
+            "annotated_at": annotated_at,
+            "verified": verified is not None,
+            "notes": notes,
+        },
+        "metadata": {},
+    }
+
+
 def convert_hydrophonedashboard_to_unified(labels_json: dict, date: str, hydrophone: str, image_dir: str) -> dict:
-    items = []
-    for filename, entry in labels_json.items():
-        if isinstance(entry, list):
-            predicted = entry
-            probabilities = {}
-            verified = None
-            notes = ""
-            t0 = ""
-            t1 = ""
-        else:
-            predicted = entry.get("predicted_labels", [])
-            probabilities = entry.get("probabilities", {})
-            verified = entry.get("verified_labels")
-            notes = entry.get("notes", "")
-            t0 = entry.get("t0")
-            t1 = entry.get("t1")
-
-        items.append({
-            "item_id": filename,
-            "spectrogram_path": os.path.join(image_dir, filename),
-            "mat_path": None,
-            "audio_path": None,
-            "timestamps": {"start": t0, "end": t1},
-            "device_code": hydrophone,
-            "predictions": {
-                "labels": predicted,
-                "confidence": probabilities,
-                "model_id": None,
-            },
-            "annotations": {
-                "labels": verified or [],
-                "annotated_by": entry.get("verified_by") if isinstance(entry, dict) else None,
-                "annotated_at": entry.get("verified_at") if isinstance(entry, dict) else None,
-                "verified": verified is not None,
-                "notes": notes,
-            },
-            "metadata": {},
-        })
+    items = [
+        _hydrophonedashboard_item(filename, entry, hydrophone, image_dir)
+        for filename, entry in labels_json.items()
+    ]
 
     return {
         "version": "2.0",
@@ -139,8 +155,44 @@ def convert_hydrophonedashboard_to_unified(labels_json: dict, date: str, hydroph
     }
 
 
+def convert_hydrophonedashboard_file_to_unified(labels_path: str, date: str, hydrophone: str, image_dir: str) -> dict:
+    """Parse ``labels_path`` (orjson when installed) and convert it; a missing file yields no items."""
+    return convert_hydrophonedashboard_to_unified(read_json(labels_path), date, hydrophone, image_dir)
+
+
+def _whale_prediction_item(entry: dict, model_id: Optional[str], device_code: Optional[str]) -> Optional[dict]:
+    item_id = entry.get("item_id") or entry.get("file_id") or entry.get("segment_id")
+    if not item_id:
+        return None
+    max_confidence = entry.get("max_confidence")
+    confidence_value = max_confidence if max_confidence is not None else entry.get("confidence", 0)
+
+    metadata = {}
+    if "windows" in entry:
+        metadata["windows"] = entry.get("windows", [])
+    if "num_positive" in entry:
+        metadata["num_positive"] = entry.get("num_positive", {})
+
+    return {
+        "item_id": item_id,
+        "spectrogram_path": entry.get("spectrogram_png_path") or entry.get("spectrogram_path"),
+        "mat_path": entry.get("spectrogram_mat_path") or entry.get("mat_path"),
+        "audio_path": entry.get("audio_path"),
+        "timestamps": {"start": entry.get("audio_timestamp"), "end": None},
+        "device_code": device_code,
+        "predictions": {
+            "labels": ["Biophony > Marine mammal > Cetacean > Baleen whale > Fin whale"]
+            if max_confidence is not None and confidence_value > 0.5 else [],
+            "confidence": {"Fin whale": confidence_value}
+            if max_confidence is not None else {"confidence": confidence_value},
+            "model_id": model_id,
+        },
+        "annotations": None,
+        "metadata": metadata,
+    }
+
+
 def convert_whale_predictions_to_unified(predictions_json: dict) -> dict:
-    items = []
     model = predictions_json.get("model", {})
     data_source = predictions_json.get("data_source", {})
 
@@ -150,36 +202,13 @@ def convert_whale_predictions_to_unified(predictions_json: dict) -> dict:
     if not entries:
         entries = predictions_json.get("segments")
 
-    for entry in entries or []:
-        max_confidence = entry.get("max_confidence")
-        confidence_value = max_confidence if max_confidence is not None else entry.get("confidence", 0)
-        item_id = entry.get("item_id") or entry.get("file_id") or entry.get("segment_id")
-        if not item_id:
-            continue
-
-        metadata = {}
-        if "windows" in entry:
-            metadata["windows"] = entry.get("windows", [])
-        if "num_positive" in entry:
-            metadata["num_positive"] = entry.get("num_positive", {})
-
-        items.append({
-            "item_id": item_id,
-            "spectrogram_path": entry.get("spectrogram_png_path") or entry.get("spectrogram_path"),
-            "mat_path": entry.get("spectrogram_mat_path") or entry.get("mat_path"),
-            "audio_path": entry.get("audio_path"),
-            "timestamps": {"start": entry.get("audio_timestamp"), "end": None},
-            "device_code": data_source.get("device_code"),
-            "predictions": {
-                "labels": ["Biophony > Marine mammal > Cetacean > Baleen whale > Fin whale"]
-                if max_confidence is not None and confidence_value > 0.5 else [],
-                "confidence": {"Fin whale": confidence_value}
-                if max_confidence is not None else {"confidence": confidence_value},
-                "model_id": model.get("model_id"),
-            },
-            "annotations": None,
-            "metadata": metadata,
-        })
+    model_id = model.get("model_id")
+    device_code = data_source.get("device_code")
+    items = [
+        item
+        for item in (_whale_prediction_item(entry, model_id, device_code) for entry in entries or [])
+        if item is not None
+    ]
 
     return {
         "version": "2.0",
@@ -1,5 +1,7 @@
 import base64
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 from io import BytesIO
 import logging
 import math
@@ -8,25 +10,20 @@ import re
 import threading
 from typing import Any, Callable, Dict, Optional, Tuple
 
-import matplotlib
-matplotlib.use("Agg")
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-import matplotlib.colors as mcolors
-from matplotlib.figure import Figure
 import numpy as np
 import plotly.graph_objects as go
-import scipy.io as sio
-import scipy.signal as scipy_signal
 import soundfile as sf
 from cachetools import LRUCache
 from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
 try:
     import torch
 except Exception:  # pragma: no cover - defensive fallback for broken installs
     torch = None
 
 from app.utils.colmap_hyd import colmap_hyd_py
-from app.defaults import DEFAULT_CACHE_MAX_SIZE
+from app.utils.file_io import atomic_write_bytes
+from app.defaults import DEFAULT_CACHE_MAX_SIZE, DEFAULT_THUMBNAIL_CACHE_MAX_MB
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +47,12 @@ DEFAULT_SPECTROGRAM_RENDER_SETTINGS: Dict[str, Any] = {
     "freq_min_hz": 5.0,
     "freq_max_hz": 100.0,
 }
+# Rendered MAT thumbnails persist here across restarts and LRU evictions when
+# cache.thumbnail_dir is configured (see set_thumbnail_disk_cache). Bump
+# THUMBNAIL_RENDER_VERSION when the PNG output changes.
+THUMBNAIL_DISK_CACHE_DIR: Optional[str] = None
+THUMBNAIL_DISK_CACHE_MAX_BYTES = DEFAULT_THUMBNAIL_CACHE_MAX_MB * 1024 * 1024
+THUMBNAIL_RENDER_VERSION = 2
 _TORCH_MISSING_WARNED = False
 _AUDIO_FALLBACK_WARNED = set()
 _PREFETCH_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
@@ -59,10 +62,12 @@ _PREFETCH_LOCK = threading.Lock()
 _AUDIO_SPECTROGRAM_CACHE_LOCK = threading.Lock()
 _SPECTROGRAM_CACHE_LOCK = threading.Lock()
 _IMAGE_CACHE_LOCK = threading.Lock()
-_MATPLOTLIB_RENDER_LOCK = threading.Lock()
 _AUDIO_SPECTROGRAM_INFLIGHT = {}
 _SPECTROGRAM_INFLIGHT = {}
 _IMAGE_INFLIGHT = {}
+_THUMBNAIL_DISK_CACHE_LOCK = threading.Lock()
+_THUMBNAIL_DISK_CACHE_USAGE: Dict[str, int] = {}
+_THUMBNAIL_DISK_CACHE_LOW_WATER = 0.9
 
 
 def _get_or_compute_cached(
@@ -133,6 +138,19 @@ def set_cache_sizes(maxsize: int) -> None:
         _resize_cache(image_cache, maxsize * 2)
 
 
+def set_thumbnail_disk_cache(directory: Optional[str], max_mb: Any = DEFAULT_THUMBNAIL_CACHE_MAX_MB) -> None:
+    """Enable the on-disk thumbnail cache in ``directory``, or disable it with None."""
+    global THUMBNAIL_DISK_CACHE_DIR, THUMBNAIL_DISK_CACHE_MAX_BYTES
+    try:
+        max_mb = max(0, int(max_mb))
+    except (TypeError, ValueError):
+        max_mb = DEFAULT_THUMBNAIL_CACHE_MAX_MB
+    with _THUMBNAIL_DISK_CACHE_LOCK:
+        THUMBNAIL_DISK_CACHE_DIR = directory or None
+        THUMBNAIL_DISK_CACHE_MAX_BYTES = max_mb * 1024 * 1024
+        _THUMBNAIL_DISK_CACHE_USAGE.clear()
+
+
 def _coerce_float(value: Any, fallback: float, *, minimum: Optional[float] = None, maximum: Optional[float] = None) -> float:
     try:
         value = float(value)
@@ -256,13 +274,34 @@ def _prepare_spectrogram_plot_axes(spectrogram_data: Dict[str, np.ndarray]) -> D
     }
 
 
+def _min_max_and_percentiles(values: np.ndarray, percentiles: Tuple[float, ...]) -> Tuple[float, float, list]:
+    """Return min, max and linearly interpolated percentiles of a 1-D array.
+
+    Matches ``np.percentile``'s default method but gets every order statistic
+    from a single in-place ``partition`` of ``values`` (which is reordered).
+    """
+    last = values.size - 1
+    positions = [p / 100.0 * last for p in percentiles]
+    ranks = set()
+    for pos in positions:
+        ranks.add(int(math.floor(pos)))
+        ranks.add(min(int(math.floor(pos)) + 1, last))
+    values.partition(sorted(ranks | {0, last}))
+
+    interpolated = []
+    for pos in positions:
+        lower = int(math.floor(pos))
+        upper = min(lower + 1, last)
+        low_value = float(values[lower])
+        interpolated.append(low_value + (float(values[upper]) - low_value) * (pos - lower))
+    return float(values[0]), float(values[last]), interpolated
+
+
 def _compute_color_limit_summary(psd: np.ndarray) -> Dict[str, float]:
-    psd_valid = psd[np.isfinite(psd)]
+    # Boolean indexing copies, so the partition below cannot disturb ``psd``.
+    psd_valid = np.asarray(psd)[np.isfinite(psd)]
     if len(psd_valid) > 0:
-        data_min = float(np.min(psd_valid))
-        data_max = float(np.max(psd_valid))
-        auto_min = float(np.percentile(psd_valid, 2))
-        auto_max = float(np.percentile(psd_valid, 98))
+        data_min, data_max, (auto_min, auto_max) = _min_max_and_percentiles(psd_valid, (2, 98))
         if auto_max - auto_min < 0.1:
             auto_min = data_min
             auto_max = data_max
@@ -283,6 +322,20 @@ def _compute_color_limit_summary(psd: np.ndarray) -> Dict[str, float]:
     }
 
 
+def _spectrogram_color_summary(spectrogram_data: Dict[str, Any], psd: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """Return the PSD colour-limit summary, memoised on the spectrogram dict.
+
+    Cached spectrogram dicts are shared across renders, so the percentile
+    pass runs once per cache entry rather than once per thumbnail, modal
+    figure and display-range lookup.
+    """
+    summary = spectrogram_data.get("_color_summary")
+    if summary is None:
+        summary = _compute_color_limit_summary(psd if psd is not None else np.asarray(spectrogram_data["psd"]))
+        spectrogram_data["_color_summary"] = summary
+    return summary
+
+
 def summarize_spectrogram_display_ranges(
     spectrogram_data: Optional[Dict[str, np.ndarray]],
 ) -> Dict[str, float]:
@@ -306,7 +359,7 @@ def summarize_spectrogram_display_ranges(
     else:
         freq_positive_min_plot = 0.001 if plot_axes["y_unit"] == "kHz" else 0.1
 
-    color_summary = _compute_color_limit_summary(np.asarray(plot_axes["psd"]))
+    color_summary = _spectrogram_color_summary(spectrogram_data, np.asarray(plot_axes["psd"]))
     y_to_hz = float(plot_axes["y_to_hz"])
 
     return {
@@ -400,9 +453,26 @@ def _resolve_y_axis_window(
     }
 
 
+_MAT_VARIABLE_NAMES = ("PdB_norm", "P", "F", "T", "SpectData")
+
+
+def _as_psd_float32(psd: np.ndarray) -> np.ndarray:
+    """Return ``psd`` as a C-ordered float32 array, matching audio-generated spectrograms.
+
+    loadmat yields column-major float64; every later pass (percentiles,
+    resampling, figure serialisation) is memory-bound, so one conversion
+    here halves the bytes they move. dB values need nowhere near float64's
+    precision or range.
+    """
+    return np.ascontiguousarray(psd, dtype=np.float32)
+
+
 def _load_mat(mat_path: str):
+    import scipy.io as sio
+
     try:
-        mat_data = sio.loadmat(mat_path)
+        # Only decode the variables read below; other variables in the file are skipped.
+        mat_data = sio.loadmat(mat_path, variable_names=_MAT_VARIABLE_NAMES)
     except Exception as exc:
         logger.error("Error loading %s: %s", mat_path, exc)
         return None
@@ -414,29 +484,33 @@ def _load_mat(mat_path: str):
         time = mat_data.get("T", np.array([[0]]))
         
         # Handle different array shapes
-        psd = np.squeeze(psd)
+        psd = _as_psd_float32(np.squeeze(psd))
         freq = np.squeeze(freq)
         time = np.squeeze(time)
         
-        # Handle NaN and inf values
-        psd = np.nan_to_num(psd, nan=0.0, neginf=0.0, posinf=0.0)
+        # Handle NaN and inf values (in place: the float32 copy is ours)
+        psd = np.nan_to_num(psd, copy=False, nan=0.0, neginf=0.0, posinf=0.0)
         
         return {"psd": psd, "freq": freq, "time": time}
 
     # Try ONC SpectData format
     if "SpectData" in mat_data:
         data = mat_data["SpectData"]
-        psd = data["PSD"][0, 0]
+        psd = _as_psd_float32(data["PSD"][0, 0])
         freq = data["frequency"][0, 0].flatten()
         time = data["time"][0, 0].flatten()
 
-        valid_mask = (psd != -np.inf)
-        psd[~valid_mask] = 0
-        psd = np.nan_to_num(psd, nan=0.0)
+        # -inf (silent bins) and NaN become 0 in one in-place pass; +inf keeps
+        # nan_to_num's default of the largest finite value.
+        psd = np.nan_to_num(psd, copy=False, nan=0.0, neginf=0.0)
 
         return {"psd": psd, "freq": freq, "time": time}
     
-    logger.warning("Unknown MAT format for %s, keys: %s", mat_path, list(mat_data.keys()))
+    try:
+        variable_names = [name for name, _shape, _cls in sio.whosmat(mat_path)]
+    except Exception:
+        variable_names = list(mat_data.keys())
+    logger.warning("Unknown MAT format for %s, keys: %s", mat_path, variable_names)
     return None
 
 
@@ -481,6 +555,8 @@ def _downsample_audio_for_requested_band(
     common = math.gcd(int(sample_rate), target_rate)
     up = target_rate // common
     down = int(sample_rate) // common
+    import scipy.signal as scipy_signal
+
     try:
         downsampled = scipy_signal.resample_poly(audio, up, down)
     except Exception as exc:
@@ -490,6 +566,12 @@ def _downsample_audio_for_requested_band(
     return np.asarray(downsampled, dtype=np.float32), target_rate
 
 
+@lru_cache(maxsize=8)
+def _hann_window(win_len: int):
+    """Periodic Hann window for ``torch.stft``, built once per window length."""
+    return torch.hann_window(win_len, periodic=True, dtype=torch.float32, device="cpu")
+
+
 def _load_audio_spectrogram_torch(
     audio_path: str,
     *,
@@ -533,7 +615,7 @@ def _load_audio_spectrogram_torch(
         audio = np.pad(audio, (0, win_len - audio.size), mode="constant", constant_values=0.0)
 
     audio_t = torch.from_numpy(audio).to(dtype=torch.float32, device="cpu")
-    window_t = torch.hann_window(win_len, periodic=True, dtype=torch.float32, device="cpu")
+    window_t = _hann_window(win_len)
 
     with torch.inference_mode():
         spec_complex = torch.stft(
@@ -581,6 +663,8 @@ def _with_render_source(
 ) -> Optional[Dict[str, np.ndarray]]:
     if spec is None:
         return None
+    # Memoise on the cached dict before copying so the summary outlives this copy.
+    _spectrogram_color_summary(spec)
     out = dict(spec)
     out["_render_source"] = str(source)
     if reason:
@@ -1179,12 +1263,12 @@ def generate_image_cached(
         _display_limit_cache_token(color_min),
         _display_limit_cache_token(color_max),
     )
-    return _get_or_compute_cached(
+    png = _get_or_compute_cached(
         image_cache,
         cache_key,
         _IMAGE_CACHE_LOCK,
         _IMAGE_INFLIGHT,
-        lambda: _generate_image(
+        lambda: _generate_image_png(
             mat_path,
             colormap,
             y_axis_scale,
@@ -1194,6 +1278,7 @@ def generate_image_cached(
             color_max=color_max,
         ),
     )
+    return _png_data_uri(png) if png is not None else None
 
 
 def _generate_image(
@@ -1206,10 +1291,46 @@ def _generate_image(
     color_min: Any = None,
     color_max: Any = None,
 ):
+    png = _generate_image_png(
+        mat_path,
+        colormap,
+        y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+        color_min=color_min,
+        color_max=color_max,
+    )
+    return _png_data_uri(png) if png is not None else None
+
+
+def _generate_image_png(
+    mat_path: str,
+    colormap: str = "default",
+    y_axis_scale: str = "linear",
+    *,
+    y_axis_min_hz: Any = None,
+    y_axis_max_hz: Any = None,
+    color_min: Any = None,
+    color_max: Any = None,
+) -> Optional[bytes]:
+    disk_path = _thumbnail_disk_cache_path(
+        mat_path,
+        colormap,
+        y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+        color_min=color_min,
+        color_max=color_max,
+    )
+    if disk_path is not None:
+        cached_png = _read_thumbnail_disk_cache(disk_path)
+        if cached_png is not None:
+            return cached_png
+
     spectrogram = load_spectrogram_cached(mat_path)
     if spectrogram is None:
         return None
-    return _generate_image_from_spectrogram_data(
+    png = _render_thumbnail_png(
         spectrogram,
         colormap=colormap,
         y_axis_scale=y_axis_scale,
@@ -1218,6 +1339,121 @@ def _generate_image(
         color_min=color_min,
         color_max=color_max,
     )
+    if png is not None and disk_path is not None:
+        _write_thumbnail_disk_cache(disk_path, png)
+    return png
+
+
+def _read_thumbnail_disk_cache(disk_path: str) -> Optional[bytes]:
+    try:
+        with open(disk_path, "rb") as handle:
+            cached_png = handle.read()
+        if cached_png:
+            # Eviction drops the oldest mtimes first, so a hit marks the file as recent.
+            os.utime(disk_path)
+            return cached_png
+    except OSError:
+        pass
+    return None
+
+
+def _write_thumbnail_disk_cache(disk_path: str, png: bytes) -> None:
+    cache_dir = os.path.dirname(os.path.dirname(disk_path))
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        os.makedirs(os.path.dirname(disk_path), mode=0o700, exist_ok=True)
+        atomic_write_bytes(disk_path, png)
+        _record_thumbnail_disk_write(cache_dir, len(png))
+    except OSError as exc:
+        logger.debug("Could not write thumbnail cache %s: %s", disk_path, exc)
+
+
+def _scan_thumbnail_disk_cache(cache_dir: str) -> list:
+    """Return ``(mtime_ns, size, path)`` for every cached PNG under ``cache_dir``."""
+    entries = []
+    with os.scandir(cache_dir) as buckets:
+        for bucket in buckets:
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(bucket.path) as files:
+                for entry in files:
+                    if not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    return entries
+
+
+def _record_thumbnail_disk_write(cache_dir: str, size: int) -> None:
+    """Account for a new cache file and drop the oldest ones past the size bound.
+
+    The directory is only scanned on the first write and when the bound is
+    exceeded; other writes just add to the running total. Eviction goes down
+    to a low-water mark below the bound, so a full cache is rescanned once
+    per batch of writes rather than on every one.
+    """
+    with _THUMBNAIL_DISK_CACHE_LOCK:
+        usage = _THUMBNAIL_DISK_CACHE_USAGE.get(cache_dir)
+        if usage is None:
+            usage = sum(entry[1] for entry in _scan_thumbnail_disk_cache(cache_dir))
+        else:
+            usage += size
+        if usage > THUMBNAIL_DISK_CACHE_MAX_BYTES:
+            entries = sorted(_scan_thumbnail_disk_cache(cache_dir))
+            usage = sum(entry[1] for entry in entries)
+            low_water = int(THUMBNAIL_DISK_CACHE_MAX_BYTES * _THUMBNAIL_DISK_CACHE_LOW_WATER)
+            for _mtime_ns, entry_size, entry_path in entries:
+                if usage <= low_water:
+                    break
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    continue
+                usage -= entry_size
+        _THUMBNAIL_DISK_CACHE_USAGE[cache_dir] = usage
+
+
+def _thumbnail_disk_cache_path(
+    mat_path: str,
+    colormap: str,
+    y_axis_scale: str,
+    *,
+    y_axis_min_hz: Any = None,
+    y_axis_max_hz: Any = None,
+    color_min: Any = None,
+    color_max: Any = None,
+) -> Optional[str]:
+    """Return the on-disk PNG path for a MAT thumbnail, or None when disabled.
+
+    The key covers the source file's mtime and size plus every render
+    parameter, so edits to the file or display settings never hit stale
+    entries. ``THUMBNAIL_RENDER_VERSION`` invalidates the whole cache when the
+    renderer output changes.
+    """
+    if not THUMBNAIL_DISK_CACHE_DIR or not mat_path:
+        return None
+    source_path = os.path.abspath(mat_path)
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    key_parts = (
+        THUMBNAIL_RENDER_VERSION,
+        source_path,
+        st.st_mtime_ns,
+        st.st_size,
+        colormap,
+        y_axis_scale,
+        _display_limit_cache_token(y_axis_min_hz),
+        _display_limit_cache_token(y_axis_max_hz),
+        _display_limit_cache_token(color_min),
+        _display_limit_cache_token(color_max),
+    )
+    cache_key = hashlib.sha256("|".join(map(str, key_parts)).encode("utf-8")).hexdigest()
+    return os.path.join(THUMBNAIL_DISK_CACHE_DIR, cache_key[:2], f"{cache_key}.png")
 
 
 def generate_item_image_cached(
@@ -1231,6 +1467,31 @@ def generate_item_image_cached(
     color_min: Any = None,
     color_max: Any = None,
 ) -> Optional[str]:
+    png = generate_item_image_png_cached(
+        item,
+        cfg,
+        colormap=colormap,
+        y_axis_scale=y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+        color_min=color_min,
+        color_max=color_max,
+    )
+    return _png_data_uri(png) if png is not None else None
+
+
+def generate_item_image_png_cached(
+    item: Optional[Dict[str, Any]],
+    cfg: Optional[Dict[str, Any]],
+    *,
+    colormap: str = "default",
+    y_axis_scale: str = "linear",
+    y_axis_min_hz: Any = None,
+    y_axis_max_hz: Any = None,
+    color_min: Any = None,
+    color_max: Any = None,
+) -> Optional[bytes]:
+    """Like ``generate_item_image_cached`` but returns the raw PNG bytes held in ``image_cache``."""
     cache_key = _item_image_generation_key(
         item,
         cfg,
@@ -1243,10 +1504,29 @@ def generate_item_image_cached(
     )
 
     def _resolve_and_render():
+        # Thumbnails of existing MAT spectrograms share the on-disk cache
+        # with generate_image_cached; audio-generated ones are not persisted.
+        disk_path = None
+        source_key = cache_key[1]
+        if source_key[0] == "mat":
+            disk_path = _thumbnail_disk_cache_path(
+                source_key[1],
+                colormap,
+                y_axis_scale,
+                y_axis_min_hz=y_axis_min_hz,
+                y_axis_max_hz=y_axis_max_hz,
+                color_min=color_min,
+                color_max=color_max,
+            )
+            if disk_path is not None:
+                cached_png = _read_thumbnail_disk_cache(disk_path)
+                if cached_png is not None:
+                    return cached_png
+
         spectrogram, _ = resolve_item_spectrogram_with_key(item, cfg)
         if spectrogram is None:
             return None
-        return _generate_image_from_spectrogram_data(
+        png = _render_thumbnail_png(
             spectrogram,
             colormap=colormap,
             y_axis_scale=y_axis_scale,
@@ -1255,6 +1535,9 @@ def generate_item_image_cached(
             color_min=color_min,
             color_max=color_max,
         )
+        if png is not None and disk_path is not None:
+            _write_thumbnail_disk_cache(disk_path, png)
+        return png
 
     if cache_key is not None:
         return _get_or_compute_cached(
@@ -1283,7 +1566,7 @@ def generate_item_image_cached(
         cache_key,
         _IMAGE_CACHE_LOCK,
         _IMAGE_INFLIGHT,
-        lambda: _generate_image_from_spectrogram_data(
+        lambda: _render_thumbnail_png(
             spectrogram,
             colormap=colormap,
             y_axis_scale=y_axis_scale,
@@ -1295,6 +1578,111 @@ def generate_item_image_cached(
     )
 
 
+THUMBNAIL_SIZE_PX = 108
+
+
+@lru_cache(maxsize=1)
+def _hydrophone_colorscale() -> Tuple[Tuple[float, str], ...]:
+    """Plotly colorscale for the hydrophone colormap, built once per process."""
+    cmap_array = colmap_hyd_py(36, 3)
+    return tuple(
+        (i / (len(cmap_array) - 1), f"rgb({int(r*255)},{int(g*255)},{int(b*255)})")
+        for i, (r, g, b) in enumerate(cmap_array)
+    )
+
+
+@lru_cache(maxsize=8)
+def _colormap_lut(colormap: str) -> np.ndarray:
+    """RGBA uint8 lookup table matching the matplotlib colormap used for thumbnails."""
+    # matplotlib is only needed to build the table, so it is imported on first use.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.colors as mcolors
+
+    if colormap == "hydrophone":
+        cmap = mcolors.ListedColormap(colmap_hyd_py(36, 3))
+    else:
+        cmap = matplotlib.colormaps["viridis"]
+    lut = np.round(cmap(np.arange(cmap.N)) * 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+def _box_resample(values: np.ndarray, lo: np.ndarray, hi: np.ndarray, axis: int) -> np.ndarray:
+    """Average ``values`` along ``axis`` over the fractional source spans ``[lo, hi)``.
+
+    Spans wider than one source bin are box-averaged (ignoring NaNs) like the
+    antialiasing matplotlib applies when shrinking; narrower spans pick the
+    covering bin. Spans that miss the data entirely come back as NaN.
+    """
+    size = values.shape[axis]
+    span_lo = np.minimum(lo, hi)
+    span_hi = np.maximum(lo, hi)
+    outside = (span_hi <= 0) | (span_lo >= size)
+    start = np.clip(np.floor(span_lo), 0, size - 1).astype(np.intp)
+    stop = np.clip(np.ceil(span_hi), start + 1, size).astype(np.intp)
+
+    finite = np.isfinite(values)
+    zero_pad = [(0, 0)] * values.ndim
+    zero_pad[axis] = (1, 0)
+    sums = np.pad(np.cumsum(np.where(finite, values, 0.0), axis=axis), zero_pad)
+    counts = np.pad(np.cumsum(finite, axis=axis), zero_pad)
+
+    total = np.take(sums, stop, axis=axis) - np.take(sums, start, axis=axis)
+    count = np.take(counts, stop, axis=axis) - np.take(counts, start, axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        resampled = total / count
+    resampled[count == 0] = np.nan
+    mask_shape = [1] * values.ndim
+    mask_shape[axis] = -1
+    return np.where(outside.reshape(mask_shape), np.nan, resampled)
+
+
+def _render_thumbnail_rgba(
+    psd: np.ndarray,
+    *,
+    row_extent: Tuple[float, float],
+    y_limits: Tuple[float, float],
+    log_y: bool,
+    vmin: float,
+    vmax: float,
+    colormap: str,
+) -> np.ndarray:
+    """Rasterize ``psd`` the way ``imshow(origin="lower", aspect="auto")`` lays it out.
+
+    Columns span the full width; rows are placed uniformly across
+    ``row_extent`` in data units and cropped to ``y_limits`` on a linear or
+    log axis. NaNs and the area outside the data stay transparent.
+    """
+    size = THUMBNAIL_SIZE_PX
+    n_rows, n_cols = psd.shape
+    values = np.asarray(psd, dtype=np.float64)
+
+    col_edges = np.linspace(0.0, n_cols, size + 1)
+    values = _box_resample(values, col_edges[:-1], col_edges[1:], axis=1)
+
+    # Pixel row edges from the top of the image down, in data units.
+    y_low, y_high = y_limits
+    if log_y:
+        y_edges = np.logspace(np.log10(y_high), np.log10(y_low), size + 1)
+    else:
+        y_edges = np.linspace(y_high, y_low, size + 1)
+    extent_low, extent_high = row_extent
+    if extent_high != extent_low:
+        row_edges = (y_edges - extent_low) / (extent_high - extent_low) * n_rows
+    else:
+        row_edges = np.linspace(n_rows, 0.0, size + 1)
+    values = _box_resample(values, row_edges[:-1], row_edges[1:], axis=0)
+
+    lut = _colormap_lut(colormap)
+    invalid = ~np.isfinite(values)
+    normalized = (np.where(invalid, vmin, values) - vmin) / (vmax - vmin)
+    indices = np.clip((normalized * len(lut)).astype(np.intp), 0, len(lut) - 1)
+    rgba = lut[indices]
+    rgba[invalid] = 0
+    return rgba
+
+
 def _generate_image_from_spectrogram_data(
     spectrogram: Dict[str, np.ndarray],
     colormap: str = "default",
@@ -1305,101 +1693,128 @@ def _generate_image_from_spectrogram_data(
     color_min: Any = None,
     color_max: Any = None,
 ) -> Optional[str]:
+    png = _render_thumbnail_png(
+        spectrogram,
+        colormap=colormap,
+        y_axis_scale=y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+        color_min=color_min,
+        color_max=color_max,
+    )
+    return _png_data_uri(png) if png is not None else None
+
+
+def _png_data_uri(png: bytes) -> str:
+    data = base64.b64encode(png).decode("utf8")
+    return f"data:image/png;base64,{data}"
+
+
+def _render_thumbnail_png(
+    spectrogram: Dict[str, np.ndarray],
+    colormap: str = "default",
+    y_axis_scale: str = "linear",
+    *,
+    y_axis_min_hz: Any = None,
+    y_axis_max_hz: Any = None,
+    color_min: Any = None,
+    color_max: Any = None,
+) -> Optional[bytes]:
     if spectrogram is None:
         return None
 
-    with _MATPLOTLIB_RENDER_LOCK:
-        fig = Figure(figsize=(1.5, 1.5), facecolor="none")
-        FigureCanvasAgg(fig)
-        ax = fig.add_subplot(111)
-
-        if colormap == "hydrophone":
-            cmap_array = colmap_hyd_py(36, 3)
-            cmap = mcolors.ListedColormap(cmap_array)
-        else:
-            cmap = "viridis"
-
-        plot_axes = _prepare_spectrogram_plot_axes(spectrogram)
-        psd = plot_axes["psd"]
-        time_plot = plot_axes["time_plot"]
-        freq_plot = np.asarray(plot_axes["freq_plot"], dtype=np.float64)
-        color_summary = _compute_color_limit_summary(psd)
-        vmin, vmax = _resolve_color_limits(
-            color_min=color_min,
-            color_max=color_max,
-            auto_min=color_summary["auto_min"],
-            auto_max=color_summary["auto_max"],
-        )
-        y_window = _resolve_y_axis_window(
-            freq_plot=freq_plot,
-            y_to_hz=plot_axes["y_to_hz"],
-            y_unit=plot_axes["y_unit"],
-            y_axis_scale=y_axis_scale,
-            y_axis_min_hz=y_axis_min_hz,
-            y_axis_max_hz=y_axis_max_hz,
+    plot_axes = _prepare_spectrogram_plot_axes(spectrogram)
+    psd = np.asarray(plot_axes["psd"])
+    if psd.ndim != 2 or psd.size == 0:
+        return None
+    freq_plot = np.asarray(plot_axes["freq_plot"], dtype=np.float64)
+    color_summary = _spectrogram_color_summary(spectrogram, psd)
+    vmin, vmax = _resolve_color_limits(
+        color_min=color_min,
+        color_max=color_max,
+        auto_min=color_summary["auto_min"],
+        auto_max=color_summary["auto_max"],
+    )
+    y_window = _resolve_y_axis_window(
+        freq_plot=freq_plot,
+        y_to_hz=plot_axes["y_to_hz"],
+        y_unit=plot_axes["y_unit"],
+        y_axis_scale=y_axis_scale,
+        y_axis_min_hz=y_axis_min_hz,
+        y_axis_max_hz=y_axis_max_hz,
+    )
+    display_limits = (y_window["display_min_plot"], y_window["display_max_plot"])
+    log_y = False
+
+    if y_axis_scale == "log" and np.any(freq_plot > 0):
+        valid_freq_mask = freq_plot > 0
+        freq_for_plot = freq_plot[valid_freq_mask]
+        psd = psd[valid_freq_mask, :]
+        row_extent = (float(freq_for_plot[0]), float(freq_for_plot[-1]))
+        y_limits = display_limits
+        log_y = True
+    else:
+        row_extent = (
+            float(freq_plot[0]) if len(freq_plot) > 0 else 0.0,
+            float(freq_plot[-1]) if len(freq_plot) > 0 else 1.0,
         )
+        # A log request without positive frequencies keeps the full linear extent.
+        y_limits = tuple(sorted(row_extent)) if y_axis_scale == "log" else display_limits
 
-        if y_axis_scale == "log":
-            valid_freq_mask = freq_plot > 0
-            if not np.any(valid_freq_mask):
-                ax.imshow(
-                    psd,
-                    extent=[time_plot[0], time_plot[-1], freq_plot[0], freq_plot[-1]],
-                    aspect="auto",
-                    origin="lower",
-                    cmap=cmap,
-                    vmin=vmin,
-                    vmax=vmax,
-                )
-            else:
-                freq_for_plot = freq_plot[valid_freq_mask]
-                psd_for_plot = psd[valid_freq_mask, :]
-                min_freq = float(freq_for_plot[0])
-                max_freq = float(freq_for_plot[-1])
-                ax.imshow(
-                    psd_for_plot,
-                    extent=[time_plot[0], time_plot[-1], min_freq, max_freq],
-                    aspect="auto",
-                    origin="lower",
-                    cmap=cmap,
-                    vmin=vmin,
-                    vmax=vmax,
-                )
-                ax.set_yscale("log")
-                ax.set_ylim(y_window["display_min_plot"], y_window["display_max_plot"])
-        else:
-            extent = [
-                time_plot[0] if len(time_plot) > 0 else 0,
-                time_plot[-1] if len(time_plot) > 0 else 1,
-                freq_plot[0] if len(freq_plot) > 0 else 0,
-                freq_plot[-1] if len(freq_plot) > 0 else 1,
-            ]
-            ax.imshow(
-                psd,
-                extent=extent,
-                aspect="auto",
-                origin="lower",
-                cmap=cmap,
-                vmin=vmin,
-                vmax=vmax,
-            )
-            ax.set_ylim(y_window["display_min_plot"], y_window["display_max_plot"])
-
-        ax.axis("off")
-        ax.set_position([0, 0, 1, 1])
-
-        buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            bbox_inches="tight",
-            pad_inches=0,
-            facecolor="none",
-            edgecolor="none",
-            dpi=72,
-        )
-        data = base64.b64encode(buf.getbuffer()).decode("utf8")
-        return f"data:image/png;base64,{data}"
+    rgba = _render_thumbnail_rgba(
+        psd,
+        row_extent=row_extent,
+        y_limits=y_limits,
+        log_y=log_y,
+        vmin=vmin,
+        vmax=vmax,
+        colormap=colormap,
+    )
+
+    buf = BytesIO()
+    Image.fromarray(rgba, "RGBA").save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+# Larger PSDs are max-pooled before they are serialised into the modal figure;
+# this is still about twice the resolution the 500px-tall modal can show.
+MODAL_HEATMAP_MAX_ROWS = 1200
+MODAL_HEATMAP_MAX_COLS = 2400
+
+
+def _block_starts(size: int, limit: int) -> Optional[np.ndarray]:
+    factor = size // limit
+    return np.arange(0, size, factor) if factor > 1 else None
+
+
+def _block_means(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    counts = np.diff(starts, append=len(values))
+    return (np.add.reduceat(values, starts) / counts).astype(values.dtype, copy=False)
+
+
+def _reduce_heatmap_resolution(
+    psd: np.ndarray,
+    time_plot: np.ndarray,
+    freq_plot: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Max-pool ``psd`` to at most about ``MODAL_HEATMAP_MAX_ROWS`` x ``MODAL_HEATMAP_MAX_COLS``.
+
+    Plotly ships every heatmap cell to the browser, so long recordings
+    otherwise cost megabytes of figure JSON for detail no screen shows.
+    Max-pooling keeps short, loud calls visible, and each block is placed
+    at the mean of its axis values; a ragged last block is kept.
+    """
+    if psd.ndim != 2 or len(freq_plot) != psd.shape[0] or len(time_plot) != psd.shape[1]:
+        return psd, time_plot, freq_plot
+    row_starts = _block_starts(psd.shape[0], MODAL_HEATMAP_MAX_ROWS)
+    col_starts = _block_starts(psd.shape[1], MODAL_HEATMAP_MAX_COLS)
+    if row_starts is not None:
+        psd = np.maximum.reduceat(psd, row_starts, axis=0)
+        freq_plot = _block_means(freq_plot, row_starts)
+    if col_starts is not None:
+        psd = np.maximum.reduceat(psd, col_starts, axis=1)
+        time_plot = _block_means(time_plot, col_starts)
+    return psd, time_plot, freq_plot
 
 
 def _build_modal_heatmap_transport(
@@ -1436,6 +1851,12 @@ def _build_modal_heatmap_transport(
     return np.asarray(psd), float(zmin), float(zmax), {"title": "dB/Hz"}
 
 
+def encode_file_base64(path: str) -> str:
+    """Return the base64 encoding of a file's contents as text."""
+    with open(path, "rb") as handle:
+        return base64.b64encode(handle.read()).decode("utf-8")
+
+
 def _image_file_to_data_uri(image_path: str) -> Optional[str]:
     if not image_path:
         return None
@@ -1449,8 +1870,7 @@ def _image_file_to_data_uri(image_path: str) -> Optional[str]:
         ".jpeg": "image/jpeg",
         ".webp": "image/webp",
     }.get(ext, "application/octet-stream")
-    with open(image_path, "rb") as handle:
-        encoded = base64.b64encode(handle.read()).decode("utf-8")
+    encoded = encode_file_base64(image_path)
     return f"data:{mime_type};base64,{encoded}"
 
 
@@ -1692,7 +2112,7 @@ def create_spectrogram_figure(
         time_plot = np.asarray(time_plot)
         freq_plot = np.asarray(freq_plot)
 
-    color_summary = _compute_color_limit_summary(psd)
+    color_summary = _spectrogram_color_summary(spectrogram_data, psd)
     zmin, zmax = _resolve_color_limits(
         color_min=color_min,
         color_max=color_max,
@@ -1701,10 +2121,7 @@ def create_spectrogram_figure(
     )
 
     if colormap_value == "hydrophone":
-        cmap_array = colmap_hyd_py(36, 3)
-        colorscale = [[i / (len(cmap_array) - 1),
-                       f"rgb({int(r*255)},{int(g*255)},{int(b*255)})"]
-                      for i, (r, g, b) in enumerate(cmap_array)]
+        colorscale = _hydrophone_colorscale()
     else:
         colorscale = "Viridis"
 
@@ -1730,14 +2147,18 @@ def create_spectrogram_figure(
         y_axis_title = f"Frequency ({y_unit})"
         y_axis_range = [y_window["display_min_plot"], y_window["display_max_plot"]]
 
+    heatmap_psd, time_plot, freq_plot = _reduce_heatmap_resolution(psd, time_plot, freq_plot)
     heatmap_z, heatmap_zmin, heatmap_zmax, colorbar = _build_modal_heatmap_transport(
-        psd,
+        heatmap_psd,
         zmin,
         zmax,
         resolved_transport_mode,
     )
 
     fig = go.Figure()
+    # go.Heatmap is rasterised to a single canvas image by plotly.js, so its
+    # client cost scales with the cell count trimmed above rather than with
+    # DOM nodes. The WebGL heatmapgl trace no longer exists in Plotly 6.
     fig.add_trace(go.Heatmap(
         z=heatmap_z,
         x=time_plot,
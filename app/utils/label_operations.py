@@ -5,29 +5,72 @@ Handles reading and writing labels.json files with proper locking.
 Output uses the unified O3 schema: items[].verifications[].label_decisions[]
 so both label and verify modes produce the same structure.
 """
+import hashlib
 import json
 import os
+import sys
 import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from cachetools import LRUCache
 from filelock import FileLock
 
-# Create a FileLock instance at module level
-_lock_file = os.path.join(tempfile.gettempdir(), 'hydrophone_labels_lock.lock')
-_file_lock = FileLock(_lock_file)
+from app.utils.file_io import atomic_write_bytes, dumps_json, loads_json
+
+# One FileLock per labels file, keyed by its real path, so edits to
+# independent datasets do not queue behind each other and symlinked paths
+# share a lock. Lock files live in the temp dir rather than next to the data.
+_path_locks: Dict[str, FileLock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+# filelock retries a non-blocking flock at this interval while contended; the
+# 50ms default would leave a waiting save idle long after the holder is done.
+_LABELS_LOCK_POLL_INTERVAL = 0.005
+
+
+def _path_lock_for(filepath: str) -> FileLock:
+    key = os.path.realpath(filepath)
+    lock = _path_locks.get(key)
+    if lock is None:
+        with _PATH_LOCKS_GUARD:
+            lock = _path_locks.get(key)
+            if lock is None:
+                digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+                lock_file = os.path.join(tempfile.gettempdir(), f"hydrophone_labels_{digest}.lock")
+                lock = _path_locks[key] = FileLock(lock_file)
+    return lock
+
+
+# Normalized load_labels results keyed by absolute path, stored with the
+# (mtime_ns, size) they were read at so external edits are picked up.
+_labels_cache = LRUCache(maxsize=16)
+# The document this process last wrote to each labels file, with the same
+# signature, so the next edit can skip re-reading and re-parsing it.
+_labels_documents = LRUCache(maxsize=4)
+_LABELS_CACHE_LOCK = threading.Lock()
+
+
+@contextmanager
+def _labels_file_lock(filepath: str) -> Iterator[None]:
+    """Hold ``filepath``'s labels lock across threads and processes."""
+    with _path_lock_for(filepath).acquire(poll_interval=_LABELS_LOCK_POLL_INTERVAL):
+        yield
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_ITEM_KEY_EXTENSIONS = frozenset({"mat", "npy", "png", "jpg", "jpeg", "wav", "flac", "mp3"})
+
+
 def _normalize_item_key(key: Optional[str]) -> Optional[str]:
     if not key:
         return key
-    lower_key = key.lower()
-    for ext in (".mat", ".npy", ".png", ".jpg", ".jpeg", ".wav", ".flac", ".mp3"):
-        if lower_key.endswith(ext):
-            return key[: -len(ext)]
+    stem, dot, ext = key.rpartition(".")
+    if dot and ext.lower() in _ITEM_KEY_EXTENSIONS:
+        return stem
     return key
 
 
@@ -43,6 +86,28 @@ def _labels_from_verifications(verifications: list) -> List[str]:
     ]
 
 
+_KEPT_DECISIONS = frozenset(("accepted", "added"))
+
+
+def _has_current_labels(verifications: Optional[list]) -> bool:
+    """Whether the latest verification keeps any label; like ``_labels_from_verifications`` without the list."""
+    if not verifications:
+        return False
+    for ld in verifications[-1].get("label_decisions") or ():
+        if ld.get("decision") in _KEPT_DECISIONS:
+            return True
+    return False
+
+
+def _count_annotated(items: List[dict]) -> int:
+    """Count items whose latest verification keeps a label."""
+    annotated = 0
+    for item in items:
+        if _has_current_labels(item.get("verifications")):
+            annotated += 1
+    return annotated
+
+
 def _labels_from_annotations(annotations: dict) -> List[str]:
     """Extract labels from legacy annotations object."""
     if not annotations:
@@ -50,53 +115,152 @@ def _labels_from_annotations(annotations: dict) -> List[str]:
     return annotations.get("labels") or []
 
 
+def _labels_file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def _invalidate_labels_cache(filepath: str) -> None:
+    cache_key = os.path.abspath(filepath)
+    with _LABELS_CACHE_LOCK:
+        _labels_cache.pop(cache_key, None)
+        _labels_documents.pop(cache_key, None)
+
+
+def _store_labels_cache(filepath: str, normalized: Dict[str, List[str]], document: Optional[dict] = None) -> None:
+    """Seed the caches with what was just written so the next load or edit skips the parse."""
+    signature = _labels_file_signature(filepath)
+    if signature is None:
+        _invalidate_labels_cache(filepath)
+        return
+    cache_key = os.path.abspath(filepath)
+    with _LABELS_CACHE_LOCK:
+        _labels_cache[cache_key] = (signature, normalized)
+        if document is not None:
+            _labels_documents[cache_key] = (signature, document)
+
+
+def _take_labels_document(filepath: str):
+    """Return the parsed contents of ``filepath`` for an edit; the caller must hold its lock.
+
+    A cached document is handed over rather than shared: an edit that stops
+    early must not leave a half-modified copy behind.
+    """
+    signature = _labels_file_signature(filepath)
+    with _LABELS_CACHE_LOCK:
+        cached = _labels_documents.pop(os.path.abspath(filepath), None)
+    if signature is None or signature[1] == 0:
+        return {}
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        with open(filepath, "rb") as f:
+            return loads_json(f.read())
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
 def load_labels(filepath: str) -> Dict[str, List[str]]:
     """
     Load labels from a JSON file.
 
     Supports unified verifications format, legacy annotations format,
-    and legacy flat mapping format.
+    and legacy flat mapping format. Parsed results are cached until the
+    file's mtime or size changes; every call returns fresh lists that the
+    caller may mutate.
     """
-    if not filepath or not os.path.exists(filepath):
+    if not filepath:
+        return {}
+    signature = _labels_file_signature(filepath)
+    if signature is None:
+        return {}
+
+    if signature[1] <= 2:
+        # Empty, "{}" or "[]": nothing to parse (and no spurious decode error for a blank file).
         return {}
 
+    cache_key = os.path.abspath(filepath)
+    with _LABELS_CACHE_LOCK:
+        cached = _labels_cache.get(cache_key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _load_labels_uncached(filepath))
+        with _LABELS_CACHE_LOCK:
+            _labels_cache[cache_key] = cached
+    return {item_id: list(labels) for item_id, labels in cached[1].items()}
+
+
+def _load_labels_uncached(filepath: str) -> Dict[str, List[str]]:
     try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
-
-        if isinstance(data, dict) and isinstance(data.get("items"), list):
-            normalized: Dict[str, List[str]] = {}
-            for item in data.get("items", []):
-                if not isinstance(item, dict):
-                    continue
-                item_id = item.get("item_id")
-                if not item_id:
-                    continue
-
-                # Prefer verifications (unified format)
-                verifications = item.get("verifications")
-                if verifications and isinstance(verifications, list):
-                    labels = _labels_from_verifications(verifications)
-                else:
-                    # Fallback to legacy annotations
-                    annotations = item.get("annotations") or {}
-                    labels = _labels_from_annotations(annotations)
-
-                normalized[item_id] = labels if isinstance(labels, list) else []
-            return normalized
-
-        # Legacy mapping format
-        normalized = {}
-        if isinstance(data, dict):
-            for filename, labels in data.items():
-                if isinstance(labels, list):
-                    normalized[filename] = labels
-                else:
-                    normalized[filename] = [str(labels)]
-        return normalized
+        with open(filepath, "rb") as f:
+            data = loads_json(f.read())
     except (json.JSONDecodeError, IOError) as e:
         print(f"Error loading labels from {filepath}: {e}")
         return {}
+    return _normalize_labels_data(data)
+
+
+def _shared_labels(labels: list) -> List[str]:
+    """Return ``labels`` with each string interned.
+
+    Parsers allocate a new str for every label value, but a file repeats a
+    small vocabulary across thousands of items; the cached result should
+    hold one copy of each.
+    """
+    return [sys.intern(label) if type(label) is str else label for label in labels]
+
+
+def _normalize_labels_data(data) -> Dict[str, List[str]]:
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        normalized: Dict[str, List[str]] = {}
+        for item in data.get("items", []):
+            if not isinstance(item, dict):
+                continue
+            item_id = item.get("item_id")
+            if not item_id:
+                continue
+
+            # Prefer verifications (unified format)
+            verifications = item.get("verifications")
+            if verifications and isinstance(verifications, list):
+                labels = _labels_from_verifications(verifications)
+            else:
+                # Fallback to legacy annotations
+                annotations = item.get("annotations") or {}
+                labels = _labels_from_annotations(annotations)
+
+            normalized[item_id] = _shared_labels(labels) if isinstance(labels, list) else []
+        return normalized
+
+    # Legacy mapping format
+    normalized = {}
+    if isinstance(data, dict):
+        for filename, labels in data.items():
+            if isinstance(labels, list):
+                normalized[filename] = _shared_labels(labels)
+            else:
+                normalized[filename] = [sys.intern(str(labels))]
+    return normalized
+
+
+def _find_item(items: List[dict], filename: str) -> Optional[dict]:
+    """Return the first item whose id matches ``filename`` with or without its extension."""
+    normalized_filename = _normalize_item_key(filename) or filename
+    for item in items:
+        item_id = item.get("item_id")
+        if item_id == filename or item_id == normalized_filename:
+            return item
+        # Only ids that start with the bare name can normalize to it, so the
+        # cheap prefix test spares _normalize_item_key for almost every item.
+        if (
+            isinstance(item_id, str)
+            and item_id.startswith(normalized_filename)
+            and _normalize_item_key(item_id) == normalized_filename
+        ):
+            return item
+    return None
 
 
 def save_labels(
@@ -117,15 +281,41 @@ def save_labels(
     Labels are stored as verifications[].label_decisions[] with decision="added"
     and threshold_used=null (no model). Legacy files are upgraded on write.
     """
-    with _file_lock:
-        # Load existing data
-        current_data: dict = {}
-        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-            try:
-                with open(filepath, "r") as f:
-                    current_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                current_data = {}
+    return _update_labels(
+        filepath,
+        filename,
+        lambda _current_labels: labels,
+        annotated_by=annotated_by,
+        annotated_at=annotated_at,
+        notes=notes,
+        metadata=metadata,
+        label_extents=label_extents,
+        bbox_annotations=bbox_annotations,
+    )
+
+
+def _update_labels(
+    filepath: str,
+    filename: str,
+    compute_labels: Callable[[List[str]], Optional[List[str]]],
+    *,
+    annotated_by: Optional[str] = None,
+    annotated_at: Optional[str] = None,
+    notes: Optional[str] = None,
+    metadata: Optional[dict] = None,
+    label_extents: Optional[Dict[str, dict]] = None,
+    bbox_annotations: Optional[List[Dict]] = None,
+) -> bool:
+    """Rewrite ``filename``'s labels as ``compute_labels(current_labels)`` in one locked read-modify-write.
+
+    ``compute_labels`` returns None when the edit is a no-op; the file is
+    then left untouched rather than gaining an identical verification round.
+    """
+    with _labels_file_lock(filepath):
+        # One timestamp for the whole write; it is also the migration time for legacy entries.
+        timestamp = _now_iso()
+
+        current_data = _take_labels_document(filepath)
 
         # Initialize unified structure
         if isinstance(current_data, dict) and isinstance(current_data.get("items"), list):
@@ -133,7 +323,7 @@ def save_labels(
         else:
             data = {
                 "schema_version": "2.1",
-                "created_at": _now_iso(),
+                "created_at": timestamp,
                 "task_type": "classification",
                 "items": [],
             }
@@ -148,7 +338,7 @@ def save_labels(
                     item_id = _normalize_item_key(key) or key
                     # Convert legacy labels to verifications format
                     verification = {
-                        "verified_at": _now_iso(),
+                        "verified_at": timestamp,
                         "verified_by": "migrated",
                         "verification_round": 1,
                         "verification_status": "verified",
@@ -166,22 +356,12 @@ def save_labels(
                 data["items"] = items
 
         data.setdefault("schema_version", "2.1")
-        data.setdefault("created_at", _now_iso())
+        data.setdefault("created_at", timestamp)
         data.setdefault("task_type", "classification")
-        data["updated_at"] = _now_iso()
+        data["updated_at"] = timestamp
 
         items = data.get("items") or []
-        normalized_filename = _normalize_item_key(filename) or filename
-
-        existing_item = None
-        for item in items:
-            item_id = item.get("item_id")
-            if item_id == filename or item_id == normalized_filename:
-                existing_item = item
-                break
-            if _normalize_item_key(item_id) == normalized_filename:
-                existing_item = item
-                break
+        existing_item = _find_item(items, filename)
 
         if existing_item is None:
             existing_item = {"item_id": filename}
@@ -195,7 +375,7 @@ def save_labels(
             old_labels = old_ann.get("labels") or []
             if old_labels:
                 existing_item["verifications"] = [{
-                    "verified_at": old_ann.get("annotated_at") or _now_iso(),
+                    "verified_at": old_ann.get("annotated_at") or timestamp,
                     "verified_by": old_ann.get("annotated_by") or "migrated",
                     "verification_round": 1,
                     "verification_status": "verified",
@@ -211,7 +391,7 @@ def save_labels(
 
         # Build the new verification entry
         verifications = existing_item.get("verifications") or []
-        now = annotated_at or _now_iso()
+        now = annotated_at or timestamp
         by = annotated_by or "anonymous"
 
         # Determine note text: use provided notes, or preserve from latest verification
@@ -222,6 +402,9 @@ def save_labels(
         else:
             note_text = ""
 
+        labels = compute_labels(_labels_from_verifications(verifications))
+        if labels is None:
+            return True
         label_list = labels if isinstance(labels, list) else []
         extent_map = label_extents if isinstance(label_extents, dict) else {}
         box_annotations = bbox_annotations if isinstance(bbox_annotations, list) else []
@@ -284,43 +467,46 @@ def save_labels(
         # Build summary
         summary = data.get("summary", {})
         summary["total_items"] = len(data["items"])
-        summary["annotated"] = sum(
-            1 for item in data["items"]
-            if _labels_from_verifications(item.get("verifications") or [])
-        )
+        summary["annotated"] = _count_annotated(data["items"])
         summary["verified"] = summary["annotated"]  # all manual labels are "verified"
         data["summary"] = summary
 
         try:
             os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2, sort_keys=False)
-            return True
+            # Temp file + rename: a crash mid-write can no longer truncate labels.json.
+            atomic_write_bytes(filepath, dumps_json(data, indent=2, sort_keys=False))
         except IOError as e:
             print(f"Error saving labels to {filepath}: {e}")
+            _invalidate_labels_cache(filepath)
             return False
+        # Still under the lock, so the stat below belongs to this write.
+        _store_labels_cache(filepath, _normalize_labels_data(data), document=data)
+        return True
 
 
 def add_label(filepath: str, filename: str, label: str) -> bool:
     """Add a single label to a file's labels."""
-    current_data = load_labels(filepath)
-    labels = current_data.get(filename, [])
-
-    if label not in labels:
-        labels.append(label)
-
-    return save_labels(filepath, filename, labels)
+    return _update_labels(
+        filepath,
+        filename,
+        lambda labels: None if label in labels else labels + [label],
+    )
 
 
 def remove_label(filepath: str, filename: str, label: str) -> bool:
     """Remove a single label from a file's labels."""
-    current_data = load_labels(filepath)
-    labels = current_data.get(filename, [])
+    return _update_labels(
+        filepath,
+        filename,
+        lambda labels: _without_first(labels, label),
+    )
 
-    if label in labels:
-        labels.remove(label)
 
-    return save_labels(filepath, filename, labels)
+def _without_first(labels: List[str], label: str) -> Optional[List[str]]:
+    if label not in labels:
+        return None
+    labels.remove(label)
+    return labels
 
 
 def save_labels_unlocked(filepath: str, current_data: Dict, filename: str, labels: List[str]) -> bool:
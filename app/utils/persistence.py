@@ -1,9 +1,20 @@
 from datetime import datetime, timezone
+import hashlib
 import os
+import threading
 from copy import deepcopy
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from app.utils.file_io import read_json, write_json
+from cachetools import LRUCache
+
+from app.utils.file_io import loads_json, read_json, write_json
+from app.utils.label_operations import save_labels
+
+# Parsed predictions documents keyed by absolute path, stored with a digest of
+# the bytes they were read from or last written as plus an item_id -> index
+# map, so repeated verification saves skip both the parse and the item scan.
+_predictions_cache = LRUCache(maxsize=4)
+_PREDICTIONS_LOCK = threading.Lock()
 
 
 def _sanitize_label_decisions(label_decisions: Optional[List[Dict]]) -> List[Dict]:
@@ -75,6 +86,44 @@ def _append_verification_to_item(item: Dict, verification: Dict) -> Dict:
     return stored_verification
 
 
+def _item_id_index(items: List[Dict]) -> Dict[Optional[str], int]:
+    """Map each item_id to the index of its first item."""
+    index: Dict[Optional[str], int] = {}
+    for i, item in enumerate(items):
+        if isinstance(item, dict):
+            index.setdefault(item.get("item_id"), i)
+    return index
+
+
+def _load_predictions_for_update(predictions_path: str) -> Tuple[Dict, Dict[Optional[str], int]]:
+    """Return the predictions document and its item_id index, reusing the cached parse.
+
+    The file is read on every call and only its parse is reused, when the
+    bytes hash to the cached digest; edits that keep the mtime and size are
+    still picked up. Must be called with ``_PREDICTIONS_LOCK`` held: the
+    returned document is shared with the cache and is edited in place by the
+    caller.
+    """
+    cache_key = os.path.abspath(predictions_path)
+    try:
+        with open(predictions_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        _predictions_cache.pop(cache_key, None)
+        return {}, {}
+
+    digest = hashlib.sha1(raw).digest()
+    cached = _predictions_cache.get(cache_key)
+    if cached is not None and cached[0] == digest:
+        return cached[1], cached[2]
+
+    data = loads_json(raw)
+    items = data.get("items")
+    id_index = _item_id_index(items) if isinstance(items, list) else {}
+    _predictions_cache[cache_key] = (digest, data, id_index)
+    return data, id_index
+
+
 def _strict_predictions_path_for(active_predictions_path: str) -> Optional[str]:
     """Return sibling strict O3 predictions.json for an app sidecar, if present."""
     if not active_predictions_path:
@@ -131,11 +180,14 @@ def _mirror_verification_to_strict_predictions(
     item_id: str,
     verification: Dict,
     source_item: Optional[Dict],
+    updated_at: str,
 ) -> int:
     """Mirror an app-side verification into sibling strict O3 predictions.json.
 
-    Returns the number of strict O3 items updated. Missing strict files or
-    unmatched items are intentionally non-fatal so review saves still succeed.
+    ``updated_at`` is the active file's save time, so both files record the
+    same moment. Returns the number of strict O3 items updated. Missing strict
+    files or unmatched items are intentionally non-fatal so review saves still
+    succeed.
     """
     strict_path = _strict_predictions_path_for(active_predictions_path)
     if not strict_path:
@@ -153,7 +205,7 @@ def _mirror_verification_to_strict_predictions(
     for index in target_indexes:
         _append_verification_to_item(items[index], deepcopy(verification))
 
-    data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    data["updated_at"] = updated_at
     write_json(strict_path, data, indent=None, sort_keys=False)
     return len(target_indexes)
 
@@ -170,9 +222,8 @@ def save_label_mode(
     """Save labels for an item to a labels.json file."""
     if not output_file:
         return
-    
+
     # Use label_operations for proper file locking
-    from app.utils.label_operations import save_labels
     save_labels(
         output_file,
         item_id,
@@ -232,28 +283,33 @@ def save_verify_predictions(
     if not predictions_path:
         return None
 
-    data = read_json(predictions_path)
-    items = data.get("items")
-    if not isinstance(items, list):
-        return None
-
-    stored_verification = None
-    for item in items:
-        if item.get("item_id") != item_id:
-            continue
-
-        stored_verification = _append_verification_to_item(item, verification)
-        break
-
-    if stored_verification is None:
-        return None
+    cache_key = os.path.abspath(predictions_path)
+    with _PREDICTIONS_LOCK:
+        data, id_index = _load_predictions_for_update(predictions_path)
+        items = data.get("items")
+        if not isinstance(items, list):
+            return None
+
+        item_index = id_index.get(item_id)
+        if item_index is None:
+            return None
+
+        updated_at = datetime.now(timezone.utc).isoformat()
+        try:
+            stored_verification = _append_verification_to_item(items[item_index], verification)
+            data["updated_at"] = updated_at
+            payload = write_json(predictions_path, data, indent=None, sort_keys=False)
+        except BaseException:
+            # The cached document may now differ from the file on disk.
+            _predictions_cache.pop(cache_key, None)
+            raise
+        _predictions_cache[cache_key] = (hashlib.sha1(payload).digest(), data, id_index)
 
-    data["updated_at"] = datetime.now(timezone.utc).isoformat()
-    write_json(predictions_path, data, indent=None, sort_keys=False)
     _mirror_verification_to_strict_predictions(
         predictions_path,
         item_id,
         verification,
         source_item,
+        updated_at,
     )
     return stored_verification
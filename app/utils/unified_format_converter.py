@@ -2,7 +2,7 @@
 Convert unified v2.x predictions format to internal app format.
 """
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, Optional
 
 from app.services.annotations import clean_box_annotation
 
@@ -11,22 +11,14 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _build_summary(items: List[dict]) -> dict:
-    total = len(items)
-    annotated = 0
-    verified = 0
-    for item in items:
-        verifications = item.get("verifications") or []
-        annotations = item.get("annotations") or {}
-        if verifications:
-            annotated += 1
-            if verifications[-1].get("label_decisions"):
-                verified += 1
-        elif annotations.get("labels"):
-            annotated += 1
-            if annotations.get("verified"):
-                verified += 1
-    return {"total_items": total, "annotated": annotated, "verified": verified}
+# Item fields mapped onto internal keys; everything else is kept as metadata.
+_CONSUMED_ITEM_FIELDS = frozenset({
+    "item_id", "data_source_id", "spectrogram_path", "mat_path",
+    "spectrogram_png_path", "spectrogram_mat_path",
+    "audio_path", "source_audio", "paths",
+    "audio_start_time", "audio_end_time",
+    "audio_timestamp", "model_outputs", "verifications",
+})
 
 
 def _build_data_source_index(predictions_json: dict) -> dict:
@@ -63,6 +55,9 @@ def convert_unified_v2_to_internal(predictions_json: dict, base_path: str = None
     """
     import os
 
+    # Directory -> entry names, or None when the directory does not exist.
+    directory_listings: Dict[str, Optional[frozenset]] = {}
+
     def resolve_path(path):
         """Resolve relative path to absolute using base_path."""
         if not path or not base_path:
@@ -70,26 +65,50 @@ def convert_unified_v2_to_internal(predictions_json: dict, base_path: str = None
         if os.path.isabs(path):
             return path
         resolved = os.path.join(base_path, path)
-        return resolved if os.path.exists(resolved) else path
+        # One listing per directory replaces a stat per item; names it does
+        # not contain still get the exact check (case-insensitive filesystems).
+        directory, name = os.path.split(resolved)
+        if directory not in directory_listings:
+            try:
+                directory_listings[directory] = frozenset(os.listdir(directory or "."))
+            except (FileNotFoundError, NotADirectoryError):
+                directory_listings[directory] = None
+            except OSError:
+                directory_listings[directory] = frozenset()
+        names = directory_listings[directory]
+        if names is None:
+            return path
+        return resolved if name in names or os.path.exists(resolved) else path
 
     items = []
     model = predictions_json.get("model", {})
+    model_id = model.get("model_id")
     ds_index = _build_data_source_index(predictions_json)
+    default_data_source = ds_index.get("_default", {})
     task_type = predictions_json.get("task_type", "unknown")
+    # Summary counters are accumulated here rather than in a second pass:
+    # an item counts as annotated when it has verifications, and as
+    # verified when the latest one carries label decisions.
+    annotated = 0
+    verified = 0
 
     for item_data in predictions_json.get("items", []):
         # Look up data source for this item
         ds_id = item_data.get("data_source_id", "_default")
-        data_source = ds_index.get(ds_id, ds_index.get("_default", {}))
+        data_source = ds_index.get(ds_id, default_data_source)
 
         # Get latest verification (if any)
         verifications = item_data.get("verifications", [])
         latest_verification = verifications[-1] if verifications else None
+        if latest_verification is not None:
+            annotated += 1
+            if latest_verification.get("label_decisions"):
+                verified += 1
 
         model_outputs = item_data.get("model_outputs", [])
 
         predictions = {
-            "model_id": model.get("model_id"),
+            "model_id": model_id,
             "model_outputs": model_outputs,
             "task_type": task_type,
         }
@@ -171,14 +190,7 @@ def convert_unified_v2_to_internal(predictions_json: dict, base_path: str = None
             "device_code": data_source.get("device_code"),
             "predictions": predictions,
             "annotations": annotations,
-            "metadata": {
-                k: v for k, v in item_data.items()
-                if k not in ["item_id", "data_source_id", "spectrogram_path", "mat_path",
-                            "spectrogram_png_path", "spectrogram_mat_path",
-                            "audio_path", "source_audio", "paths",
-                            "audio_start_time", "audio_end_time",
-                            "audio_timestamp", "model_outputs", "verifications"]
-            },
+            "metadata": {k: v for k, v in item_data.items() if k not in _CONSUMED_ITEM_FIELDS},
             "verifications": verifications,
         })
 
@@ -197,7 +209,7 @@ def convert_unified_v2_to_internal(predictions_json: dict, base_path: str = None
             "task_type": task_type
         },
         "items": items,
-        "summary": _build_summary(items),
+        "summary": {"total_items": len(items), "annotated": annotated, "verified": verified},
     }
 
 
@@ -217,14 +229,16 @@ def is_unified_v2_format(predictions_json: dict) -> bool:
     if not predictions_json:
         return False
 
-    version = predictions_json.get("schema_version") or predictions_json.get("version")
-    has_items = "items" in predictions_json and isinstance(predictions_json["items"], list)
+    items = predictions_json.get("items")
+    if not isinstance(items, list):
+        return False
 
-    if version in {"2.0", "2.1"} and has_items:
+    version = predictions_json.get("schema_version") or predictions_json.get("version")
+    if version in {"2.0", "2.1"}:
         return True
 
-    if has_items and predictions_json["items"]:
-        first_item = predictions_json["items"][0]
+    if items:
+        first_item = items[0]
         if "model_outputs" in first_item or "verifications" in first_item:
             return True
 
@@ -8,13 +8,20 @@ from app.config import get_config
 from app.main import create_app
 
 
-def find_free_port(preferred: int = 8050) -> int:
+def find_free_port(preferred: int = 8050, host: str = "127.0.0.1") -> int:
+    # Probe with a bind rather than a connect: it also catches ports that are
+    # bound but not listening. Bind the host the server will use, since on
+    # BSD/macOS a wildcard bind can succeed while host:port is taken.
+    # SO_REUSEADDR matches the server's own socket, so a TIME_WAIT leftover
+    # from the previous run does not move the port. On Windows it would let
+    # the probe share a port another process is bound to, so it is left off.
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        if s.connect_ex(("127.0.0.1", preferred)) != 0:
-            return preferred
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("", 0))
+        if os.name != "nt":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind((host, preferred))
+        except OSError:
+            s.bind((host, 0))
         return s.getsockname()[1]
 
 
@@ -37,7 +44,7 @@ def main():
     preferred_port = server_cfg.get("port")
     if preferred_port is None:
         preferred_port = int(os.environ.get("PORT", "8050"))
-    port = find_free_port(preferred_port)
+    port = find_free_port(preferred_port, host)
     if port != preferred_port:
         print(f"Port {preferred_port} in use, switching to {port}")
 
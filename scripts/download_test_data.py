@@ -12,7 +12,9 @@ Usage:
 import argparse
 import json
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -22,6 +24,11 @@ import scipy.io
 import soundfile as sf
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional accelerator (the "fast" extra)
+    orjson = None
+
 # Try to import from the whale-call-analysis package
 WHALE_ANALYSIS_ROOT = Path(__file__).resolve().parents[2] / "whale-call-analysis"
 if str(WHALE_ANALYSIS_ROOT) not in sys.path:
@@ -68,20 +75,173 @@ def compute_clip_windows(
     return windows
 
 
+AUDIO_EXTENSIONS = ('.flac', '.wav')
+
+
+def find_audio_files(root: Path) -> List[str]:
+    """Return audio files anywhere under ``root`` in one directory walk.
+
+    Like a recursive glob, hidden files and directories are skipped.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+        found.extend(
+            os.path.join(dirpath, name)
+            for name in filenames
+            if name.endswith(AUDIO_EXTENSIONS) and not name.startswith('.')
+        )
+    return found
+
+
+# DEVICE_YYYYMMDDTHHMMSS[.sss]Z: the timestamp is the second "_" field.
+_FILENAME_TIMESTAMP = re.compile(r'^[^_]*_(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})')
+
+
 def extract_timestamp_from_filename(filename: str) -> Optional[datetime]:
     """Extract timestamp from ONC audio filename."""
+    match = _FILENAME_TIMESTAMP.match(Path(filename).stem)
+    if not match:
+        return None
+    try:
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+# Per-process spectrogram generator, built once by _init_worker so it is not
+# pickled or reconstructed for every file.
+_spec_gen = None
+
+
+def _init_worker(spec_kwargs: Dict[str, Any]) -> None:
+    global _spec_gen
+    import matplotlib
+    matplotlib.use('Agg')
+    _spec_gen = SpectrogramGenerator(**spec_kwargs)
+
+
+def _process_audio_file_job(job) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]:
+    return process_audio_file(*job)
+
+
+def process_audio_file(
+    audio_idx: int,
+    n_files: int,
+    audio_path: Path,
+    options: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]:
+    """Cut one audio file into clips and save their spectrograms.
+
+    Returns the processed clip records and, if the file failed, its failure record.
+    """
+    spec_gen = _spec_gen
+    context_duration = options["context_duration"]
+    freq_min = options["freq_min"]
+    freq_max = options["freq_max"]
+    mat_dir = options["mat_dir"]
+    png_dir = options["png_dir"]
+    audio_dir = options["audio_dir"]
+    wav_subtype = options["wav_subtype"]
+    processed_files = []
+    
+    print(f"Processing {audio_idx + 1}/{n_files}: {audio_path.name}")
+    
     try:
-        base = Path(filename).stem
-        parts = base.split('_')
-        if len(parts) >= 2:
-            ts_str = parts[1].replace('Z', '')
-            if '.' in ts_str:
-                ts_str = ts_str.split('.')[0]
-            dt = datetime.strptime(ts_str[:15], '%Y%m%dT%H%M%S')
-            return dt.replace(tzinfo=timezone.utc)
-    except Exception:
-        pass
-    return None
+        with sf.SoundFile(str(audio_path)) as audio_file:
+            # Decode each clip's samples on demand rather than the whole file
+            sample_rate = audio_file.samplerate
+            audio_duration = audio_file.frames / sample_rate
+            
+            # Extract timestamp
+            file_timestamp = extract_timestamp_from_filename(audio_path.name)
+            if file_timestamp is None:
+                file_timestamp = datetime.now(timezone.utc)
+            
+            # Compute clip windows
+            windows = compute_clip_windows(audio_duration, context_duration)
+            
+            print(f"  Audio: {audio_duration:.1f}s @ {sample_rate}Hz, {len(windows)} clips")
+            
+            for clip_idx, (start_sec, end_sec) in enumerate(windows):
+                # Extract clip
+                start_sample = int(start_sec * sample_rate)
+                end_sample = int(end_sec * sample_rate)
+                audio_file.seek(start_sample)
+                clip_audio = audio_file.read(end_sample - start_sample, dtype='float32')
+                
+                # Ensure exact length
+                expected_samples = int(context_duration * sample_rate)
+                if len(clip_audio) < expected_samples:
+                    clip_audio = np.pad(clip_audio, (0, expected_samples - len(clip_audio)))
+                elif len(clip_audio) > expected_samples:
+                    clip_audio = clip_audio[:expected_samples]
+                
+                # Create file ID
+                file_id = f"{audio_path.stem}_clip{clip_idx:03d}"
+                clip_timestamp = file_timestamp + timedelta(seconds=start_sec)
+                
+                # Generate spectrogram
+                freqs, times, Sxx, power_db = spec_gen.compute_spectrogram(clip_audio, sample_rate)
+                
+                # Crop to frequency range (freqs ascend, so the band is one slice)
+                f_start = np.searchsorted(freqs, freq_min, side='left')
+                f_end = np.searchsorted(freqs, freq_max, side='right')
+                if f_start < f_end:
+                    freqs_cropped = freqs[f_start:f_end]
+                    Sxx_cropped = Sxx[f_start:f_end, :]
+                    power_db_cropped = power_db[f_start:f_end, :]
+                else:
+                    freqs_cropped = freqs
+                    Sxx_cropped = Sxx
+                    power_db_cropped = power_db
+                
+                # Save MAT file (PSDs as float32, the precision the app loads them at)
+                mat_path = mat_dir / f"{file_id}.mat"
+                scipy.io.savemat(str(mat_path), {
+                    'F': freqs_cropped,
+                    'T': times,
+                    'P': Sxx_cropped.astype(np.float32, copy=False),
+                    'PdB_norm': power_db_cropped.astype(np.float32, copy=False),
+                    'freq_min': freq_min,
+                    'freq_max': freq_max,
+                    'sample_rate': sample_rate,
+                    'context_duration': context_duration,
+                })
+                
+                # Save PNG if requested
+                png_path = None
+                if png_dir:
+                    png_path = png_dir / f"{file_id}.png"
+                    spec_gen.plot_spectrogram(
+                        freqs_cropped, times, power_db_cropped,
+                        title=f"{options['device_code']}: {clip_timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+                        save_path=png_path
+                    )
+                    import matplotlib.pyplot as plt
+                    plt.close('all')
+                
+                # Save audio clip if requested
+                clip_audio_path = None
+                if audio_dir:
+                    clip_audio_path = audio_dir / f"{file_id}.wav"
+                    sf.write(str(clip_audio_path), clip_audio, sample_rate, subtype=wav_subtype)
+                
+                processed_files.append({
+                    "item_id": file_id,
+                    "spectrogram_path": str(mat_path),
+                    "audio_file": str(clip_audio_path) if clip_audio_path else None,
+                    "source_audio": audio_path.name,
+                    "timestamp": clip_timestamp.isoformat(),
+                })
+                
+    except Exception as e:
+        print(f"  Failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return processed_files, {"file": str(audio_path), "error": str(e)}
+    
+    return processed_files, None
 
 
 def main():
@@ -100,6 +260,11 @@ def main():
                         help='Also save PNG spectrogram images')
     parser.add_argument('--save-audio', action='store_true',
                         help='Also save audio clip files')
+    parser.add_argument('--wav-subtype', type=str, default='PCM_16',
+                        choices=('PCM_16', 'PCM_24', 'FLOAT'),
+                        help='Sample format for saved audio clips (default: PCM_16; FLOAT keeps full precision)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processes for spectrogram generation (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -163,8 +328,8 @@ def main():
     print(f"  Frequency range: {freq_min}-{freq_max} Hz")
     print()
     
-    # Initialize spectrogram generator
-    spec_gen = SpectrogramGenerator(
+    # Spectrogram generator settings (one generator is built per worker)
+    spec_kwargs = dict(
         win_dur=window_duration,
         overlap=overlap,
         freq_lims=(freq_min, freq_max),
@@ -199,16 +364,7 @@ def main():
         sys.exit(1)
     
     # Find downloaded audio files
-    import glob
-    audio_patterns = [
-        str(output_dir / '**/*.flac'),
-        str(output_dir / '**/*.wav'),
-    ]
-    audio_files = []
-    for pattern in audio_patterns:
-        audio_files.extend(glob.glob(pattern, recursive=True))
-    
-    audio_files = sorted(set(audio_files))
+    audio_files = sorted(find_audio_files(output_dir))
     print(f"Found {len(audio_files)} audio files to process")
     
     if not audio_files:
@@ -221,106 +377,42 @@ def main():
     print("GENERATING SPECTROGRAMS")
     print("-" * 60)
     
+    options = {
+        "context_duration": context_duration,
+        "freq_min": freq_min,
+        "freq_max": freq_max,
+        "device_code": args.device_code,
+        "mat_dir": mat_dir,
+        "png_dir": png_dir if args.save_png else None,
+        "audio_dir": audio_dir if args.save_audio else None,
+        "wav_subtype": args.wav_subtype,
+    }
+    jobs = [
+        (audio_idx, len(audio_files), Path(audio_path), options)
+        for audio_idx, audio_path in enumerate(audio_files)
+    ]
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(jobs)))
+    
     processed_files = []
     failed_files = []
     
-    for audio_idx, audio_path in enumerate(audio_files):
-        audio_path = Path(audio_path)
-        print(f"Processing {audio_idx + 1}/{len(audio_files)}: {audio_path.name}")
-        
-        try:
-            # Load audio
-            audio_data, sample_rate = sf.read(str(audio_path))
-            audio_duration = len(audio_data) / sample_rate
-            
-            # Extract timestamp
-            file_timestamp = extract_timestamp_from_filename(audio_path.name)
-            if file_timestamp is None:
-                file_timestamp = datetime.now(timezone.utc)
-            
-            # Compute clip windows
-            windows = compute_clip_windows(audio_duration, context_duration)
-            
-            print(f"  Audio: {audio_duration:.1f}s @ {sample_rate}Hz, {len(windows)} clips")
-            
-            for clip_idx, (start_sec, end_sec) in enumerate(windows):
-                # Extract clip
-                start_sample = int(start_sec * sample_rate)
-                end_sample = int(end_sec * sample_rate)
-                clip_audio = audio_data[start_sample:end_sample]
-                
-                # Ensure exact length
-                expected_samples = int(context_duration * sample_rate)
-                if len(clip_audio) < expected_samples:
-                    clip_audio = np.pad(clip_audio, (0, expected_samples - len(clip_audio)))
-                elif len(clip_audio) > expected_samples:
-                    clip_audio = clip_audio[:expected_samples]
-                
-                # Create file ID
-                file_id = f"{audio_path.stem}_clip{clip_idx:03d}"
-                clip_timestamp = file_timestamp + timedelta(seconds=start_sec)
-                
-                # Generate spectrogram
-                freqs, times, Sxx, power_db = spec_gen.compute_spectrogram(clip_audio, sample_rate)
-                
-                # Crop to frequency range
-                freq_mask = (freqs >= freq_min) & (freqs <= freq_max)
-                freq_indices = np.where(freq_mask)[0]
-                if len(freq_indices) > 0:
-                    f_start = freq_indices[0]
-                    f_end = freq_indices[-1] + 1
-                    freqs_cropped = freqs[f_start:f_end]
-                    Sxx_cropped = Sxx[f_start:f_end, :]
-                    power_db_cropped = power_db[f_start:f_end, :]
-                else:
-                    freqs_cropped = freqs
-                    Sxx_cropped = Sxx
-                    power_db_cropped = power_db
-                
-                # Save MAT file
-                mat_path = mat_dir / f"{file_id}.mat"
-                scipy.io.savemat(str(mat_path), {
-                    'F': freqs_cropped,
-                    'T': times,
-                    'P': Sxx_cropped,
-                    'PdB_norm': power_db_cropped,
-                    'freq_min': freq_min,
-                    'freq_max': freq_max,
-                    'sample_rate': sample_rate,
-                    'context_duration': context_duration,
-                })
-                
-                # Save PNG if requested
-                png_path = None
-                if args.save_png and png_dir:
-                    png_path = png_dir / f"{file_id}.png"
-                    spec_gen.plot_spectrogram(
-                        freqs_cropped, times, power_db_cropped,
-                        title=f"{args.device_code}: {clip_timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-                        save_path=png_path
-                    )
-                    import matplotlib.pyplot as plt
-                    plt.close('all')
-                
-                # Save audio clip if requested
-                clip_audio_path = None
-                if args.save_audio and audio_dir:
-                    clip_audio_path = audio_dir / f"{file_id}.wav"
-                    sf.write(str(clip_audio_path), clip_audio, sample_rate)
-                
-                processed_files.append({
-                    "item_id": file_id,
-                    "spectrogram_path": str(mat_path),
-                    "audio_file": str(clip_audio_path) if clip_audio_path else None,
-                    "source_audio": audio_path.name,
-                    "timestamp": clip_timestamp.isoformat(),
-                })
-                
-        except Exception as e:
-            failed_files.append({"file": str(audio_path), "error": str(e)})
-            print(f"  Failed: {e}")
-            import traceback
-            traceback.print_exc()
+    if workers == 1:
+        _init_worker(spec_kwargs)
+        results = list(map(_process_audio_file_job, jobs))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(spec_kwargs,),
+        ) as executor:
+            # map keeps the input order, so labels.json lists clips the same
+            # way regardless of which worker finishes first.
+            results = list(executor.map(_process_audio_file_job, jobs))
+    
+    for file_processed, file_failure in results:
+        processed_files.extend(file_processed)
+        if file_failure:
+            failed_files.append(file_failure)
     
     # Save labels file for the labeling app
     labels_data = {
@@ -351,8 +443,11 @@ def main():
         })
     
     labels_path = output_dir / "labels.json"
-    with open(labels_path, 'w') as f:
-        json.dump(labels_data, f, indent=2)
+    if orjson is not None:
+        labels_path.write_bytes(orjson.dumps(labels_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(labels_path, 'w') as f:
+            json.dump(labels_data, f, indent=2)
     
     print()
     print("=" * 60)
@@ -2,7 +2,9 @@
 """
 Regenerate spectrograms from existing FLAC files with temporal padding.
 """
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 import scipy.io
@@ -29,144 +31,176 @@ OVERLAP = 0.9
 FREQ_MIN = 5
 FREQ_MAX = 100
 
-print("=" * 70)
-print("REGENERATING SPECTROGRAMS WITH TEMPORAL PADDING")
-print("=" * 70)
-print(f"Source: {FLAC_DIR}")
-print(f"Output: {OUTPUT_DIR}")
-print(f"Context duration: {CONTEXT_DURATION}s")
-print(f"Temporal padding: {TEMPORAL_PADDING}s (eliminates edge effects)")
-print(f"Window: {WINDOW_DURATION}s, Overlap: {OVERLAP}")
-print(f"Freq range: {FREQ_MIN}-{FREQ_MAX} Hz")
-print()
-
-# Initialize spectrogram generator
-spec_gen = SpectrogramGenerator(
-    win_dur=WINDOW_DURATION,
-    overlap=OVERLAP,
-    freq_lims=(FREQ_MIN, FREQ_MAX),
-    log_freq=False,
-    clim=(-60, 0),
-    colormap='viridis'
-)
-
-# Process each FLAC file
-flac_files = sorted(FLAC_DIR.glob('*.flac'))
-print(f"Found {len(flac_files)} FLAC files to process\n")
-
-total_clips = 0
-
-for flac_idx, flac_path in enumerate(flac_files):
-    print(f"[{flac_idx+1}/{len(flac_files)}] Processing {flac_path.name}...")
-    
-    # Load audio
-    audio_data, sample_rate = sf.read(str(flac_path))
-    audio_duration = len(audio_data) / sample_rate
-    
-    # Calculate number of clips
-    n_clips = int(np.ceil(audio_duration / CONTEXT_DURATION))
-    
-    print(f"  Duration: {audio_duration:.1f}s @ {sample_rate}Hz → {n_clips} clips")
-    
-    for clip_idx in range(n_clips):
-        start_sec = clip_idx * CONTEXT_DURATION
-        end_sec = min(start_sec + CONTEXT_DURATION, audio_duration)
-        
-        # Add temporal padding
-        padded_start_sec = max(0, start_sec - TEMPORAL_PADDING)
-        padded_end_sec = min(audio_duration, end_sec + TEMPORAL_PADDING)
-        
-        # Extract padded clip
-        padded_start_sample = int(padded_start_sec * sample_rate)
-        padded_end_sample = int(padded_end_sec * sample_rate)
-        padded_clip = audio_data[padded_start_sample:padded_end_sample]
-        
-        # Track actual padding
-        actual_padding_before = start_sec - padded_start_sec
-        actual_padding_after = padded_end_sec - end_sec
-        
-        # Generate spectrogram on padded audio
-        freqs, times, Sxx, power_db = spec_gen.compute_spectrogram(padded_clip, sample_rate)
-        
-        # Trim spectrogram to target range
-        target_start_time = actual_padding_before
-        target_end_time = actual_padding_before + CONTEXT_DURATION
-        
-        target_mask = (times >= target_start_time) & (times <= target_end_time)
-        time_indices = np.where(target_mask)[0]
-        
-        if len(time_indices) == 0:
-            print(f"    Warning: No valid time indices for clip {clip_idx}")
-            continue
-        
-        # Trim to target
-        times_trimmed = times[time_indices] - actual_padding_before
-        Sxx_trimmed = Sxx[:, time_indices]
-        power_db_trimmed = power_db[:, time_indices]
-        
-        # Crop to frequency range
-        freq_mask = (freqs >= FREQ_MIN) & (freqs <= FREQ_MAX)
-        freq_indices = np.where(freq_mask)[0]
-        
-        if len(freq_indices) > 0:
-            freqs_cropped = freqs[freq_indices]
-            Sxx_cropped = Sxx_trimmed[freq_indices, :]
-            power_db_cropped = power_db_trimmed[freq_indices, :]
-        else:
-            freqs_cropped = freqs
-            Sxx_cropped = Sxx_trimmed
-            power_db_cropped = power_db_trimmed
-        
-        # Create file ID
-        file_id = f"{flac_path.stem}_clip{clip_idx:03d}"
-        
-        # Save MAT file
-        mat_path = MAT_DIR / f"{file_id}.mat"
-        scipy.io.savemat(str(mat_path), {
-            'F': freqs_cropped,
-            'T': times_trimmed,
-            'P': Sxx_cropped,
-            'PdB_norm': power_db_cropped,
-            'freq_min': FREQ_MIN,
-            'freq_max': FREQ_MAX,
-            'sample_rate': sample_rate,
-            'context_duration': CONTEXT_DURATION,
-            'temporal_padding_used': TEMPORAL_PADDING,
-        })
-        
-        # Save PNG
-        png_path = PNG_DIR / f"{file_id}.png"
-        spec_gen.plot_spectrogram(
-            freqs_cropped, times_trimmed, power_db_cropped,
-            title=f"Clip {clip_idx} (with padding)",
-            save_path=png_path
-        )
-        
-        # Save audio clip
-        target_start_sample = int(start_sec * sample_rate)
-        target_end_sample = int(end_sec * sample_rate)
-        target_clip = audio_data[target_start_sample:target_end_sample]
-        
-        # Ensure exact length
-        expected_samples = int(CONTEXT_DURATION * sample_rate)
-        if len(target_clip) < expected_samples:
-            target_clip = np.pad(target_clip, (0, expected_samples - len(target_clip)))
-        elif len(target_clip) > expected_samples:
-            target_clip = target_clip[:expected_samples]
-        
-        audio_path = AUDIO_DIR / f"{file_id}.wav"
-        sf.write(str(audio_path), target_clip, sample_rate)
-        
-        total_clips += 1
-    
+# Files are independent, so they are spread over one process per CPU
+WORKERS = os.cpu_count() or 1
+
+# Per-process spectrogram generator, built once by _init_worker
+spec_gen = None
+
+
+def _init_worker():
+    global spec_gen
+    import matplotlib
+    matplotlib.use('Agg')
+    spec_gen = SpectrogramGenerator(
+        win_dur=WINDOW_DURATION,
+        overlap=OVERLAP,
+        freq_lims=(FREQ_MIN, FREQ_MAX),
+        log_freq=False,
+        clim=(-60, 0),
+        colormap='viridis'
+    )
+
+
+def regenerate_file(flac_idx, n_files, flac_path):
+    """Regenerate every clip of one FLAC file; returns the number written."""
+    n_written = 0
+    print(f"[{flac_idx+1}/{n_files}] Processing {flac_path.name}...")
+
+    with sf.SoundFile(str(flac_path)) as audio_file:
+        # Decode each padded clip on demand rather than the whole file
+        sample_rate = audio_file.samplerate
+        audio_duration = audio_file.frames / sample_rate
+
+        # Calculate number of clips
+        n_clips = int(np.ceil(audio_duration / CONTEXT_DURATION))
+
+        print(f"  Duration: {audio_duration:.1f}s @ {sample_rate}Hz → {n_clips} clips")
+
+        for clip_idx in range(n_clips):
+            start_sec = clip_idx * CONTEXT_DURATION
+            end_sec = min(start_sec + CONTEXT_DURATION, audio_duration)
+
+            # Add temporal padding
+            padded_start_sec = max(0, start_sec - TEMPORAL_PADDING)
+            padded_end_sec = min(audio_duration, end_sec + TEMPORAL_PADDING)
+
+            # Extract padded clip
+            padded_start_sample = int(padded_start_sec * sample_rate)
+            padded_end_sample = int(padded_end_sec * sample_rate)
+            audio_file.seek(padded_start_sample)
+            padded_clip = audio_file.read(padded_end_sample - padded_start_sample, dtype='float32')
+
+            # Track actual padding
+            actual_padding_before = start_sec - padded_start_sec
+            actual_padding_after = padded_end_sec - end_sec
+
+            # Generate spectrogram on padded audio
+            freqs, times, Sxx, power_db = spec_gen.compute_spectrogram(padded_clip, sample_rate)
+
+            # Trim spectrogram to target range
+            target_start_time = actual_padding_before
+            target_end_time = actual_padding_before + CONTEXT_DURATION
+
+            # times and freqs ascend, so each range is one contiguous slice
+            t_start = np.searchsorted(times, target_start_time, side='left')
+            t_end = np.searchsorted(times, target_end_time, side='right')
+
+            if t_start >= t_end:
+                print(f"    Warning: No valid time indices for clip {clip_idx}")
+                continue
+
+            # Trim to target
+            times_trimmed = times[t_start:t_end] - actual_padding_before
+            Sxx_trimmed = Sxx[:, t_start:t_end]
+            power_db_trimmed = power_db[:, t_start:t_end]
+
+            # Crop to frequency range
+            f_start = np.searchsorted(freqs, FREQ_MIN, side='left')
+            f_end = np.searchsorted(freqs, FREQ_MAX, side='right')
+
+            if f_start < f_end:
+                freqs_cropped = freqs[f_start:f_end]
+                Sxx_cropped = Sxx_trimmed[f_start:f_end, :]
+                power_db_cropped = power_db_trimmed[f_start:f_end, :]
+            else:
+                freqs_cropped = freqs
+                Sxx_cropped = Sxx_trimmed
+                power_db_cropped = power_db_trimmed
+
+            # Create file ID
+            file_id = f"{flac_path.stem}_clip{clip_idx:03d}"
+
+            # Save MAT file (PSDs as float32, the precision the app loads them at)
+            mat_path = MAT_DIR / f"{file_id}.mat"
+            scipy.io.savemat(str(mat_path), {
+                'F': freqs_cropped,
+                'T': times_trimmed,
+                'P': Sxx_cropped.astype(np.float32, copy=False),
+                'PdB_norm': power_db_cropped.astype(np.float32, copy=False),
+                'freq_min': FREQ_MIN,
+                'freq_max': FREQ_MAX,
+                'sample_rate': sample_rate,
+                'context_duration': CONTEXT_DURATION,
+                'temporal_padding_used': TEMPORAL_PADDING,
+            })
+
+            # Save PNG
+            png_path = PNG_DIR / f"{file_id}.png"
+            spec_gen.plot_spectrogram(
+                freqs_cropped, times_trimmed, power_db_cropped,
+                title=f"Clip {clip_idx} (with padding)",
+                save_path=png_path
+            )
+
+            # Save audio clip
+            target_start_sample = int(start_sec * sample_rate)
+            target_end_sample = int(end_sec * sample_rate)
+            # The target range lies inside the padded clip
+            target_clip = padded_clip[target_start_sample - padded_start_sample:target_end_sample - padded_start_sample]
+
+            # Ensure exact length
+            expected_samples = int(CONTEXT_DURATION * sample_rate)
+            if len(target_clip) < expected_samples:
+                target_clip = np.pad(target_clip, (0, expected_samples - len(target_clip)))
+            elif len(target_clip) > expected_samples:
+                target_clip = target_clip[:expected_samples]
+
+            audio_path = AUDIO_DIR / f"{file_id}.wav"
+            sf.write(str(audio_path), target_clip, sample_rate)
+
+            n_written += 1
+
     # Clean up matplotlib figures
     import matplotlib.pyplot as plt
     plt.close('all')
 
-print()
-print("=" * 70)
-print(f"✅ COMPLETE: Generated {total_clips} clips from {len(flac_files)} files")
-print(f"   MAT files: {MAT_DIR}")
-print(f"   PNG files: {PNG_DIR}")
-print(f"   Audio files: {AUDIO_DIR}")
-print("=" * 70)
+    return n_written
+
+
+def main():
+    print("=" * 70)
+    print("REGENERATING SPECTROGRAMS WITH TEMPORAL PADDING")
+    print("=" * 70)
+    print(f"Source: {FLAC_DIR}")
+    print(f"Output: {OUTPUT_DIR}")
+    print(f"Context duration: {CONTEXT_DURATION}s")
+    print(f"Temporal padding: {TEMPORAL_PADDING}s (eliminates edge effects)")
+    print(f"Window: {WINDOW_DURATION}s, Overlap: {OVERLAP}")
+    print(f"Freq range: {FREQ_MIN}-{FREQ_MAX} Hz")
+    print()
+
+    # Process each FLAC file
+    flac_files = sorted(FLAC_DIR.glob('*.flac'))
+    print(f"Found {len(flac_files)} FLAC files to process\n")
+
+    jobs = [(flac_idx, len(flac_files), flac_path) for flac_idx, flac_path in enumerate(flac_files)]
+    workers = max(1, min(WORKERS, len(jobs)))
+    if workers == 1:
+        _init_worker()
+        total_clips = sum(regenerate_file(*job) for job in jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            total_clips = sum(executor.map(regenerate_file, *zip(*jobs)))
+
+    print()
+    print("=" * 70)
+    print(f"✅ COMPLETE: Generated {total_clips} clips from {len(flac_files)} files")
+    print(f"   MAT files: {MAT_DIR}")
+    print(f"   PNG files: {PNG_DIR}")
+    print(f"   Audio files: {AUDIO_DIR}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
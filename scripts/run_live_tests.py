@@ -15,15 +15,19 @@ def _find_free_port() -> int:
 
 
 def _wait_for_server(url: str, timeout_s: float = 10.0) -> bool:
-    deadline = time.time() + timeout_s
-    while time.time() < deadline:
-        try:
-            resp = requests.get(f"{url}/_dash-layout", timeout=2)
-            if resp.status_code == 200:
-                return True
-        except requests.RequestException:
-            pass
-        time.sleep(0.2)
+    deadline = time.monotonic() + timeout_s
+    # Poll quickly at first so a fast start is noticed early, then back off.
+    delay = 0.05
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            try:
+                resp = session.get(f"{url}/_dash-layout", timeout=2)
+                if resp.status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     return False
 
 
@@ -0,0 +1,101 @@
+"""JSON and file-write helpers shared by the app and the standalone prediction tracker.
+
+Only the standard library is required; orjson is used when installed.
+"""
+import json
+import math
+import os
+import uuid
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed.
+
+    orjson rejects the non-standard NaN/Infinity literals that the stdlib
+    accepts, so those documents fall back to ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return True if any float nested in ``data`` is NaN or infinite."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps_json(data: Any, *, indent: Optional[int] = 2, sort_keys: bool = True) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes, using orjson when it can match the layout.
+
+    orjson would write NaN/Infinity as ``null``, so documents containing them
+    go through ``json.dumps``, which keeps the literals ``loads_json`` reads
+    back. orjson output otherwise differs from the stdlib only in spelling:
+    non-ASCII text is raw UTF-8 rather than ``\\u`` escapes, and some floats
+    use a different but equal representation (``0.00001`` vs ``1e-05``).
+    """
+    if orjson is not None and indent in (None, 2) and not _has_non_finite_float(data):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    # Indented stdlib output always goes through json's pure-Python encoder;
+    # ensure_ascii/check_circular tweaks do not make it measurably faster, so
+    # large files should rely on orjson (the "fast" extra) instead.
+    dump_kwargs = {"sort_keys": sort_keys}
+    if indent is None:
+        dump_kwargs["separators"] = (",", ":")
+    else:
+        dump_kwargs["indent"] = indent
+    return json.dumps(data, **dump_kwargs).encode("utf-8")
+
+
+def atomic_write_bytes(path: str, payload: bytes) -> None:
+    """Write ``payload`` to ``path`` via a same-directory temp file and ``os.replace``.
+
+    Readers see either the old or the new file, never a truncated one. The
+    existing file's permission bits are kept; a new file is created with mode
+    0o666 so the kernel applies the process umask, as ``open()`` would.
+    """
+    directory = os.path.dirname(path) or "."
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -32,11 +32,13 @@ Typical usage:
     tracker.save()
 """
 
-import json
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from shared.json_io import atomic_write_bytes, dumps_json, loads_json
+
 
 def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
     """Parse an ISO-8601 datetime string, accepting both `Z` and `+00:00`.
@@ -64,6 +66,16 @@ def _as_str(value: Any) -> Optional[str]:
     return text if text else None
 
 
+def _as_interned_str(value: Any) -> Optional[str]:
+    """Like :func:`_as_str`, for values repeated across items.
+
+    Class paths, labels, decisions and data source IDs come from small
+    vocabularies, so interning lets every item share one string object.
+    """
+    text = _as_str(value)
+    return sys.intern(text) if text is not None else None
+
+
 def _as_float(value: Any) -> Optional[float]:
     """Best-effort float conversion, returning ``None`` on invalid input."""
     if value is None:
@@ -157,6 +169,9 @@ class UnifiedPredictionTracker:
             "pipeline": {},
             "items": [],
         }
+        # item_id -> position in self.data["items"], built lazily by _find_item.
+        self._item_index: Dict[str, int] = {}
+        self._item_index_items: Optional[List[Dict[str, Any]]] = None
 
     def set_model_info(
         self,
@@ -410,7 +425,39 @@ class UnifiedPredictionTracker:
             if cleaned_source:
                 item["source_audio"] = cleaned_source
 
-        self.data["items"].append(item)
+        items = self.data["items"]
+        if self._item_index_items is items:
+            self._item_index.setdefault(item_id, len(items))
+        items.append(item)
+
+    def _rebuild_item_index(self) -> None:
+        items = self.data["items"]
+        index: Dict[str, int] = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.get("item_id"), position)
+        self._item_index = index
+        self._item_index_items = items
+
+    def _find_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return the first item with ``item_id``, or ``None``.
+
+        ``self.data["items"]`` is public and may be replaced or edited in
+        place, so a cached position is checked before use and a miss rebuilds
+        the index once before giving up.
+        """
+        rebuilt = False
+        if self._item_index_items is not self.data["items"]:
+            self._rebuild_item_index()
+            rebuilt = True
+        items = self.data["items"]
+        position = self._item_index.get(item_id)
+        if position is not None and position < len(items) and items[position].get("item_id") == item_id:
+            return items[position]
+        if rebuilt:
+            return None
+        self._rebuild_item_index()
+        position = self._item_index.get(item_id)
+        return items[position] if position is not None else None
 
     def add_verification(
         self,
@@ -437,30 +484,30 @@ class UnifiedPredictionTracker:
         Returns:
             ``True`` if the item was found and updated, else ``False``.
         """
-        for item in self.data["items"]:
-            if item["item_id"] == item_id:
-                verification_round = len(item["verifications"]) + 1
-                label_decisions = [
-                    {
-                        "label": str(label),
-                        "decision": "accepted",
-                        "threshold_used": threshold_used,
-                    }
-                    for label in (labels or [])
-                ]
-                verification = {
-                    "verified_at": datetime.now(timezone.utc).isoformat(),
-                    "verified_by": verified_by,
-                    "verification_round": verification_round,
-                    "verification_status": "verified",
-                    "label_decisions": label_decisions,
-                    "confidence": confidence,
-                    "notes": notes,
-                    "label_source": "expert",
-                }
-                item["verifications"].append(verification)
-                return True
-        return False
+        item = self._find_item(item_id)
+        if item is None:
+            return False
+        verification_round = len(item["verifications"]) + 1
+        label_decisions = [
+            {
+                "label": str(label),
+                "decision": "accepted",
+                "threshold_used": threshold_used,
+            }
+            for label in (labels or [])
+        ]
+        verification = {
+            "verified_at": datetime.now(timezone.utc).isoformat(),
+            "verified_by": verified_by,
+            "verification_round": verification_round,
+            "verification_status": "verified",
+            "label_decisions": label_decisions,
+            "confidence": confidence,
+            "notes": notes,
+            "label_source": "expert",
+        }
+        item["verifications"].append(verification)
+        return True
 
     def get_items_by_score_threshold(
         self,
@@ -661,7 +708,7 @@ class UnifiedPredictionTracker:
                     for output in model_outputs:
                         if not isinstance(output, dict):
                             continue
-                        class_hierarchy = _as_str(output.get("class_hierarchy"))
+                        class_hierarchy = _as_interned_str(output.get("class_hierarchy"))
                         score = _as_float(output.get("score"))
                         if class_hierarchy is None or score is None:
                             continue
@@ -689,8 +736,8 @@ class UnifiedPredictionTracker:
                             for decision in decisions:
                                 if not isinstance(decision, dict):
                                     continue
-                                label = _as_str(decision.get("label"))
-                                decision_type = _as_str(decision.get("decision"))
+                                label = _as_interned_str(decision.get("label"))
+                                decision_type = _as_interned_str(decision.get("decision"))
                                 if label is None or decision_type not in {"accepted", "rejected", "added"}:
                                     continue
                                 threshold_used = decision.get("threshold_used")
@@ -748,7 +795,7 @@ class UnifiedPredictionTracker:
                             paths_clean[key] = value
 
                 item_clean: Dict[str, Any] = {"item_id": item_id}
-                data_source_id = _as_str(raw_item.get("data_source_id"))
+                data_source_id = _as_interned_str(raw_item.get("data_source_id"))
                 if data_source_id is not None:
                     item_clean["data_source_id"] = data_source_id
                 if audio_start_time is not None:
@@ -786,14 +833,12 @@ class UnifiedPredictionTracker:
         self.data["updated_at"] = now
 
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_path, "w") as f:
-            json.dump(self.data, f, indent=2)
+        atomic_write_bytes(self.output_path, dumps_json(self.data, sort_keys=False))
 
     def load(self) -> None:
         """Load tracker JSON from disk and normalize it in memory."""
         if self.output_path.exists():
-            with open(self.output_path, "r") as f:
-                self.data = json.load(f)
+            self.data = loads_json(self.output_path.read_bytes())
             self._normalize_loaded_data()
 
     @classmethod
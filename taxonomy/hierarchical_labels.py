@@ -4,6 +4,7 @@ This module defines the nested label hierarchy used by the labeling UI,
 along with utilities for path formatting, validation, and legacy flat-label
 conversion.
 """
+from functools import lru_cache
 
 HIERARCHICAL_LABELS = {
     "Anthropophony": {
@@ -180,6 +181,8 @@ def get_all_paths(hierarchy=None, current_path=None):
     Get all possible label paths from the hierarchy.
     Returns a list of tuples where each tuple represents a path.
     """
+    if hierarchy is None and current_path is None:
+        return list(_default_paths())
     if hierarchy is None:
         hierarchy = HIERARCHICAL_LABELS
     if current_path is None:
@@ -198,27 +201,37 @@ def get_all_paths(hierarchy=None, current_path=None):
     
     return paths
 
+# The default hierarchy is static, so its walks are done once per process.
+@lru_cache(maxsize=1)
+def _default_paths():
+    return tuple(get_all_paths(HIERARCHICAL_LABELS))
+
+@lru_cache(maxsize=1)
+def _default_path_set():
+    return frozenset(_default_paths())
+
+@lru_cache(maxsize=1)
+def _default_leaf_labels():
+    leaf_labels = []
+    
+    def walk(hierarchy):
+        for key, value in hierarchy.items():
+            if isinstance(value, dict) and value:
+                walk(value)
+            else:
+                leaf_labels.append(key)
+    
+    walk(HIERARCHICAL_LABELS)
+    return tuple(leaf_labels)
+
 def get_label_display_name(path):
     """Convert a path tuple to a display-friendly string"""
     return " > ".join(path)
 
 def get_flat_labels():
     """Get all leaf labels for backwards compatibility"""
-    all_paths = get_all_paths()
-    # return only the deepest level labels that don't have children
-    leaf_labels = []
-    
-    def is_leaf(path, hierarchy=HIERARCHICAL_LABELS):
-        current = hierarchy
-        for part in path:
-            current = current[part]
-        return not isinstance(current, dict) or not current
-    
-    for path in all_paths:
-        if is_leaf(path):
-            leaf_labels.append(path[-1])  # just the final label name
-    
-    return leaf_labels
+    # only the deepest level labels that don't have children, in path order
+    return list(_default_leaf_labels())
 
 def path_to_string(path):
     """Convert path tuple to string representation for JSON storage"""
@@ -245,6 +258,15 @@ LEGACY_LABEL_MAPPING = {
     "tonal": "Instrumentation > Self-noise > Non-acoustic self noise > Tonal"
 }
 
+# hierarchical path -> legacy label; built in reverse so the first occurrence
+# (the canonical form) is the one that sticks
+REVERSE_LEGACY_LABEL_MAPPING = {
+    hierarchical: legacy
+    for legacy, hierarchical in reversed(list(LEGACY_LABEL_MAPPING.items()))
+}
+
+UNKNOWN_SOUND_LABEL = "Other > Unknown sound of interest"
+
 def is_legacy_format(label_data):
     """
     Check if the loaded data is in legacy flat format.
@@ -282,19 +304,14 @@ def convert_legacy_to_hierarchical(legacy_labels):
         else:
             # if we can't map it, try to keep it as-is or map to unknown
             if isinstance(label, str) and " > " not in label:
-                hierarchical_labels.append(f"Other > Unknown sound of interest")
+                hierarchical_labels.append(UNKNOWN_SOUND_LABEL)
             else:
                 hierarchical_labels.append(str(label))
     return hierarchical_labels
 
 def convert_hierarchical_to_legacy(hierarchical_labels):
     """Convert hierarchical labels back to legacy flat format for compatibility"""
-    # create reverse mapping, prioritizing canonical forms (first occurrence)
-    reverse_mapping = {}
-    for legacy, hierarchical in LEGACY_LABEL_MAPPING.items():
-        if hierarchical not in reverse_mapping:
-            reverse_mapping[hierarchical] = legacy
-    
+    reverse_mapping = REVERSE_LEGACY_LABEL_MAPPING
     legacy_labels = []
     for label in hierarchical_labels:
         if isinstance(label, str):
@@ -314,7 +331,8 @@ def convert_hierarchical_to_legacy(hierarchical_labels):
 def is_valid_path(path, hierarchy=None):
     """Check if a given path is valid in the hierarchy"""
     if hierarchy is None:
-        hierarchy = HIERARCHICAL_LABELS
+        path = tuple(path)
+        return not path or path in _default_path_set()
     
     current = hierarchy
     for part in path:
@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
+import threading
 
 from app.config import get_config
 from app.utils.data_discovery import detect_data_structure
-from app.utils.data_loading import load_label_mode, load_verify_mode, load_whale_mode
+from app.utils.data_loading import _index_spec_dir, _load_once, load_label_mode, load_verify_mode, load_whale_mode
 
 
 def test_load_label_mode(mock_config):
@@ -150,3 +152,50 @@ def test_load_whale_mode(mock_config):
     assert data["items"], "Expected whale items"
     assert data["summary"]["total_items"] == len(data["items"])
     assert any(item.get("predictions") for item in data["items"])
+
+
+def test_index_spec_dir_prefers_exact_names_and_mat_over_npy(tmp_path):
+    for name in ("clip.mat", "clip.npy", "other.npy", "clip.png", ".hidden.mat", "notes.txt"):
+        (tmp_path / name).touch()
+
+    spec_files, mat_index, image_index = _index_spec_dir(str(tmp_path))
+
+    assert [Path(p).name for p in spec_files] == ["clip.mat", "clip.npy", "other.npy", "clip.png"]
+    assert mat_index["clip"] == str(tmp_path / "clip.mat")
+    assert mat_index["clip.npy"] == str(tmp_path / "clip.npy")
+    assert mat_index["other"] == str(tmp_path / "other.npy")
+    assert image_index["clip"] == str(tmp_path / "clip.png")
+    assert ".hidden" not in mat_index
+
+
+def test_load_whale_mode_cache_returns_fresh_copies_and_tracks_file_changes(tmp_path):
+    predictions_path = tmp_path / "predictions.json"
+    predictions_path.write_text(json.dumps({"items": [{"item_id": "clip_a"}]}))
+    config = {"whale": {"predictions_json": str(predictions_path)}}
+
+    first = load_whale_mode(config)
+    first["items"][0]["item_id"] = "mutated"
+    second = load_whale_mode(config)
+    assert second["items"][0]["item_id"] == "clip_a"
+
+    predictions_path.write_text(json.dumps({"items": [{"item_id": "clip_a"}, {"item_id": "clip_b"}]}))
+    third = load_whale_mode(config)
+    assert [item["item_id"] for item in third["items"]] == ["clip_a", "clip_b"]
+
+
+def test_load_once_loads_keys_in_parallel_and_each_key_once():
+    cache, lock = {}, threading.Lock()
+    both_loading = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def load(key):
+        calls.append(key)
+        both_loading.wait()  # "a" and "b" must be loading at the same time
+        return key.upper()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_load_once, cache, lock, key, lambda key=key: load(key)) for key in ["a", "b", "a", "b"]]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["A", "B", "A", "B"]
+    assert sorted(calls) == ["a", "b"]
@@ -1,10 +1,12 @@
 import json
 
 from app.utils.format_converters import (
+    convert_hydrophonedashboard_file_to_unified,
     convert_hydrophonedashboard_to_unified,
     convert_legacy_labeling_to_unified,
     convert_whale_predictions_to_unified,
 )
+from app.utils.unified_format_converter import convert_unified_v2_to_internal
 
 
 def test_convert_legacy_labeling_to_unified(mock_root):
@@ -28,6 +30,23 @@ def test_convert_hydrophonedashboard_to_unified(mock_root):
     assert data["items"][0]["predictions"] is not None
 
 
+def test_convert_hydrophonedashboard_file_to_unified(tmp_path):
+    labels_json = {
+        "clip_a.png": {"predicted_labels": ["Other > Ambient sound"], "verified_labels": ["Other > Ambient sound"]},
+        "clip_b.png": ["Anthropophony > Vessel"],
+    }
+    labels_path = tmp_path / "labels.json"
+    labels_path.write_text(json.dumps(labels_json))
+
+    data = convert_hydrophonedashboard_file_to_unified(str(labels_path), "2026-01-07", "DEV", str(tmp_path / "images"))
+    expected = convert_hydrophonedashboard_to_unified(labels_json, "2026-01-07", "DEV", str(tmp_path / "images"))
+    assert data["items"] == expected["items"]
+    assert data["summary"] == {"total_items": 2, "annotated": 1, "verified": 1}
+
+    missing = convert_hydrophonedashboard_file_to_unified(str(tmp_path / "absent.json"), "2026-01-07", "DEV", "")
+    assert missing["items"] == []
+
+
 def test_convert_whale_predictions_to_unified(mock_root):
     pred_path = mock_root / "whale" / "predictions.json"
     predictions_json = json.loads(pred_path.read_text())
@@ -35,3 +54,29 @@ def test_convert_whale_predictions_to_unified(mock_root):
     assert len(data["items"]) == 2
     assert data["items"][0]["predictions"] is not None
 
+
+
+def test_convert_unified_v2_resolves_only_existing_relative_paths(tmp_path):
+    (tmp_path / "mat").mkdir()
+    (tmp_path / "mat" / "a.mat").write_bytes(b"")
+    predictions = {
+        "schema_version": "2.1",
+        "items": [
+            {
+                "item_id": "a",
+                "paths": {
+                    "spectrogram_mat_path": "mat/a.mat",
+                    "spectrogram_png_path": "png/a.png",
+                    "audio_path": "/abs/a.wav",
+                },
+            },
+            {"item_id": "b", "paths": {"spectrogram_mat_path": "mat/b.mat"}},
+        ],
+    }
+
+    items = convert_unified_v2_to_internal(predictions, base_path=str(tmp_path))["items"]
+
+    assert items[0]["mat_path"] == str(tmp_path / "mat" / "a.mat")
+    assert items[0]["spectrogram_path"] == "png/a.png"
+    assert items[0]["audio_path"] == "/abs/a.wav"
+    assert items[1]["mat_path"] == "mat/b.mat"
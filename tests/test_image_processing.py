@@ -1,9 +1,16 @@
+import base64
+from io import BytesIO
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+import os
 import threading
 import time
 from unittest.mock import patch
 
+import numpy as np
+from PIL import Image
+import scipy.io as sio
+
 from app.utils import image_processing
 from app.utils.image_processing import (
     create_image_file_figure,
@@ -15,6 +22,10 @@ from app.utils.image_processing import (
 )
 from app.utils.image_utils import image_file_to_base64
 
+# Data-URI prefix plus the base64 of the 8-byte PNG signature, so a prefix
+# check also proves the payload is a PNG without decoding it.
+PNG_DATA_URI_PREFIX = "data:image/png;base64,iVBORw0KGgo"
+
 
 def test_load_spectrogram_cached(mock_root):
     mat_dir = Path(mock_root) / "label" / "mat_files"
@@ -28,14 +39,161 @@ def test_generate_image_cached(mock_root):
     mat_dir = Path(mock_root) / "label" / "mat_files"
     mat_path = next(mat_dir.glob("*.mat"))
     image_src = generate_image_cached(str(mat_path), colormap="default", y_axis_scale="linear")
-    assert image_src.startswith("data:image/png;base64,")
+    assert image_src.startswith(PNG_DATA_URI_PREFIX)
+
+
+def test_thumbnail_renders_low_rows_at_bottom_and_nan_transparent():
+    psd = np.full((4, 20), -60.0)
+    psd[0, :] = 0.0
+    psd[:, :2] = np.nan
+    spectrogram = {"psd": psd, "freq": np.array([0.0, 10.0, 20.0, 30.0]), "time": np.arange(20.0)}
+
+    src = image_processing._generate_image_from_spectrogram_data(spectrogram)
+    image = Image.open(BytesIO(base64.b64decode(src.split(",", 1)[1])))
+    pixels = np.asarray(image)
+
+    assert image.mode == "RGBA"
+    assert image.size == (image_processing.THUMBNAIL_SIZE_PX, image_processing.THUMBNAIL_SIZE_PX)
+    lut = image_processing._colormap_lut("default")
+    assert tuple(pixels[-1, -1]) == tuple(lut[-1])
+    assert tuple(pixels[0, -1]) == tuple(lut[0])
+    assert pixels[:, 0, 3].max() == 0
+
+
+def test_color_limit_summary_matches_numpy_percentiles():
+    psd = np.random.default_rng(3).normal(-60.0, 8.0, size=(64, 97))
+    psd[5, :10] = np.nan
+    original = psd.copy()
+    finite = psd[np.isfinite(psd)]
+
+    summary = image_processing._compute_color_limit_summary(psd)
+
+    np.testing.assert_array_equal(psd, original)
+    assert summary["data_min"] == finite.min()
+    assert summary["data_max"] == finite.max()
+    np.testing.assert_allclose(
+        [summary["auto_min"], summary["auto_max"]],
+        np.percentile(finite, [2, 98]),
+        rtol=0,
+        atol=1e-9,
+    )
+
+
+def test_color_summary_is_computed_once_per_spectrogram():
+    spectrogram = {"psd": np.random.default_rng(4).normal(size=(8, 12)), "freq": np.arange(8.0), "time": np.arange(12.0)}
+    image_processing._generate_image_from_spectrogram_data(spectrogram)
+
+    with patch.object(image_processing, "_compute_color_limit_summary", side_effect=AssertionError("recomputed")):
+        image_processing._generate_image_from_spectrogram_data(spectrogram, colormap="hydrophone")
+        ranges = image_processing.summarize_spectrogram_display_ranges(spectrogram)
+
+    assert ranges["color_auto_max"] == spectrogram["_color_summary"]["auto_max"]
+
+
+def test_generate_image_reuses_disk_cached_thumbnail(tmp_path, monkeypatch):
+    mat_path = tmp_path / "clip.mat"
+    sio.savemat(mat_path, {"P": np.random.default_rng(0).normal(size=(16, 32)), "F": np.arange(16.0), "T": np.arange(32.0)})
+    cache_dir = tmp_path / "thumbs"
+    monkeypatch.setattr(image_processing, "THUMBNAIL_DISK_CACHE_DIR", str(cache_dir))
+
+    first = image_processing._generate_image(str(mat_path))
+    cached_files = list(cache_dir.rglob("*.png"))
+    assert len(cached_files) == 1
+
+    with patch.object(image_processing, "load_spectrogram_cached", side_effect=AssertionError("re-rendered")):
+        assert image_processing._generate_image(str(mat_path)) == first
+
+    image_processing._generate_image(str(mat_path), colormap="hydrophone")
+    assert len(list(cache_dir.rglob("*.png"))) == 2
+
+
+def test_item_thumbnails_use_the_disk_cache_across_restarts(tmp_path, monkeypatch):
+    mat_path = tmp_path / "clip.mat"
+    sio.savemat(mat_path, {"P": np.random.default_rng(2).normal(size=(16, 32)), "F": np.arange(16.0), "T": np.arange(32.0)})
+    cache_dir = tmp_path / "thumbs"
+    monkeypatch.setattr(image_processing, "THUMBNAIL_DISK_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(image_processing, "image_cache", image_processing.LRUCache(maxsize=4))
+    item = {"item_id": "clip", "mat_path": str(mat_path)}
+
+    first = image_processing.generate_item_image_png_cached(item, None)
+    assert len(list(cache_dir.rglob("*.png"))) == 1
+
+    # A fresh process starts with an empty in-memory cache.
+    monkeypatch.setattr(image_processing, "image_cache", image_processing.LRUCache(maxsize=4))
+    with patch.object(image_processing, "load_spectrogram_cached", side_effect=AssertionError("re-rendered")):
+        assert image_processing.generate_item_image_png_cached(item, None) == first
+        # The MAT-path renderer shares the same entries.
+        assert image_processing._generate_image_png(str(mat_path)) == first
+
+
+def test_thumbnail_disk_cache_drops_oldest_files_past_size_bound(tmp_path, monkeypatch):
+    mat_path = tmp_path / "clip.mat"
+    sio.savemat(mat_path, {"P": np.random.default_rng(1).normal(size=(16, 32)), "F": np.arange(16.0), "T": np.arange(32.0)})
+    cache_dir = tmp_path / "thumbs"
+    monkeypatch.setattr(image_processing, "THUMBNAIL_DISK_CACHE_DIR", str(cache_dir))
+
+    image_processing._generate_image(str(mat_path))
+    first_file = next(cache_dir.rglob("*.png"))
+    os.utime(first_file, ns=(0, 0))
+    monkeypatch.setattr(image_processing, "THUMBNAIL_DISK_CACHE_MAX_BYTES", first_file.stat().st_size * 2)
+
+    for colormap, y_axis_scale in [("hydrophone", "linear"), ("default", "log")]:
+        image_processing._generate_image(str(mat_path), colormap=colormap, y_axis_scale=y_axis_scale)
+
+    remaining = list(cache_dir.rglob("*.png"))
+    assert first_file not in remaining
+    assert sum(path.stat().st_size for path in remaining) <= image_processing.THUMBNAIL_DISK_CACHE_MAX_BYTES
+
+
+def test_full_thumbnail_disk_cache_evicts_to_low_water_mark(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "thumbs"
+    bucket = cache_dir / "ab"
+    bucket.mkdir(parents=True)
+    monkeypatch.setattr(image_processing, "THUMBNAIL_DISK_CACHE_MAX_BYTES", 1000)
+
+    def add_file(index):
+        path = bucket / f"{index:02d}.png"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, ns=(index * 10**9, index * 10**9))
+        image_processing._record_thumbnail_disk_write(str(cache_dir), 100)
+
+    for index in range(11):
+        add_file(index)
+    assert sorted(path.name for path in bucket.iterdir()) == [f"{index:02d}.png" for index in range(2, 11)]
+
+    # The next write fits under the bound again without rescanning the directory.
+    with patch.object(image_processing, "_scan_thumbnail_disk_cache", side_effect=AssertionError("rescanned")):
+        add_file(11)
+
+
+def test_load_mat_returns_c_ordered_float32_psd(tmp_path):
+    mat_path = tmp_path / "spec.mat"
+    psd = np.array([[-40.0, np.nan, -np.inf], [np.inf, -20.0, -10.0]])
+    sio.savemat(mat_path, {"P": psd, "F": np.array([10.0, 20.0]), "T": np.arange(3.0)})
+
+    loaded = image_processing._load_mat(str(mat_path))
+
+    assert loaded["psd"].dtype == np.float32
+    assert loaded["psd"].flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(loaded["psd"], [[-40.0, 0.0, 0.0], [0.0, -20.0, -10.0]])
+
+
+def test_encode_file_base64_matches_stdlib_encoding(tmp_path):
+    payload = bytes(range(256)) * 3 + b"x"
+    path = tmp_path / "thumb.png"
+    path.write_bytes(payload)
+    empty = tmp_path / "empty.png"
+    empty.write_bytes(b"")
+
+    assert image_processing.encode_file_base64(str(path)) == base64.b64encode(payload).decode("ascii")
+    assert image_processing.encode_file_base64(str(empty)) == ""
 
 
 def test_image_file_to_base64(mock_root):
     image_dir = Path(mock_root) / "verify" / "dashboard" / "2026-01-07" / "ICLISTENHF0001" / "images"
     image_path = next(image_dir.glob("*.png"))
     src = image_file_to_base64(str(image_path))
-    assert src.startswith("data:image/png;base64,")
+    assert src.startswith(PNG_DATA_URI_PREFIX)
 
 
 def test_create_image_file_figure_embeds_existing_spectrogram_image(mock_root):
@@ -46,7 +204,7 @@ def test_create_image_file_figure_embeds_existing_spectrogram_image(mock_root):
 
     assert fig is not None
     assert fig.layout.images
-    assert fig.layout.images[0].source.startswith("data:image/png;base64,")
+    assert fig.layout.images[0].source.startswith(PNG_DATA_URI_PREFIX)
     assert list(fig.layout.xaxis.range) == [0.0, 300.0]
     assert fig.layout.meta["render_source"] == "image_file"
     assert fig.layout.meta["x_to_seconds"] == 1.0
@@ -117,7 +275,7 @@ def test_cached_item_image_does_not_rebuild_evicted_spectrogram(tmp_path):
     assert cache_key is not None
 
     with image_processing._IMAGE_CACHE_LOCK:
-        image_processing.image_cache[cache_key] = "data:image/png;base64,cached"
+        image_processing.image_cache[cache_key] = b"cached-png"
 
     with patch.object(
         image_processing,
@@ -126,4 +284,4 @@ def test_cached_item_image_does_not_rebuild_evicted_spectrogram(tmp_path):
     ):
         result = generate_item_image_cached(item, cfg)
 
-    assert result == "data:image/png;base64,cached"
+    assert result == "data:image/png;base64," + base64.b64encode(b"cached-png").decode("ascii")
@@ -1,5 +1,4 @@
 import os
-import time
 
 import pytest
 import requests
@@ -7,20 +6,20 @@ import requests
 pytestmark = pytest.mark.live
 
 
-def _find_component_by_id(node, target_id):
-    if isinstance(node, dict):
-        if node.get("props", {}).get("id") == target_id:
-            return node
-        for key, value in node.items():
-            found = _find_component_by_id(value, target_id)
-            if found is not None:
-                return found
-    elif isinstance(node, list):
-        for item in node:
-            found = _find_component_by_id(item, target_id)
-            if found is not None:
-                return found
-    return None
+def _components_by_id(layout):
+    """Map each string component id in a Dash layout to its component, in one walk."""
+    components = {}
+    stack = [layout]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            component_id = node.get("props", {}).get("id")
+            if isinstance(component_id, str):
+                components.setdefault(component_id, node)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return components
 
 
 @pytest.fixture(scope="session")
@@ -31,28 +30,36 @@ def base_url():
     return url.rstrip("/")
 
 
-def test_dash_layout_available(base_url):
-    resp = requests.get(f"{base_url}/_dash-layout", timeout=5)
+@pytest.fixture(scope="session")
+def http():
+    # One keep-alive connection pool for every request in the run.
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def layout_components(base_url, http):
+    """The served layout's components by id, fetched and indexed once per run."""
+    resp = http.get(f"{base_url}/_dash-layout", timeout=5)
     assert resp.status_code == 200
-    layout = resp.json()
-    assert _find_component_by_id(layout, "mode-tabs") is not None
-    assert _find_component_by_id(layout, "config-store") is not None
-    assert _find_component_by_id(layout, "profile-btn") is not None
-    assert _find_component_by_id(layout, "theme-toggle") is not None
+    return _components_by_id(resp.json())
+
+
+def test_dash_layout_available(layout_components):
+    for component_id in ("mode-tabs", "config-store", "profile-btn", "theme-toggle"):
+        assert component_id in layout_components
 
 
-def test_dash_dependencies_available(base_url):
-    resp = requests.get(f"{base_url}/_dash-dependencies", timeout=5)
+def test_dash_dependencies_available(base_url, http):
+    resp = http.get(f"{base_url}/_dash-dependencies", timeout=5)
     assert resp.status_code == 200
     deps = resp.json()
     assert isinstance(deps, list)
     assert deps, "Expected at least one dependency"
 
 
-def test_load_data_callback(base_url):
-    layout_resp = requests.get(f"{base_url}/_dash-layout", timeout=5)
-    layout = layout_resp.json()
-    config_store = _find_component_by_id(layout, "config-store")
+def test_load_data_callback(base_url, http, layout_components):
+    config_store = layout_components.get("config-store")
     assert config_store is not None
     config_data = config_store.get("props", {}).get("data")
 
@@ -72,7 +79,7 @@ def test_load_data_callback(base_url):
         "changedPropIds": ["label-reload.n_clicks"],
     }
 
-    resp = requests.post(f"{base_url}/_dash-update-component", json=payload, timeout=10)
+    resp = http.post(f"{base_url}/_dash-update-component", json=payload, timeout=10)
     assert resp.status_code == 200
     body = resp.json()
     response = body.get("response", {})
@@ -82,7 +89,7 @@ def test_load_data_callback(base_url):
     assert "summary" in data
 
 
-def test_theme_toggle_updates_store(base_url):
+def test_theme_toggle_updates_store(base_url, http):
     payload = {
         "output": "theme-store.data",
         "outputs": {"id": "theme-store", "property": "data"},
@@ -93,7 +100,7 @@ def test_theme_toggle_updates_store(base_url):
         "changedPropIds": ["theme-toggle.value"],
     }
 
-    resp = requests.post(f"{base_url}/_dash-update-component", json=payload, timeout=10)
+    resp = http.post(f"{base_url}/_dash-update-component", json=payload, timeout=10)
     assert resp.status_code == 200
     body = resp.json()
     response = body.get("response", {})
@@ -1,9 +1,22 @@
 import json
+import math
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 
-from app.utils.file_io import read_json
-from app.utils.label_operations import load_labels
+import pytest
+
+from app.utils import label_operations, persistence
+from app.utils.file_io import read_json, write_json
+from app.utils.label_operations import (
+    _find_item,
+    _labels_file_lock,
+    add_label,
+    load_labels,
+    remove_label,
+    save_labels,
+)
 from app.utils.persistence import save_label_mode, save_verify_mode, save_verify_predictions
 from app.utils.unified_format_converter import convert_unified_v2_to_internal
 
@@ -36,9 +49,11 @@ def test_save_label_mode(tmp_path, mock_root):
 
 
 def test_save_verify_mode(tmp_path, mock_root):
-    src_root = mock_root / "verify" / "dashboard"
+    # save_verify_mode only touches the one date/device labels.json.
+    relative_labels = Path("2026-01-07") / "ICLISTENHF0001" / "labels.json"
     dst_root = tmp_path / "dashboard"
-    shutil.copytree(src_root, dst_root)
+    (dst_root / relative_labels).parent.mkdir(parents=True)
+    shutil.copy(mock_root / "verify" / "dashboard" / relative_labels, dst_root / relative_labels)
 
     save_verify_mode(
         str(dst_root),
@@ -49,7 +64,7 @@ def test_save_verify_mode(tmp_path, mock_root):
         username="tester",
     )
 
-    labels_path = dst_root / "2026-01-07" / "ICLISTENHF0001" / "labels.json"
+    labels_path = dst_root / relative_labels
     data = json.loads(labels_path.read_text())
     entry = data["ICLISTENHF0001_20260107T120500.000Z_20260107T121000.000Z.png"]
     assert entry["verified_labels"] == ["Anthropophony > Vessel"]
@@ -80,6 +95,70 @@ def test_save_label_mode_persists_bbox_tag(tmp_path):
     }
 
 
+def test_load_labels_cache_returns_fresh_lists_and_sees_saves(tmp_path):
+    labels_path = tmp_path / "labels.json"
+    labels_path.write_text(json.dumps({"clip-1.mat": ["A"]}))
+
+    first = load_labels(str(labels_path))
+    first["clip-1.mat"].append("mutated")
+    assert load_labels(str(labels_path)) == {"clip-1.mat": ["A"]}
+
+    save_labels(str(labels_path), "clip-1", ["B"])
+    assert load_labels(str(labels_path)) == {"clip-1": ["B"]}
+
+
+def test_save_labels_seeds_the_load_labels_cache(tmp_path, monkeypatch):
+    labels_path = tmp_path / "labels.json"
+    save_labels(str(labels_path), "clip-1", ["A"])
+
+    def fail_parse(_path):
+        raise AssertionError("load_labels re-parsed a file it had just written")
+
+    monkeypatch.setattr("app.utils.label_operations._load_labels_uncached", fail_parse)
+    assert load_labels(str(labels_path)) == {"clip-1": ["A"]}
+
+
+def test_load_labels_treats_blank_files_as_empty(tmp_path, capsys):
+    labels_path = tmp_path / "labels.json"
+    labels_path.write_bytes(b"")
+
+    assert load_labels(str(labels_path)) == {}
+    assert capsys.readouterr().out == ""
+
+
+def test_add_and_remove_label_edit_the_stored_item(tmp_path):
+    labels_path = tmp_path / "labels.json"
+    save_labels(str(labels_path), "clip-1", ["A"])
+
+    assert add_label(str(labels_path), "clip-1", "B")
+    assert add_label(str(labels_path), "clip-1", "B")
+    assert load_labels(str(labels_path)) == {"clip-1": ["A", "B"]}
+
+    assert remove_label(str(labels_path), "clip-1", "A")
+    assert remove_label(str(labels_path), "clip-1", "missing")
+    assert load_labels(str(labels_path)) == {"clip-1": ["B"]}
+    # Re-adding "B" and removing an absent label are no-ops and leave the file alone.
+    assert json.loads(labels_path.read_text())["items"][0]["verifications"][-1]["verification_round"] == 3
+
+
+def test_concurrent_add_label_calls_do_not_lose_updates(tmp_path):
+    labels_path = tmp_path / "labels.json"
+    labels = [f"label-{idx}" for idx in range(12)]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        assert all(pool.map(lambda label: add_label(str(labels_path), "clip-1", label), labels))
+
+    assert sorted(load_labels(str(labels_path))["clip-1"]) == sorted(labels)
+
+
+def test_find_item_matches_ids_with_or_without_extension():
+    items = [{"item_id": None}, {"item_id": "clip-10.wav"}, {"item_id": "clip-1.MAT"}, {"item_id": "clip-1"}]
+
+    assert _find_item(items, "clip-1.mat") is items[2]
+    assert _find_item(items, "clip-10") is items[1]
+    assert _find_item(items, "clip-2.mat") is None
+
+
 def test_save_verify_predictions_persists_and_reloads_bbox_tag(tmp_path):
     predictions_path = tmp_path / "predictions.json"
     predictions_path.write_text(
@@ -117,3 +196,113 @@ def test_save_verify_predictions_persists_and_reloads_bbox_tag(tmp_path):
 
     reloaded = convert_unified_v2_to_internal(saved)
     assert reloaded["items"][0]["annotations"]["box_annotations"] == [box]
+
+
+def test_save_verify_predictions_reuses_its_parse_until_the_file_changes(tmp_path, monkeypatch):
+    predictions_path = tmp_path / "predictions.json"
+    predictions_path.write_text(
+        json.dumps({"items": [{"item_id": "clip-1"}, {"item_id": "clip-2"}, {"item_id": "clip-1"}]})
+    )
+    verification = {"verified_by": "Reviewer", "label_decisions": []}
+
+    assert save_verify_predictions(str(predictions_path), "clip-2", verification)["verification_round"] == 1
+
+    def fail_loads(raw):
+        raise AssertionError("predictions.json should not be re-parsed")
+
+    monkeypatch.setattr(persistence, "loads_json", fail_loads)
+    assert save_verify_predictions(str(predictions_path), "clip-2", verification)["verification_round"] == 2
+    assert save_verify_predictions(str(predictions_path), "clip-1", verification)["verification_round"] == 1
+    assert save_verify_predictions(str(predictions_path), "missing", verification) is None
+    monkeypatch.undo()
+
+    saved = json.loads(predictions_path.read_text())
+    assert [len(item.get("verifications", [])) for item in saved["items"]] == [1, 2, 0]
+
+    # An external edit is picked up instead of being overwritten.
+    saved["items"].append({"item_id": "clip-3"})
+    predictions_path.write_text(json.dumps(saved))
+    assert save_verify_predictions(str(predictions_path), "clip-3", verification)["verification_round"] == 1
+    assert len(json.loads(predictions_path.read_text())["items"]) == 4
+
+    # So is one that keeps the file's size and mtime.
+    stat = predictions_path.stat()
+    predictions_path.write_text(predictions_path.read_text().replace('"clip-3"', '"clip-9"'))
+    os.utime(predictions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert save_verify_predictions(str(predictions_path), "clip-3", verification) is None
+    assert save_verify_predictions(str(predictions_path), "clip-9", verification)["verification_round"] == 2
+
+
+def test_load_labels_shares_repeated_label_strings(tmp_path):
+    labels_path = tmp_path / "labels.json"
+    labels_path.write_text(json.dumps({"a.mat": [FIN_WHALE], "b.mat": [FIN_WHALE, "Unknown"]}))
+
+    loaded = load_labels(str(labels_path))
+
+    assert loaded == {"a.mat": [FIN_WHALE], "b.mat": [FIN_WHALE, "Unknown"]}
+    assert loaded["a.mat"][0] is loaded["b.mat"][0]
+
+
+def test_labels_file_lock_is_per_file(tmp_path):
+    first = str(tmp_path / "a" / "labels.json")
+    second = str(tmp_path / "b" / "labels.json")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with _labels_file_lock(first):
+            # A different file saves while the first lock is held; the same
+            # file waits until it is released.
+            assert pool.submit(save_labels, second, "clip-1.mat", ["Unknown"]).result(timeout=5)
+            same_file = pool.submit(save_labels, first, "clip-1.mat", ["Unknown"])
+            with pytest.raises(FutureTimeoutError):
+                same_file.result(timeout=0.2)
+        assert same_file.result(timeout=5)
+
+
+def test_label_edits_reuse_the_written_document_until_the_file_changes(tmp_path, monkeypatch):
+    labels_path = str(tmp_path / "labels.json")
+    assert add_label(labels_path, "clip-1.mat", "Unknown")
+
+    def fail_loads(raw):
+        raise AssertionError("labels.json should not be re-parsed")
+
+    monkeypatch.setattr(label_operations, "loads_json", fail_loads)
+    assert add_label(labels_path, "clip-1.mat", FIN_WHALE)
+    monkeypatch.undo()
+
+    # No-op edits leave neither the file nor the next edit's document changed.
+    assert add_label(labels_path, "clip-1.mat", "Unknown")
+    assert remove_label(labels_path, "clip-2.mat", "Unknown")
+
+    saved = read_json(labels_path)
+    assert [item["item_id"] for item in saved["items"]] == ["clip-1.mat"]
+    assert [v["verification_round"] for v in saved["items"][0]["verifications"]] == [1, 2]
+
+    # An external edit is picked up instead of being overwritten.
+    saved["items"].append({"item_id": "clip-3.mat", "verifications": []})
+    Path(labels_path).write_text(json.dumps(saved))
+    assert add_label(labels_path, "clip-3.mat", "Unknown")
+    assert load_labels(labels_path) == {"clip-1.mat": ["Unknown", FIN_WHALE], "clip-3.mat": ["Unknown"]}
+
+
+def test_write_json_round_trips_non_finite_floats(tmp_path):
+    path = tmp_path / "data" / "scores.json"
+    data = {"nan": math.nan, "inf": math.inf, "items": [{"score": -math.inf}, {"score": 0.5}]}
+
+    write_json(str(path), data)
+    loaded = read_json(str(path))
+
+    assert math.isnan(loaded["nan"])
+    assert loaded["inf"] == math.inf
+    assert loaded["items"] == [{"score": -math.inf}, {"score": 0.5}]
+
+
+def test_write_json_creates_new_files_under_the_current_umask(tmp_path):
+    path = tmp_path / "labels.json"
+    previous = os.umask(0o027)
+    try:
+        write_json(str(path), {"a": 1})
+    finally:
+        os.umask(previous)
+
+    assert (path.stat().st_mode & 0o777) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["labels.json"]
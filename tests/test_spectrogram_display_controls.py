@@ -3,7 +3,12 @@ from unittest.mock import patch
 import numpy as np
 
 from app.utils.image_processing import create_spectrogram_figure, summarize_spectrogram_display_ranges
-from app.utils.image_utils import build_item_image_request_src, decode_item_image_request, get_item_image_src
+from app.utils.image_utils import (
+    build_item_image_request_src,
+    decode_item_image_request,
+    get_item_image_src,
+    get_item_image_srcs,
+)
 from app.layouts.display_controls import create_display_range_bar
 
 
@@ -114,6 +119,37 @@ def test_get_item_image_src_uses_dynamic_render_when_contrast_changes_even_if_im
     assert result == "data:image/png;base64,dynamic"
 
 
+def test_get_item_image_srcs_renders_a_page_in_item_order():
+    items = [{"item_id": f"item-{idx}", "spectrogram_path": f"/tmp/{idx}.mat"} for idx in range(6)]
+
+    def fake_render(item, cfg, **_kwargs):
+        return f"data:image/png;base64,{item['item_id']}"
+
+    with patch("app.utils.image_utils.generate_item_image_cached", side_effect=fake_render):
+        result = get_item_image_srcs(items, color_min=-72.0, cfg={})
+
+    assert result == [f"data:image/png;base64,item-{idx}" for idx in range(6)]
+
+
+def test_create_spectrogram_figure_max_pools_oversized_heatmaps():
+    n_cols = 5001
+    psd = np.full((4, n_cols), -80.0, dtype=np.float32)
+    psd[2, 3] = -5.0
+    spectrogram = {
+        "psd": psd,
+        "freq": np.array([10.0, 20.0, 30.0, 40.0]),
+        "time": np.arange(n_cols, dtype=float),
+    }
+
+    fig = create_spectrogram_figure(spectrogram, "default", transport_mode="float64")
+    heatmap = fig.data[0]
+
+    assert heatmap.z.shape == (4, 2501)
+    assert heatmap.z[2, 1] == -5.0
+    np.testing.assert_allclose(heatmap.x[:2], [0.5, 2.5])
+    assert heatmap.x[-1] == n_cols - 1
+
+
 def test_summarize_spectrogram_display_ranges_reports_frequency_and_color_bounds():
     summary = summarize_spectrogram_display_ranges(
         {
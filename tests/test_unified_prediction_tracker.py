@@ -0,0 +1,103 @@
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+from shared.unified_prediction_tracker import UnifiedPredictionTracker
+
+
+def _tracker(tmp_path, item_ids):
+    tracker = UnifiedPredictionTracker(tmp_path / "predictions.json")
+    for item_id in item_ids:
+        tracker.add_item(
+            item_id=item_id,
+            model_outputs=[{"class_hierarchy": "Biophony > Fin whale", "score": 0.5}],
+        )
+    return tracker
+
+
+def test_add_verification_targets_first_matching_item(tmp_path):
+    tracker = _tracker(tmp_path, ["a", "b", "a"])
+
+    assert tracker.add_verification("a", ["Fin whale"], verified_by="tester")
+    assert tracker.add_verification("b", ["Fin whale"], verified_by="tester")
+    assert not tracker.add_verification("missing", ["Fin whale"], verified_by="tester")
+
+    rounds = [len(item["verifications"]) for item in tracker.data["items"]]
+    assert rounds == [1, 1, 0]
+
+
+def test_add_verification_follows_items_changed_outside_the_tracker(tmp_path):
+    tracker = _tracker(tmp_path, ["a", "b"])
+    assert tracker.add_verification("b", ["Fin whale"], verified_by="tester")
+
+    # Direct edits to the public data, and save() rebuilding every item.
+    tracker.data["items"].insert(0, {"item_id": "c", "model_outputs": [], "verifications": []})
+    tracker.save()
+    assert tracker.add_verification("b", ["Fin whale"], verified_by="tester")
+    assert tracker.add_verification("c", ["Fin whale"], verified_by="tester")
+
+    reloaded = UnifiedPredictionTracker.from_file(tmp_path / "predictions.json")
+    assert reloaded.add_verification("a", ["Fin whale"], verified_by="tester")
+
+    by_id = {item["item_id"]: item for item in tracker.data["items"]}
+    assert [v["verification_round"] for v in by_id["b"]["verifications"]] == [1, 2]
+    assert len(by_id["c"]["verifications"]) == 1
+
+
+def test_loaded_items_share_repeated_strings(tmp_path):
+    path = tmp_path / "predictions.json"
+    path.write_text(
+        '{"schema_version": "2.1", "items": ['
+        '{"item_id": "a", "data_source_id": "DS", "model_outputs": [{"class_hierarchy": "Biophony > Fin whale", "score": 0.9}]},'
+        '{"item_id": "b", "data_source_id": "DS", "model_outputs": [{"class_hierarchy": "Biophony > Fin whale", "score": 0.1}]}'
+        "]}"
+    )
+
+    first, second = UnifiedPredictionTracker.from_file(path).data["items"]
+
+    assert first["data_source_id"] is second["data_source_id"]
+    assert first["model_outputs"][0]["class_hierarchy"] is second["model_outputs"][0]["class_hierarchy"]
+
+
+def test_save_replaces_file_and_keeps_permissions(tmp_path):
+    path = tmp_path / "predictions.json"
+    path.write_text("{}")
+    path.chmod(0o640)
+    tracker = _tracker(tmp_path, ["a"])
+
+    tracker.save()
+
+    assert (path.stat().st_mode & 0o777) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["predictions.json"]
+    assert UnifiedPredictionTracker.from_file(path).data["items"][0]["item_id"] == "a"
+
+
+def test_save_round_trips_non_finite_scores(tmp_path):
+    path = tmp_path / "predictions.json"
+    tracker = UnifiedPredictionTracker(path)
+    tracker.add_item(
+        item_id="a",
+        model_outputs=[{"class_hierarchy": "Biophony > Fin whale", "score": float("nan")}],
+    )
+
+    tracker.save()
+
+    score = UnifiedPredictionTracker.from_file(path).data["items"][0]["model_outputs"][0]["score"]
+    assert math.isnan(score)
+
+
+def test_tracker_imports_without_the_app_package():
+    # External pipelines vendor shared/ on its own, without the Dash app.
+    code = (
+        "import sys; import shared.unified_prediction_tracker; "
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('app', 'filelock')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"